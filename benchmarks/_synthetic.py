@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ベンチマーク用の合成データ
+
+extract_file() の戻り値と同じ形（基本情報, 様式ごとのデータブロック）の抽出結果や
+統合ファイルのシートを、xlsx を介さずにメモリ上で生成する。
+"""
+
+import random
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from consolidate_webpro_full import SHEET_CONFIG  # noqa: E402
+from webpro_synthetic import DEFAULT_ROWS_PER_ENTITY  # noqa: E402
+
+# 数値として生成する列名の部分文字列
+NUMERIC_HINTS = (
+    'area', 'height', 'capacity', 'power', 'count', 'flow', 'value',
+    'temp', 'eff', 'ratio', 'coef', 'thickness', 'conductivity', 'width', 'depth',
+)
+
+
+def make_basic_info(idx: int) -> Dict[str, Any]:
+    return {
+        'evaluation_target': '新築',
+        'building_name': f'合成ビル{idx:05d}',
+        'prefecture': '東京都',
+        'city': '千代田区',
+        'region': 6,
+        'structure': 'RC造',
+        'floors_above': 5 + idx % 20,
+        'floors_below': idx % 3,
+    }
+
+
+def make_blocks(
+    rng: random.Random,
+    rows_per_entity: Dict[str, int],
+    fill_ratio: float = 0.8
+) -> Dict[str, pd.DataFrame]:
+    blocks = {}
+    for entity_type, config in SHEET_CONFIG.items():
+        n_rows = rows_per_entity.get(entity_type, 0)
+        if n_rows == 0:
+            continue
+        data = {}
+        for col_name in config['columns']:
+            numeric = any(hint in col_name for hint in NUMERIC_HINTS)
+            data[col_name] = [
+                None if rng.random() > fill_ratio
+                else round(rng.random() * 100, 2) if numeric
+                else f'{col_name}_{row % 50}'
+                for row in range(n_rows)
+            ]
+        blocks[entity_type] = pd.DataFrame(data, columns=config['columns'], dtype=object)
+    return blocks
+
+
+def make_extraction_results(
+    n_buildings: int,
+    rows_per_entity: Dict[str, int] = None,
+    seed: int = 0
+) -> List[Tuple[Dict[str, Any], Dict[str, pd.DataFrame]]]:
+    """n_buildings 件分の (基本情報, データブロック)"""
+    rng = random.Random(seed)
+    rows_per_entity = rows_per_entity or DEFAULT_ROWS_PER_ENTITY
+    return [
+        (make_basic_info(idx), make_blocks(rng, rows_per_entity))
+        for idx in range(n_buildings)
+    ]
+
+
+def make_room_sheet(n_buildings: int, rows_per_building: int, seed: int = 0) -> pd.DataFrame:
+    """統合ファイルと同じく建物順に並んだ室仕様シート"""
+    rng = np.random.default_rng(seed)
+    n_rows = n_buildings * rows_per_building
+    file_ids = np.repeat([f'B{idx:010x}' for idx in range(n_buildings)], rows_per_building)
+    room_types = rng.choice(['事務室', '会議室', '廊下', '便所', '湯沸室', '更衣室'], n_rows).astype(object)
+    areas = np.round(rng.random(n_rows) * 300, 1).astype(object)
+    # 未入力のセル
+    room_types[rng.random(n_rows) < 0.02] = None
+    areas[rng.random(n_rows) < 0.05] = None
+    return pd.DataFrame({
+        'file_id': file_ids,
+        'building_name': np.repeat([f'合成ビル{idx:05d}' for idx in range(n_buildings)], rows_per_building),
+        '室名': [f'室{i % rows_per_building}' for i in range(n_rows)],
+        '室用途_小分類': room_types,
+        '室面積': areas,
+    })
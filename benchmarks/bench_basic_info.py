@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+extract_basic_info ベンチマーク（様式0の基本情報、1ファイルあたり）
+
+旧実装（シート全体を DataFrame にして全行のラベルを文字列比較）と、
+項目 → 行位置のインデックス（webpro_basic_info.py）で直接読む extract_basic_info を比較し、
+抽出結果が一致することも確認する。時間はワークブックを開いた後の基本情報の抽出のみ。
+
+使用方法:
+    python benchmarks/bench_basic_info.py [--files 20] [--repeat 5]
+    python benchmarks/bench_basic_info.py --input_dir ./input_files
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from consolidate_webpro_full import BASIC_INFO_INDEX, extract_basic_info  # noqa: E402
+from webpro_synthetic import write_webpro_workbook  # noqa: E402
+from webpro_workbook import WorkbookSession  # noqa: E402
+
+
+def extract_basic_info_scan(wb):
+    """旧実装（比較用）: シート全体の全行のラベルを判定"""
+    try:
+        df = wb.get_sheet('0) 基本情報')
+    except Exception:
+        return {}
+
+    basic_info = {}
+
+    def get_val(row, col):
+        if row < df.shape[0] and col < df.shape[1]:
+            val = df.iloc[row, col]
+            if pd.notna(val) and str(val).strip() != '':
+                return val
+        return None
+
+    def int_or_raw(val):
+        if val is None:
+            return ''
+        try:
+            return int(float(val))
+        except (TypeError, ValueError, OverflowError):
+            return val
+
+    for row_idx in range(df.shape[0]):
+        label = str(df.iloc[row_idx, 1]) if 1 < df.shape[1] and pd.notna(df.iloc[row_idx, 1]) else ''
+        if '評価対象' in label:
+            basic_info['evaluation_target'] = get_val(row_idx, 2) or ''
+        elif '建物の名称' in label:
+            basic_info['building_name'] = get_val(row_idx, 2) or ''
+        elif '建築物所在地' in label or '所在地' in label:
+            basic_info['prefecture'] = get_val(row_idx, 3) or ''
+            basic_info['city'] = get_val(row_idx, 5) or get_val(row_idx, 4) or ''
+        elif '地域の区分' in label or '地域区分' in label:
+            basic_info['region'] = int_or_raw(get_val(row_idx, 2))
+        elif '構造' in label and '外壁' not in label:
+            basic_info['structure'] = get_val(row_idx, 2) or ''
+        elif '階数' in label:
+            basic_info['floors_above'] = int_or_raw(get_val(row_idx, 3))
+            basic_info['floors_below'] = int_or_raw(get_val(row_idx, 5) or get_val(row_idx, 4))
+    return basic_info
+
+
+def bench(func, files, repeat: int) -> float:
+    """ワークブックを開いた後の func(wb) の時間（ms/file）"""
+    elapsed = 0.0
+    for _ in range(repeat):
+        for path in files:
+            with WorkbookSession(path) as wb:
+                wb.read_rows('0) 基本情報', max_row=1)  # 共有文字列テーブルの読み込みは計測に含めない
+                start = time.perf_counter()
+                func(wb)
+                elapsed += time.perf_counter() - start
+    return elapsed / (repeat * len(files)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='extract_basic_info ベンチマーク')
+    parser.add_argument('--input_dir', type=Path, help='WEBPROファイルのディレクトリ（省略時は生成）')
+    parser.add_argument('--files', type=int, default=20, help='生成するファイル数')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.input_dir:
+            files = sorted(args.input_dir.glob('*.xlsx'))
+        else:
+            files = [
+                write_webpro_workbook(Path(tmp) / f'webpro_{i:03d}.xlsx', seed=i)
+                for i in range(args.files)
+            ]
+
+        # 抽出結果の一致を確認
+        for path in files:
+            with WorkbookSession(path) as wb:
+                expected = extract_basic_info_scan(wb)
+            with WorkbookSession(path) as wb:
+                actual = extract_basic_info(wb)
+            assert expected == actual, path
+
+        t_scan = bench(extract_basic_info_scan, files, args.repeat)
+        t_index = bench(extract_basic_info, files, args.repeat)
+
+    print(f"files: {len(files)}")
+    print(f"{'implementation':<24}{'ms/file':>10}")
+    print(f"{'full-sheet scan':<24}{t_scan:>10.3f}")
+    print(f"{'label index':<24}{t_index:>10.3f}")
+    print(f"speedup: {t_scan / t_index:.1f}x")
+    print(f"label index: {BASIC_INFO_INDEX.cache_info()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+export_to_csv ベンチマーク
+
+旧実装（load_all_sheets で全シートを DataFrame に読み込んでから to_csv）と、
+行を読みながら書き出す export_to_csv（シート並列・gzip）を比較する。
+室仕様と同じ形のシートを複数持つ統合 xlsx を一時ディレクトリに生成して使う。
+--memory を付けると tracemalloc でピークメモリも計測する（時間とは別に実行。
+計測対象は現在のプロセスのみのため、並列実行の行は時間のみ）。
+
+使用方法:
+    python benchmarks/bench_export_csv.py [--sheets 4] [--buildings 1000] [--rows 40] [--workers 4] [--memory]
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _synthetic import make_room_sheet  # noqa: E402
+from read_webpro_data import export_to_csv, load_all_sheets  # noqa: E402
+
+
+def export_to_csv_legacy(file_path: str, output_dir: str):
+    """旧実装（比較用）"""
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    for name, df in load_all_sheets(file_path).items():
+        df.to_csv(output_path / f"{name}.csv", index=False, encoding='utf-8-sig')
+
+
+def measure_time(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def measure_peak(func) -> float:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='export_to_csv ベンチマーク')
+    parser.add_argument('--sheets', type=int, default=4)
+    parser.add_argument('--buildings', type=int, default=1000)
+    parser.add_argument('--rows', type=int, default=40, help='1建物あたりの行数')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--memory', action='store_true', help='ピークメモリも計測（時間がかかる）')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        src = tmp / 'combined.xlsx'
+        with pd.ExcelWriter(src, engine='openpyxl') as writer:
+            for i in range(args.sheets):
+                make_room_sheet(args.buildings, args.rows, seed=i).to_excel(
+                    writer, sheet_name=f"{i:02d}_sheet", index=False)
+        n_rows = args.buildings * args.rows
+        print(f"sheets: {args.sheets}  rows/sheet: {n_rows:,}  xlsx: {src.stat().st_size / 1e6:.1f} MB")
+
+        cases = [
+            ('legacy (read_excel + to_csv)', lambda: export_to_csv_legacy(str(src), tmp / 'legacy'), True),
+            ('stream', lambda: export_to_csv(str(src), tmp / 'stream'), True),
+            ('stream gzip', lambda: export_to_csv(str(src), tmp / 'gzip', compression='gzip'), True),
+            (f'stream workers={args.workers}',
+             lambda: export_to_csv(str(src), tmp / 'par', workers=args.workers), False),
+            (f'stream gzip workers={args.workers}',
+             lambda: export_to_csv(str(src), tmp / 'pargz', workers=args.workers, compression='gzip'), False),
+        ]
+        results = []
+        for label, func, serial in cases:
+            peak = measure_peak(func) if args.memory and serial else None
+            results.append((label, measure_time(func), peak))
+
+        # 内容の一致を確認
+        for i in range(args.sheets):
+            name = f"{i:02d}_sheet"
+            legacy = pd.read_csv(tmp / 'legacy' / f"{name}.csv", encoding='utf-8-sig')
+            for sub, suffix in (('stream', '.csv'), ('pargz', '.csv.gz')):
+                assert legacy.equals(pd.read_csv(tmp / sub / f"{name}{suffix}", encoding='utf-8-sig')), (sub, name)
+
+    print(f"{'case':<34}{'time[s]':>9}{'peak[MB]':>10}")
+    for label, elapsed, peak in results:
+        peak_text = f"{peak:.1f}" if peak is not None else '-'
+        print(f"{label:<34}{elapsed:>9.2f}{peak_text:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+extract_sheet_data マイクロベンチマーク
+
+旧実装（セルごとの df.iloc ループ）と一括抽出（対象範囲の切り出し + build_sheet_block）を
+シート単位で比較し、出力が一致することも確認する。
+ファイルからの読み込み（レイアウト判定を含む）は bench_xlsx_reader.py で計測する。
+
+使用方法:
+    python benchmarks/bench_extract_sheet_data.py [--repeat 20]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from consolidate_webpro_full import SHEET_CONFIG, build_sheet_block  # noqa: E402
+
+
+# 実シートの使用範囲（webpro_integration_plan.md の行数・列数）
+SHEET_SHAPES = {
+    'room': (9 + 40, 14),
+    'zone': (217, 15),
+    'wall': (1000, 14),
+    'window': (166, 11),
+    'heatsource': (101, 26),
+    'lighting': (9 + 200, 18),
+}
+
+
+def extract_sheet_data_loop(df, entity_type, config):
+    """旧実装（比較用）"""
+    records = []
+    data_start_row = config['data_start_row']
+    col_mapping = config['col_mapping']
+
+    for row_idx in range(data_start_row, df.shape[0]):
+        row_data = {}
+        has_data = False
+
+        for col_idx, col_name in col_mapping.items():
+            if col_idx < df.shape[1]:
+                val = df.iloc[row_idx, col_idx]
+                if pd.notna(val) and str(val).strip() != '':
+                    row_data[col_name] = val
+                    has_data = True
+                else:
+                    row_data[col_name] = None
+            else:
+                row_data[col_name] = None
+
+        if has_data:
+            row_data['entity_type'] = entity_type
+            records.append(row_data)
+
+    return records
+
+
+def extract_sheet_data_block(df, entity_type, config):
+    """一括抽出: data_start_row 以降の対象列をまとめて切り出してブロックにし、レコード化"""
+    col_mapping = config['col_mapping']
+    present = [col_idx for col_idx in col_mapping if col_idx < df.shape[1]]
+    values = df.iloc[config['data_start_row']:, present].to_numpy(dtype=object)
+    block = build_sheet_block(values, [col_mapping[col_idx] for col_idx in present], config)
+    block['entity_type'] = entity_type
+    return block.to_dict('records')
+
+
+def make_sheet(n_rows: int, n_cols: int, seed: int = 0) -> pd.DataFrame:
+    """数値・文字列・空白が混在するシートを生成"""
+    rng = np.random.default_rng(seed)
+    data = np.empty((n_rows, n_cols), dtype=object)
+    for col in range(n_cols):
+        if col % 3 == 0:
+            values = [f'項目{i}' for i in range(n_rows)]
+        else:
+            values = list(np.round(rng.random(n_rows) * 100, 2))
+        data[:, col] = values
+    blank = rng.random((n_rows, n_cols)) < 0.3
+    data[blank] = np.nan
+    data[rng.random((n_rows, n_cols)) < 0.05] = '  '
+    data[:9, :] = np.nan
+    return pd.DataFrame(data)
+
+
+def bench(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='extract_sheet_data ベンチマーク')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'entity_type':<12} {'rows':>6} {'loop[ms]':>10} {'block[ms]':>10} {'speedup':>8}")
+    for entity_type, (n_rows, n_cols) in SHEET_SHAPES.items():
+        config = SHEET_CONFIG[entity_type]
+        df = make_sheet(n_rows, n_cols)
+
+        expected = extract_sheet_data_loop(df, entity_type, config)
+        actual = extract_sheet_data_block(df, entity_type, config)
+        assert pd.DataFrame(expected).equals(pd.DataFrame(actual)), entity_type
+
+        t_loop = bench(lambda: extract_sheet_data_loop(df, entity_type, config), args.repeat)
+        t_block = bench(lambda: extract_sheet_data_block(df, entity_type, config), args.repeat)
+        print(f"{entity_type:<12} {n_rows:>6} {t_loop:>10.2f} {t_block:>10.2f} {t_loop / t_block:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WebproData.get_building ベンチマーク
+
+file_id 列全体の比較（旧実装）と、シート読み込み時に作る file_id 索引による
+取得を、建物数 1,000 / 10,000 のシートで比較する（xlsx の読み込みは含まない）。
+
+使用方法:
+    python benchmarks/bench_get_building.py [--buildings 1000 10000] [--rows 40] [--lookups 2000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _synthetic import make_room_sheet  # noqa: E402
+from read_webpro_data import WebproData  # noqa: E402
+
+SHEET_NAME = '01_室仕様'
+
+
+class _InMemoryWebproData(WebproData):
+    """xlsx の代わりに生成したシートを返す WebproData"""
+
+    def __init__(self, sheet: pd.DataFrame):
+        super().__init__('<memory>', sheet_cache=False)
+        self._sheet = sheet
+
+    def _read_excel_sheet(self, sheet_name):
+        return self._sheet
+
+
+def bench_lookups(func, file_ids) -> float:
+    start = time.perf_counter()
+    for file_id in file_ids:
+        func(file_id)
+    return (time.perf_counter() - start) / len(file_ids) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='get_building ベンチマーク')
+    parser.add_argument('--buildings', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--rows', type=int, default=40, help='1建物あたりの行数')
+    parser.add_argument('--lookups', type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'buildings':>10} {'rows':>9} {'index[ms]':>10} {'scan[us]':>10} {'indexed[us]':>12} {'speedup':>8}")
+    for n_buildings in args.buildings:
+        sheet = make_room_sheet(n_buildings, args.rows)
+        data = _InMemoryWebproData(sheet)
+        file_ids = random.Random(0).choices(sheet['file_id'].unique().tolist(), k=args.lookups)
+
+        start = time.perf_counter()
+        data.get_sheet(SHEET_NAME)
+        t_index = (time.perf_counter() - start) * 1000
+
+        def scan(file_id):
+            return sheet[sheet['file_id'] == file_id]
+
+        for file_id in file_ids[:20]:
+            assert scan(file_id).equals(data.get_building(file_id, SHEET_NAME))
+
+        t_scan = bench_lookups(scan, file_ids[:max(1, args.lookups // 10)])
+        t_indexed = bench_lookups(lambda file_id: data.get_building(file_id, SHEET_NAME), file_ids)
+        print(f"{n_buildings:>10,} {len(sheet):>9,} {t_index:>10.1f} {t_scan:>10.1f} {t_indexed:>12.1f} "
+              f"{t_scan / t_indexed:>7.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+出力レイアウト別のメモリ使用量ベンチマーク
+
+抽出結果から DataFrame を作るまでのピークメモリ（tracemalloc）と
+作成後の DataFrame のメモリ量（memory_usage(deep=True)）を比較する。
+
+    wide/record  全レコードに建物属性をコピーしてから295列の DataFrame を作成（旧実装）
+    wide         正規化テーブルから295列を作成（建物属性は categorical で展開）
+    norm/dict    シートのブロックを行ごとの dict に変換してから entity_type別テーブルを作成（旧実装）
+    normalized   buildings + entity_type別テーブル（列指向の ColumnAccumulator で作成）
+
+使用方法:
+    python benchmarks/bench_layout_memory.py [--buildings 1000]
+"""
+
+import argparse
+import copy
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _synthetic import make_extraction_results  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from consolidate_webpro_full import (  # noqa: E402
+    ALL_COLUMNS, BUILDING_COLUMNS, SHEET_CONFIG, attach_common_fields, blocks_to_records,
+    build_normalized_tables, count_block_rows, normalized_to_wide,
+)
+
+MB = 1024 * 1024
+
+
+def build_wide_per_record(results):
+    """旧実装（比較用）: 行ごとの dict に建物属性をコピー"""
+    all_records = []
+    for idx, (basic_info, blocks) in enumerate(results, start=1):
+        all_records.extend(attach_common_fields(blocks_to_records(blocks), basic_info, f"{idx:05d}"))
+    df = pd.DataFrame(all_records)
+    for col in ALL_COLUMNS:
+        if col not in df.columns:
+            df[col] = None
+    return {'all_data': df[ALL_COLUMNS]}
+
+
+def build_normalized_from_dicts(results):
+    """旧実装（比較用）: 行ごとの dict（旧 extract_sheet_data の戻り値）を entity_type 別に集めて DataFrame を作成"""
+    results = [(basic_info, blocks_to_records(blocks)) for basic_info, blocks in results]
+    buildings = pd.DataFrame(
+        [
+            {'file_id': f"{idx:05d}", **{col: basic_info.get(col, '') for col in BUILDING_COLUMNS[1:]}}
+            for idx, (basic_info, _) in enumerate(results, start=1)
+        ],
+        columns=BUILDING_COLUMNS
+    )
+    tables = {'buildings': buildings}
+    entity_rows = {entity_type: [] for entity_type in SHEET_CONFIG}
+    for idx, (_, records) in enumerate(results, start=1):
+        for record in records:
+            entity_rows[record['entity_type']].append({'file_id': f"{idx:05d}", **record})
+    for entity_type, config in SHEET_CONFIG.items():
+        tables[entity_type] = pd.DataFrame(entity_rows[entity_type], columns=['file_id'] + config['columns'])
+    return tables
+
+
+def build_normalized(results):
+    return build_normalized_tables([
+        (f"{idx:05d}", basic_info, records)
+        for idx, (basic_info, records) in enumerate(results, start=1)
+    ])
+
+
+def build_wide(results):
+    return {'all_data': normalized_to_wide(build_normalized(results))}
+
+
+def measure(name, build, results):
+    # 入力（抽出結果）の確保は計測に含めない
+    results = copy.deepcopy(results)
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    tables = build(results)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    frame_bytes = sum(int(t.memory_usage(deep=True).sum()) for t in tables.values())
+    # 建物属性（file_id 以外の BUILDING_COLUMNS）が占めるメモリ
+    building_bytes = sum(
+        int(t[[c for c in BUILDING_COLUMNS[1:] if c in t.columns]].memory_usage(deep=True, index=False).sum())
+        for t in tables.values()
+    )
+    n_cells = sum(t.size for t in tables.values())
+    print(f"{name:<12} {elapsed:>8.2f} {peak / MB:>10.1f} {frame_bytes / MB:>11.1f} "
+          f"{building_bytes / MB:>10.2f} {n_cells:>12,}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='出力レイアウト別メモリベンチマーク')
+    parser.add_argument('--buildings', type=int, default=1000)
+    args = parser.parse_args()
+
+    results = make_extraction_results(args.buildings)
+    n_records = sum(count_block_rows(blocks) for _, blocks in results)
+    print(f"buildings: {args.buildings:,}  records: {n_records:,}")
+    print(f"{'layout':<12} {'time[s]':>8} {'peak[MB]':>10} {'frames[MB]':>11} "
+          f"{'bldg[MB]':>10} {'cells':>12}")
+    measure('wide/record', build_wide_per_record, results)
+    measure('wide', build_wide, results)
+    measure('norm/dict', build_normalized_from_dicts, results)
+    measure('normalized', build_normalized, results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+スケーリングベンチマーク（ファイル数 10 / 100 / 1,000 / 10,000）
+
+合成WEBPRO入力シート（webpro_synthetic.py）を生成し、ファイル数ごとに
+- process_single_file: 1ファイルずつ抽出（共通情報の付与まで）
+- consolidate_files: 統合（出力の書き出しまで）
+の処理速度（files/sec）とピークメモリ（プロセスの最大 RSS）を計測する。
+各計測は新しいプロセスで実行するため、ピークメモリは計測ごとの値になる。
+
+生成したファイルは --data_dir に残し、次回以降は再利用する
+（最大のファイル数だけ生成し、各ファイル数のディレクトリにはハードリンクを作る）。
+
+使用方法:
+    python benchmarks/bench_scaling.py [--sizes 10 100 1000 10000] [--data_dir ./.bench_data]
+        [--format sqlite] [--layout normalized] [--stream] [--workers 1] [--json results.json]
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from webpro_output import OUTPUT_FORMATS  # noqa: E402
+from webpro_synthetic import generate_workbooks  # noqa: E402
+
+
+def peak_rss_mb():
+    """このプロセスの最大 RSS（MB、resource が使えない環境では None）"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux は KB、macOS はバイト
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def prepare_inputs(data_dir: Path, sizes, workers: int) -> dict:
+    """ファイル数 → 入力ディレクトリ（不足分だけ生成）"""
+    pool = data_dir / 'pool'
+    existing = sorted(pool.glob('*.xlsx')) if pool.exists() else []
+    n_max = max(sizes)
+    if len(existing) < n_max:
+        print(f"合成ファイルを生成中: {n_max} ファイル → {pool}")
+        start = time.perf_counter()
+        existing = generate_workbooks(pool, n_max, workers=workers)
+        print(f"  生成: {time.perf_counter() - start:.1f} 秒")
+
+    dirs = {}
+    for n in sizes:
+        target = data_dir / f'n{n}'
+        if len(list(target.glob('*.xlsx'))) != n:
+            shutil.rmtree(target, ignore_errors=True)
+            target.mkdir(parents=True)
+            for src in existing[:n]:
+                try:
+                    os.link(src, target / src.name)
+                except OSError:
+                    shutil.copy2(src, target / src.name)
+        dirs[n] = target
+    return dirs
+
+
+def run_process_single_file(input_dir: str) -> tuple:
+    from consolidate_webpro_full import process_single_file
+
+    files = sorted(Path(input_dir).glob('*.xlsx'))
+    start = time.perf_counter()
+    for i, path in enumerate(files, 1):
+        process_single_file(str(path), f'{i:05d}')
+    return time.perf_counter() - start, peak_rss_mb()
+
+
+def run_consolidate_files(input_dir: str, options: dict) -> tuple:
+    from consolidate_webpro_full import consolidate_files
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = str(Path(tmp) / f"webpro_all_data.{options['output_format']}")
+        start = time.perf_counter()
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            consolidate_files(input_dir=input_dir, output_path=output_path, **options)
+        return time.perf_counter() - start, peak_rss_mb()
+
+
+def run_isolated(func, *args) -> tuple:
+    """新しいプロセスで func(*args) を実行（ピークメモリを計測ごとに分けるため）"""
+    with multiprocessing.get_context('spawn').Pool(1) as pool:
+        return pool.apply(func, args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='スケーリングベンチマーク')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000, 10000])
+    parser.add_argument('--data_dir', type=Path, default=Path('.bench_data'), help='合成ファイルの保存先')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='sqlite')
+    parser.add_argument('--layout', choices=('wide', 'normalized'), default='normalized')
+    parser.add_argument('--stream', action='store_true')
+    parser.add_argument('--workers', type=int, default=1, help='consolidate_files の並列数（0: CPUコア数）')
+    parser.add_argument('--json', type=Path, help='結果を JSON で保存するパス')
+    args = parser.parse_args()
+
+    dirs = prepare_inputs(args.data_dir, args.sizes, args.workers)
+    options = {
+        'output_format': args.format, 'layout': args.layout,
+        'stream': args.stream, 'workers': args.workers,
+    }
+
+    results = []
+    print(f"{'files':>7}  {'case':<20}{'time[s]':>9}{'files/sec':>11}{'peak RSS[MB]':>14}")
+    for n in args.sizes:
+        cases = [
+            ('process_single_file', run_process_single_file, (str(dirs[n]),)),
+            ('consolidate_files', run_consolidate_files, (str(dirs[n]), options)),
+        ]
+        for label, func, func_args in cases:
+            elapsed, peak = run_isolated(func, *func_args)
+            results.append({
+                'files': n, 'case': label, 'seconds': round(elapsed, 3),
+                'files_per_sec': round(n / elapsed, 2), 'peak_rss_mb': peak and round(peak, 1),
+            })
+            peak_text = f"{peak:.1f}" if peak is not None else '-'
+            print(f"{n:>7,}  {label:<20}{elapsed:>9.2f}{n / elapsed:>11.1f}{peak_text:>14}", flush=True)
+
+    if args.json:
+        args.json.write_text(json.dumps({'options': options, 'results': results}, indent=2), encoding='utf-8')
+        print(f"結果: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WebproData.search_rooms ベンチマーク
+
+旧実装（検索ごとに str.contains と pd.to_numeric を全行に適用）と、
+シート読み込み時に作る RoomSearchIndex による検索を比較する
+（xlsx の読み込みは含まない）。結果の一致とシートが変更されないことも確認する。
+
+使用方法:
+    python benchmarks/bench_search_rooms.py [--buildings 1000] [--rows 40] [--repeat 200]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from _synthetic import make_room_sheet  # noqa: E402
+from read_webpro_data import ROOM_SHEET, WebproData  # noqa: E402
+
+QUERIES = [
+    ('事務室', None, None),
+    ('室', 100, None),
+    (None, 50, 80),
+    ('会議', 10, 200),
+    ('該当なし', None, None),
+]
+
+
+def search_rooms_scan(df, room_type=None, min_area=None, max_area=None):
+    """旧実装（比較用、シートは変更しないようにコピーしてから数値化）"""
+    if room_type:
+        df = df[df['室用途_小分類'].str.contains(room_type, regex=False, na=False)]
+    if min_area or max_area is not None:
+        df = df.copy()
+        df['室面積'] = pd.to_numeric(df['室面積'], errors='coerce')
+    if min_area:
+        df = df[df['室面積'] >= min_area]
+    if max_area is not None:
+        df = df[df['室面積'] <= max_area]
+    return df
+
+
+class _InMemoryWebproData(WebproData):
+    """xlsx の代わりに生成したシートを返す WebproData"""
+
+    def __init__(self, sheet: pd.DataFrame):
+        super().__init__('<memory>', sheet_cache=False)
+        self._sheet = sheet
+
+    def _read_excel_sheet(self, sheet_name):
+        return self._sheet
+
+
+def bench(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='search_rooms ベンチマーク')
+    parser.add_argument('--buildings', type=int, default=1000)
+    parser.add_argument('--rows', type=int, default=40, help='1建物あたりの行数')
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    sheet = make_room_sheet(args.buildings, args.rows)
+    original = sheet.copy()
+    data = _InMemoryWebproData(sheet)
+
+    start = time.perf_counter()
+    data.get_sheet(ROOM_SHEET)
+    print(f"rows: {len(sheet):,}  index build: {(time.perf_counter() - start) * 1000:.1f} ms")
+    # lookup: 索引による行位置の検索のみ、indexed: 該当行の DataFrame 作成まで（search_rooms 全体）
+    print(f"{'query':<24} {'hits':>7} {'scan[ms]':>9} {'lookup[ms]':>11} {'indexed[ms]':>12} {'speedup':>8}")
+
+    for query in QUERIES:
+        expected = search_rooms_scan(sheet, *query)
+        actual = data.search_rooms(*query)
+        assert expected.index.equals(actual.index), query
+
+        t_scan = bench(lambda: search_rooms_scan(sheet, *query), max(1, args.repeat // 10))
+        room_index = data._load_sheet(ROOM_SHEET).room_index
+        t_lookup = bench(lambda: room_index.search(*query), args.repeat)
+        t_indexed = bench(lambda: data.search_rooms(*query), args.repeat)
+        print(f"{str(query):<24} {len(actual):>7,} {t_scan:>9.2f} {t_lookup:>11.3f} {t_indexed:>12.3f} "
+              f"{t_scan / t_indexed:>7.0f}x")
+
+    assert sheet.equals(original), 'cached sheet was modified'
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+webpro_service.py の負荷試験
+
+同時に clients 本の接続（keep-alive）から要求を送り、エンドポイントごとのレイテンシ
+（p50 / p90 / p99 / 最大）とスループットを表示する。要求は次の割合で混ぜる:
+    get_building     /buildings/<file_id>/<sheet>           50%
+    building_sheets  /buildings/<file_id>                   15%
+    search_rooms     /rooms?room_type=&min_area=&limit=100  30%
+    all_buildings    /buildings                              5%
+
+サービスは子プロセスで起動する（--url 指定時は起動済みのサービスを計測）。
+--data を省略すると、合成の統合ファイル（SQLite、--buildings 件の 00_基本情報・01_室仕様）を作って計測する。
+
+使用方法:
+    python benchmarks/bench_service_load.py [--buildings 2000] [--clients 8] [--requests 5000]
+    python benchmarks/bench_service_load.py --data ./output/webpro_combined_data.xlsx
+    python benchmarks/bench_service_load.py --url http://127.0.0.1:8765 [--json result.json]
+"""
+
+import argparse
+import http.client
+import json
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+from urllib.parse import quote, urlsplit
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from _synthetic import make_room_sheet  # noqa: E402
+
+ROOM_TYPES = ['事務室', '会議室', '廊下', '便所', '室']
+MIN_AREAS = [None, 20, 50, 100, 200]
+MIX = [('get_building', 50), ('building_sheets', 15), ('search_rooms', 30), ('all_buildings', 5)]
+
+
+def make_sqlite_data(path: Path, n_buildings: int, rows_per_building: int):
+    """合成の統合ファイル（consolidate_webpro.py の SQLite 出力と同じシート名・列名）"""
+    rooms = make_room_sheet(n_buildings, rows_per_building)
+    buildings = rooms.drop_duplicates('file_id')[['file_id', 'building_name']].reset_index(drop=True)
+    buildings['延床面積'] = np.round(np.random.default_rng(0).random(len(buildings)) * 10000, 1)
+    with sqlite3.connect(path) as conn:
+        buildings.to_sql('00_基本情報', conn, index=False)
+        rooms.to_sql('01_室仕様', conn, index=False)
+
+
+def start_service(data: str, extra_args: List[str]) -> Tuple[subprocess.Popen, str]:
+    """サービスを空いているポートで起動し、(プロセス, URL) を返す"""
+    proc = subprocess.Popen(
+        [sys.executable, str(ROOT / 'webpro_service.py'), data, '--port', '0', *extra_args],
+        stdout=subprocess.PIPE, text=True, encoding='utf-8',
+    )
+    for line in proc.stdout:
+        print(f"  [service] {line.rstrip()}")
+        if line.startswith('Serving on '):
+            return proc, line.split()[2].rstrip('/')
+    raise RuntimeError('service exited before listening')
+
+
+def get_json(conn: http.client.HTTPConnection, target: str):
+    conn.request('GET', target)
+    response = conn.getresponse()
+    body = response.read()
+    if response.status != 200:
+        raise RuntimeError(f"{target}: HTTP {response.status} {body[:200]!r}")
+    return json.loads(body)
+
+
+def make_requests(conn: http.client.HTTPConnection, n_requests: int, seed: int = 0) -> List[Tuple[str, str]]:
+    """(種類, 要求) の一覧（建物・シートは /buildings・/sheets から取得）"""
+    buildings = get_json(conn, '/buildings')['rows']
+    file_ids = [str(row['file_id']) for row in buildings]
+    sheets = [name for name in get_json(conn, '/sheets') if name not in ('00_基本情報', 'buildings')]
+    rng = random.Random(seed)
+    kinds = [kind for kind, weight in MIX for _ in range(weight)]
+
+    requests = []
+    for _ in range(n_requests):
+        kind = rng.choice(kinds)
+        if kind == 'get_building':
+            target = f"/buildings/{quote(rng.choice(file_ids))}/{quote(rng.choice(sheets))}"
+        elif kind == 'building_sheets':
+            target = f"/buildings/{quote(rng.choice(file_ids))}"
+        elif kind == 'search_rooms':
+            target = f"/rooms?room_type={quote(rng.choice(ROOM_TYPES))}&limit=100"
+            min_area = rng.choice(MIN_AREAS)
+            if min_area is not None:
+                target += f"&min_area={min_area}"
+        else:
+            target = '/buildings'
+        requests.append((kind, target))
+    return requests
+
+
+def run_clients(host: str, port: int, requests: List[Tuple[str, str]], n_clients: int) -> Tuple[Dict, float, int]:
+    """n_clients 本の接続で要求を分担して送り、(種類 → レイテンシ[ms] の一覧, 経過秒, エラー数)"""
+    latencies = defaultdict(list)
+    errors = [0]
+    lock = threading.Lock()
+    barrier = threading.Barrier(n_clients + 1)
+
+    def client(chunk):
+        conn = http.client.HTTPConnection(host, port)
+        local = defaultdict(list)
+        n_errors = 0
+        barrier.wait()
+        for kind, target in chunk:
+            start = time.perf_counter()
+            conn.request('GET', target)
+            response = conn.getresponse()
+            response.read()
+            local[kind].append((time.perf_counter() - start) * 1000)
+            n_errors += response.status != 200
+        conn.close()
+        with lock:
+            for kind, values in local.items():
+                latencies[kind].extend(values)
+            errors[0] += n_errors
+
+    threads = [threading.Thread(target=client, args=(requests[i::n_clients],)) for i in range(n_clients)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return latencies, time.perf_counter() - start, errors[0]
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    values = np.asarray(values)
+    return {
+        'n': int(len(values)),
+        'p50_ms': float(np.percentile(values, 50)),
+        'p90_ms': float(np.percentile(values, 90)),
+        'p99_ms': float(np.percentile(values, 99)),
+        'max_ms': float(values.max()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='webpro_service.py の負荷試験')
+    parser.add_argument('--url', default=None, help='起動済みのサービスの URL（省略時は子プロセスで起動）')
+    parser.add_argument('--data', default=None, help='統合ファイル（省略時は合成データを作成）')
+    parser.add_argument('--buildings', type=int, default=2000, help='合成データの建物数')
+    parser.add_argument('--rows', type=int, default=40, help='合成データの1建物あたりの室数')
+    parser.add_argument('--clients', type=int, default=8, help='同時接続数')
+    parser.add_argument('--requests', type=int, default=5000, help='計測する要求数')
+    parser.add_argument('--warmup', type=int, default=200, help='計測前に送る要求数')
+    parser.add_argument('--cache_mb', type=int, default=None, help='起動するサービスの応答キャッシュ（MB、0: 無効）')
+    parser.add_argument('--json', default=None, help='結果を保存する JSON のパス')
+    args = parser.parse_args()
+
+    proc = None
+    tmp_dir = None
+    try:
+        url = args.url
+        if url is None:
+            data = args.data
+            if data is None:
+                tmp_dir = tempfile.TemporaryDirectory()
+                data = str(Path(tmp_dir.name) / 'webpro_synthetic.sqlite')
+                print(f"Generating synthetic data: {args.buildings} buildings x {args.rows} rooms...")
+                make_sqlite_data(Path(data), args.buildings, args.rows)
+            extra = [] if args.cache_mb is None else ['--cache_mb', str(args.cache_mb)]
+            proc, url = start_service(data, extra)
+
+        parts = urlsplit(url)
+        conn = http.client.HTTPConnection(parts.hostname, parts.port)
+        requests = make_requests(conn, args.warmup + args.requests)
+        conn.close()
+
+        run_clients(parts.hostname, parts.port, requests[:args.warmup], args.clients)
+        latencies, elapsed, n_errors = run_clients(
+            parts.hostname, parts.port, requests[args.warmup:], args.clients
+        )
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+        if tmp_dir is not None:
+            tmp_dir.cleanup()
+
+    results = {kind: summarize(values) for kind, values in latencies.items()}
+    results['all'] = summarize([value for values in latencies.values() for value in values])
+
+    print(f"\n{args.requests} requests, {args.clients} clients: {args.requests / elapsed:,.0f} req/s, "
+          f"{n_errors} errors")
+    print(f"{'endpoint':<16} {'n':>6} {'p50[ms]':>9} {'p90[ms]':>9} {'p99[ms]':>9} {'max[ms]':>9}")
+    for kind in [kind for kind, _ in MIX if kind in results] + ['all']:
+        r = results[kind]
+        print(f"{kind:<16} {r['n']:>6} {r['p50_ms']:>9.2f} {r['p90_ms']:>9.2f} {r['p99_ms']:>9.2f} {r['max_ms']:>9.2f}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({
+            'clients': args.clients, 'requests': args.requests, 'elapsed_sec': elapsed,
+            'requests_per_sec': args.requests / elapsed, 'errors': n_errors, 'latency': results,
+        }, ensure_ascii=False, indent=1), encoding='utf-8')
+        print(f"\nSaved: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+xlsx 読み込みベンチマーク（1ファイルあたりの解析時間）
+
+旧実装（pd.ExcelFile / openpyxl で各シートの使用範囲全体を解析してから抽出）と、
+軽量 xlsx リーダーで対象列・行範囲だけを読む extract_file を比較し、
+抽出結果が一致することも確認する。
+
+入力を指定しない場合は、合成WEBPRO入力シート（webpro_synthetic.py、建材リスト・
+選択肢リストを含む）を一時ディレクトリに生成する。
+
+使用方法:
+    python benchmarks/bench_xlsx_reader.py [--files 3] [--rows N] [--repeat 3]
+    python benchmarks/bench_xlsx_reader.py --input_dir ./input_files
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from consolidate_webpro_full import (  # noqa: E402
+    SHEET_CONFIG, build_sheet_block, extract_basic_info, extract_file,
+)
+from webpro_synthetic import write_webpro_workbook  # noqa: E402
+
+
+class _ExcelFileSession:
+    """旧実装の WorkbookSession（pd.ExcelFile でシート全体を解析）"""
+
+    def __init__(self, xl: pd.ExcelFile):
+        self._xl = xl
+
+    def get_sheet(self, sheet_name):
+        return self._xl.parse(sheet_name, header=None)
+
+    def read_rows(self, sheet_name, max_col=None, max_row=None):
+        df = self.get_sheet(sheet_name).iloc[:max_row, :max_col].astype(object)
+        return df.where(df.notna(), None).to_numpy().tolist()
+
+
+def extract_sheet_block(df, config):
+    """旧実装（比較用）: シート全体の DataFrame から Rev.2 の data_start_row 以降の対象列を切り出す"""
+    col_mapping = config['col_mapping']
+    present = [col_idx for col_idx in col_mapping if col_idx < df.shape[1]]
+    values = df.iloc[config['data_start_row']:, present].to_numpy(dtype=object)
+    return build_sheet_block(values, [col_mapping[col_idx] for col_idx in present], config)
+
+
+def extract_file_openpyxl(xlsx_path):
+    """旧実装（比較用）: 各シートの使用範囲全体を解析してから抽出"""
+    blocks = {}
+    with pd.ExcelFile(xlsx_path) as xl:
+        basic_info = extract_basic_info(_ExcelFileSession(xl))
+        for entity_type, config in SHEET_CONFIG.items():
+            if config['sheet_name'] not in xl.sheet_names:
+                continue
+            block = extract_sheet_block(xl.parse(config['sheet_name'], header=None), config)
+            if not block.empty:
+                blocks[entity_type] = block
+    return basic_info, blocks
+
+
+def bench(func, files, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for path in files:
+            func(path)
+    return (time.perf_counter() - start) / (repeat * len(files)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='xlsx 読み込みベンチマーク')
+    parser.add_argument('--input_dir', type=Path, help='WEBPROファイルのディレクトリ（省略時は生成）')
+    parser.add_argument('--files', type=int, default=3, help='生成するファイル数')
+    parser.add_argument('--rows', type=int, default=None, help='生成する様式あたりのデータ行数（省略時は様式ごとの既定値）')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.input_dir:
+            files = sorted(args.input_dir.glob('*.xlsx'))
+        else:
+            rows = None if args.rows is None else {entity_type: args.rows for entity_type in SHEET_CONFIG}
+            files = [
+                write_webpro_workbook(Path(tmp) / f'webpro_{i:03d}.xlsx', rows, seed=i)
+                for i in range(args.files)
+            ]
+
+        # 抽出結果の一致を確認
+        for path in files:
+            expected_info, expected = extract_file_openpyxl(path)
+            actual_info, actual = extract_file(path)
+            assert expected_info == actual_info, path
+            assert list(expected) == list(actual), path
+            for entity_type, block in expected.items():
+                pd.testing.assert_frame_equal(block, actual[entity_type], check_dtype=False)
+
+        t_openpyxl = bench(extract_file_openpyxl, files, args.repeat)
+        t_stream = bench(extract_file, files, args.repeat)
+
+    print(f"files: {len(files)}")
+    print(f"{'reader':<24}{'ms/file':>10}")
+    print(f"{'openpyxl (read_excel)':<24}{t_openpyxl:>10.1f}")
+    print(f"{'webpro_xlsx':<24}{t_stream:>10.1f}")
+    print(f"speedup: {t_openpyxl / t_stream:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,62 +4,80 @@ WEBPRO入力シート統合スクリプト（サンプル）
 100個のWEBPRO入力シートを1つのExcelファイルに統合する
 """
 
+import argparse
 import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Tuple
 import re
 
+from webpro_basic_info import LabelField, LabelIndex
+from webpro_cache import file_sha256
+from webpro_ids import disambiguate_file_id, make_file_id
+from webpro_output import write_tables_sqlite
+from webpro_parallel import imap_ordered, resolve_workers
+from webpro_schema import CoercionReport, coerce_frame, dtypes_for_headers
+from webpro_workbook import WorkbookSession
+
 # ============================================
 # 設定
 # ============================================
 
 # 統合対象シートの定義（シート名: 出力シート名）
+# schema: 数値列の型宣言（webpro_schema.py の COLUMN_DTYPES の列グループ）
 SHEET_CONFIG = {
     '0) 基本情報': {'output_name': '00_基本情報', 'type': 'vertical'},
-    '1) 室仕様': {'output_name': '01_室仕様', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 14},
-    '2-1) 空調ゾーン': {'output_name': '02_空調ゾーン', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 12},
-    '2-2) 外壁構成 ': {'output_name': '03_外壁構成', 'type': 'horizontal', 'header_row': 4, 'unit_row': 7, 'data_start': 9, 'data_cols': 9},
-    '2-3) 窓仕様': {'output_name': '04_窓仕様', 'type': 'horizontal', 'header_row': 4, 'unit_row': 7, 'data_start': 9, 'data_cols': 8},
-    '2-4) 外皮 ': {'output_name': '05_外皮', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 10},
-    '2-5) 熱源': {'output_name': '06_熱源', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 24},
-    '2-6) 2次ﾎﾟﾝﾌﾟ': {'output_name': '07_二次ポンプ', 'type': 'horizontal', 'header_row': 4, 'unit_row': 7, 'data_start': 9, 'data_cols': 10},
-    '2-7) 空調機': {'output_name': '08_空調機', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 24},
-    '2-9) 全熱交換器': {'output_name': '09_全熱交換器', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 18},
-    '3-1) 換気室': {'output_name': '10_換気室', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 7},
-    '3-2) 換気送風機': {'output_name': '11_換気送風機', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 6},
-    '3-3) 換気空調機': {'output_name': '12_換気空調機', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 8, 'data_cols': 11},
-    '4) 照明': {'output_name': '13_照明', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 17},
-    '5-1) 給湯室': {'output_name': '14_給湯室', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 8},
-    '5-2) 給湯機器': {'output_name': '15_給湯機器', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 9},
-    '6) 昇降機': {'output_name': '16_昇降機', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 10},
-    '7-1) 太陽光発電': {'output_name': '17_太陽光発電', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 7},
-    '7-3) コージェネレーション設備': {'output_name': '18_コージェネ', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 8, 'data_cols': 16},
-    '8) 非空調外皮': {'output_name': '19_非空調外皮', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 14},
+    '1) 室仕様': {'output_name': '01_室仕様', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 14, 'schema': 'room'},
+    '2-1) 空調ゾーン': {'output_name': '02_空調ゾーン', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 12, 'schema': 'zone'},
+    '2-2) 外壁構成 ': {'output_name': '03_外壁構成', 'type': 'horizontal', 'header_row': 4, 'unit_row': 7, 'data_start': 9, 'data_cols': 9, 'schema': 'wall'},
+    '2-3) 窓仕様': {'output_name': '04_窓仕様', 'type': 'horizontal', 'header_row': 4, 'unit_row': 7, 'data_start': 9, 'data_cols': 8, 'schema': 'window'},
+    '2-4) 外皮 ': {'output_name': '05_外皮', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 10, 'schema': 'envelope'},
+    '2-5) 熱源': {'output_name': '06_熱源', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 24, 'schema': 'heatsource'},
+    '2-6) 2次ﾎﾟﾝﾌﾟ': {'output_name': '07_二次ポンプ', 'type': 'horizontal', 'header_row': 4, 'unit_row': 7, 'data_start': 9, 'data_cols': 10, 'schema': 'pump'},
+    '2-7) 空調機': {'output_name': '08_空調機', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 24, 'schema': 'ahu'},
+    '2-9) 全熱交換器': {'output_name': '09_全熱交換器', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 18, 'schema': 'heat_exchanger'},
+    '3-1) 換気室': {'output_name': '10_換気室', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 7, 'schema': 'vent_room'},
+    '3-2) 換気送風機': {'output_name': '11_換気送風機', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 6, 'schema': 'vent_fan'},
+    '3-3) 換気空調機': {'output_name': '12_換気空調機', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 8, 'data_cols': 11, 'schema': 'vent_ahu'},
+    '4) 照明': {'output_name': '13_照明', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 17, 'schema': 'lighting'},
+    '5-1) 給湯室': {'output_name': '14_給湯室', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 8, 'schema': 'hotwater_room'},
+    '5-2) 給湯機器': {'output_name': '15_給湯機器', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 9, 'schema': 'hotwater_equip'},
+    '6) 昇降機': {'output_name': '16_昇降機', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 10, 'schema': 'elevator'},
+    '7-1) 太陽光発電': {'output_name': '17_太陽光発電', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 7, 'schema': 'pv'},
+    '7-3) コージェネレーション設備': {'output_name': '18_コージェネ', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 8, 'data_cols': 16, 'schema': 'cgs'},
+    '8) 非空調外皮': {'output_name': '19_非空調外皮', 'type': 'horizontal', 'header_row': 5, 'unit_row': 7, 'data_start': 9, 'data_cols': 14, 'schema': 'envelope_non_ac'},
+}
+
+
+# 基本情報の項目（ラベルに含まれる文字列: 出力列名）
+BASIC_INFO_KEYS = {
+    'シート作成月日': 'sheet_date',
+    '入力責任者': 'responsible_person',
+    '評価対象': 'evaluation_target',
+    '建物の名称': 'building_name',
+    '建築物所在地': 'location',
+    '省エネ基準地域区分': 'region_class',
+    '構造': 'structure',
+    '階数': 'floor_count',
 }
 
+# 項目 → 行位置のインデックス（テンプレートごとに1回だけ作成、webpro_basic_info.py 参照）
+BASIC_INFO_INDEX = LabelIndex(
+    [LabelField(eng_key, (key,)) for key, eng_key in BASIC_INFO_KEYS.items()], exclusive=False
+)
+
 
 def extract_basic_info(df: pd.DataFrame, file_id: str) -> pd.DataFrame:
-    """基本情報シート（縦型フォーム）からデータを抽出"""
+    """基本情報シート（縦型フォーム）からデータを抽出（項目の行位置は BASIC_INFO_INDEX から引く）"""
     info = {'file_id': file_id}
     
-    # 行ごとに項目を抽出
-    key_map = {
-        'シート作成月日': 'sheet_date',
-        '入力責任者': 'responsible_person',
-        '評価対象': 'evaluation_target',
-        '建物の名称': 'building_name',
-        '建築物所在地': 'location',
-        '省エネ基準地域区分': 'region_class',
-        '構造': 'structure',
-        '階数': 'floor_count',
-    }
+    rows = df.to_numpy(dtype=object).tolist()
+    field_rows = BASIC_INFO_INDEX.locate(rows)
     
-    for idx, row in df.iterrows():
-        for key, eng_key in key_map.items():
-            if pd.notna(row.iloc[1]) and key in str(row.iloc[1]):
-                # 値は通常C列以降
-                value = row.iloc[2] if len(row) > 2 and pd.notna(row.iloc[2]) else ''
-                info[eng_key] = value
+    # シート上の行順に項目を抽出（値は通常C列以降）
+    found = [(row_idx, eng_key) for eng_key, row_idx in field_rows.items() if row_idx is not None]
+    for row_idx, eng_key in sorted(found, key=lambda item: item[0]):
+        row = rows[row_idx]
+        info[eng_key] = row[2] if len(row) > 2 and pd.notna(row[2]) else ''
     
     return pd.DataFrame([info])
 
@@ -107,72 +125,121 @@ def extract_horizontal_data(
 
 
 def process_single_file(file_path: Path, file_id: str) -> Dict[str, pd.DataFrame]:
-    """1つのファイルから全シートのデータを抽出"""
+    """1つのファイルから全シートのデータを抽出（ワークブックは1回だけ開く）"""
     results = {}
-    xl = pd.ExcelFile(file_path)
-    
-    # まず基本情報から建物名を取得
-    building_name = ''
-    if '0) 基本情報' in xl.sheet_names:
-        df_info = pd.read_excel(file_path, sheet_name='0) 基本情報', header=None)
-        info_df = extract_basic_info(df_info, file_id)
-        results['00_基本情報'] = info_df
-        building_name = info_df.iloc[0].get('building_name', '')
-    
-    # 各シートを処理
-    for sheet_name, config in SHEET_CONFIG.items():
-        if sheet_name == '0) 基本情報':
-            continue  # 既に処理済み
-        
-        if sheet_name not in xl.sheet_names:
-            continue
+    
+    with WorkbookSession(file_path) as wb:
+        # まず基本情報から建物名を取得
+        building_name = ''
+        if wb.has_sheet('0) 基本情報'):
+            df_info = wb.get_sheet('0) 基本情報')
+            info_df = extract_basic_info(df_info, file_id)
+            results['00_基本情報'] = info_df
+            building_name = info_df.iloc[0].get('building_name', '')
         
-        try:
-            df = pd.read_excel(file_path, sheet_name=sheet_name, header=None)
+        # 各シートを処理
+        for sheet_name, config in SHEET_CONFIG.items():
+            if sheet_name == '0) 基本情報':
+                continue  # 既に処理済み
+            
+            if not wb.has_sheet(sheet_name):
+                continue
             
-            if config['type'] == 'horizontal':
-                extracted = extract_horizontal_data(df, file_id, building_name, config)
-                if len(extracted) > 0:
-                    results[config['output_name']] = extracted
-        except Exception as e:
-            print(f"  警告: {sheet_name} の処理中にエラー: {e}")
+            try:
+                # 対象の列（先頭 data_cols 列）だけを読み込む
+                df = wb.get_sheet(sheet_name, max_col=config['data_cols'])
+                
+                if config['type'] == 'horizontal':
+                    extracted = extract_horizontal_data(df, file_id, building_name, config)
+                    if len(extracted) > 0:
+                        results[config['output_name']] = extracted
+            except Exception as e:
+                print(f"  警告: {sheet_name} の処理中にエラー: {e}")
     
     return results
 
 
-def consolidate_files(input_dir: Path, output_path: Path):
-    """複数のWEBPROファイルを統合"""
+def process_and_hash_file(file_path: Path, file_id: str) -> Tuple[str, Dict[str, pd.DataFrame]]:
+    """process_single_file の結果と内容ハッシュ（file_id の採番用、ワーカー内で計算）"""
+    return file_sha256(file_path), process_single_file(file_path, file_id)
+
+
+def consolidate_files(
+    input_dir: Path,
+    output_path: Path,
+    workers: int = 1,
+    id_scheme: str = 'name',
+    output_format: str = 'xlsx',
+    downcast: bool = False
+):
+    """
+    複数のWEBPROファイルを統合（workers > 1 でプロセス並列、結果は入力順）
+
+    file_id は id_scheme（name / content / sequential、webpro_ids.py 参照）で採番
+    数値列は結合後にシートごと・列ごとに1回だけ宣言した型へ変換する（downcast=True で float32 / Int32）。
+    変換できない値は欠損とし、件数をまとめて表示する
+    output_format='sqlite' の場合は出力シートごとのテーブルを持つ SQLite データベースとして出力
+    （file_id・室用途の列にインデックスを作成）
+    """
     
     # 入力ファイルを取得
     input_files = sorted(input_dir.glob('*.xlsx'))
-    print(f"入力ファイル数: {len(input_files)}")
+    workers = resolve_workers(workers)
+    print(f"入力ファイル数: {len(input_files)}（並列数: {workers}）")
     
     # 結果を格納する辞書
     all_data: Dict[str, List[pd.DataFrame]] = {}
     
     # 各ファイルを処理
-    for i, file_path in enumerate(input_files, 1):
-        file_id = f"{i:03d}"  # 001, 002, ...
+    tasks = [(file_path, f"{i:03d}") for i, file_path in enumerate(input_files, 1)]  # 001, 002, ...
+    used_ids = set()
+    
+    for (file_path, seq_id), result, error in imap_ordered(process_and_hash_file, tasks, workers):
+        if error is not None:
+            print(f"処理中: {file_path.name}")
+            print(f"  エラー: {file_path.name} の処理に失敗: {error}")
+            continue
+        
+        # 建物名・ファイル内容（ワーカーで計算したハッシュ）から file_id を確定して付け替え
+        sha256, file_results = result
+        building_name = file_results['00_基本情報'].iloc[0].get('building_name') if '00_基本情報' in file_results else ''
+        file_id = make_file_id(id_scheme, building_name, sha256, seq=int(seq_id))
+        file_id = disambiguate_file_id(file_id, sha256, used_ids)
+        used_ids.add(file_id)
         print(f"処理中: [{file_id}] {file_path.name}")
         
-        try:
-            file_results = process_single_file(file_path, file_id)
-            
-            for sheet_name, df in file_results.items():
-                if sheet_name not in all_data:
-                    all_data[sheet_name] = []
-                all_data[sheet_name].append(df)
-        except Exception as e:
-            print(f"  エラー: {file_path.name} の処理に失敗: {e}")
+        for sheet_name, df in file_results.items():
+            df['file_id'] = file_id
+
+            if sheet_name not in all_data:
+                all_data[sheet_name] = []
+            all_data[sheet_name].append(df)
     
     # データを結合して出力
     print(f"\n統合ファイルを出力中: {output_path}")
     
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-        for sheet_name in sorted(all_data.keys()):
-            combined_df = pd.concat(all_data[sheet_name], ignore_index=True)
-            combined_df.to_excel(writer, sheet_name=sheet_name, index=False)
-            print(f"  {sheet_name}: {len(combined_df)}行")
+    combined = {
+        sheet_name: pd.concat(all_data[sheet_name], ignore_index=True)
+        for sheet_name in sorted(all_data.keys())
+    }
+    
+    # 数値列の型変換（見出しを列グループの型宣言と照合）
+    report = CoercionReport()
+    for config in SHEET_CONFIG.values():
+        sheet_name = config['output_name']
+        if 'schema' in config and sheet_name in combined:
+            df = combined[sheet_name]
+            dtypes = dtypes_for_headers(df.columns, config['schema'])
+            combined[sheet_name] = coerce_frame(df, dtypes, downcast, report, sheet_name)
+    if output_format == 'sqlite':
+        write_tables_sqlite(combined, output_path)
+    else:
+        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+            for sheet_name, combined_df in combined.items():
+                combined_df.to_excel(writer, sheet_name=sheet_name, index=False)
+    for sheet_name, combined_df in combined.items():
+        print(f"  {sheet_name}: {len(combined_df)}行")
+    report.print_summary()
     
     print("\n統合完了！")
 
@@ -181,16 +248,43 @@ def consolidate_files(input_dir: Path, output_path: Path):
 # メイン処理
 # ============================================
 
-if __name__ == '__main__':
+def main():
     # 使用例
-    # python consolidate_webpro.py
-    
-    # パスを設定（実際の使用時は変更）
-    input_directory = Path('./input_files')  # 100個のファイルを配置
-    output_file = Path('./output/webpro_combined_data.xlsx')
+    # python consolidate_webpro.py --input_dir ./input_files --workers 4
+    # python consolidate_webpro.py --format sqlite   # WebproData で索引検索できる SQLite で出力
+    parser = argparse.ArgumentParser(description='WEBPRO入力シート統合スクリプト（サンプル）')
+    parser.add_argument(
+        '--input_dir', '-i',
+        type=Path,
+        default=Path('./input_files'),
+        help='WEBPROファイルが格納されたディレクトリ（デフォルト: ./input_files）'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        type=Path,
+        default=None,
+        help='出力ファイルのパス（デフォルト: ./output/webpro_combined_data.<形式>）'
+    )
+    parser.add_argument(
+        '--format', '-f',
+        choices=['xlsx', 'sqlite'],
+        default='xlsx',
+        help='出力形式（sqlite: シートごとのテーブルに file_id・室用途・室面積のインデックス付き、デフォルト: xlsx）'
+    )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=1,
+        help='並列処理のプロセス数（0: CPUコア数、デフォルト: 1）'
+    )
+    args = parser.parse_args()
+    output_path = args.output or Path(f'./output/webpro_combined_data.{args.format}')
     
     # 出力ディレクトリを作成
-    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # 統合実行
-    consolidate_files(input_directory, output_file)
+    consolidate_files(args.input_dir, output_path, workers=args.workers, output_format=args.format)
+
+
+if __name__ == '__main__':
+    main()
@@ -12,10 +12,32 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 import argparse
-from typing import Dict, List, Any, Optional
+import hashlib
+import json
+import os
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Any, Optional, Iterator, Tuple, Union
 import warnings
 warnings.filterwarnings('ignore')
 
+from webpro_accumulator import ColumnAccumulator
+from webpro_basic_info import LabelField, LabelIndex
+from webpro_cache import ExtractionCache, file_sha256
+from webpro_ids import FILE_ID_SCHEMES, disambiguate_file_id, make_file_id
+from webpro_layout import LayoutResolver, SheetLayout
+from webpro_output import (
+    LAYOUTS, OUTPUT_FORMATS, ParquetStreamWriter, SqliteStreamWriter, XlsxStreamWriter, partition_name,
+    read_parquet_file_ids, read_sqlite_file_ids, require_pyarrow,
+    write_parquet_partitions, write_tables_parquet, write_tables_sqlite, write_tables_xlsx,
+)
+from webpro_parallel import create_pool, imap_ordered, resolve_workers
+from webpro_profile import NULL_FILE_PROFILER, FileProfiler, RunProfiler, profile_phase
+from webpro_rollup import SUMMARY_COLUMNS, SUMMARY_TABLE, building_summary
+from webpro_schema import COLUMN_DTYPES, CoercionReport, coerce_frame
+from webpro_watch import DirectoryWatcher, watch_loop
+from webpro_workbook import WorkbookSession
+
 # =============================================================================
 # 列定義
 # =============================================================================
@@ -34,6 +56,9 @@ COMMON_COLUMNS = [
     'entity_type',          # データ種別
 ]
 
+# 建物テーブルの列（正規化レイアウト: 1建物1行）
+BUILDING_COLUMNS = [col for col in COMMON_COLUMNS if col != 'entity_type']
+
 # 様式1: 室仕様
 ROOM_COLUMNS = [
     'room_floor', 'room_name', 'room_building_type',
@@ -220,7 +245,7 @@ ENVELOPE_NON_AC_COLUMNS = [
     'nac_window_area', 'nac_has_blind', 'nac_note',
 ]
 
-# 全列リスト
+# 全列リスト（xlsx 出力の列順）
 ALL_COLUMNS = (
     COMMON_COLUMNS +
     ROOM_COLUMNS +
@@ -702,12 +727,46 @@ SHEET_CONFIG = {
     },
 }
 
+# 既知のテンプレート改訂（改訂名 → 様式設定、先頭が既定）
+# 別の改訂に対応する場合は SHEET_CONFIG と同じ形式の設定を追加する
+TEMPLATE_REVISIONS = {
+    'Rev.2': SHEET_CONFIG,
+}
+
+# 見出しの指紋 → レイアウトのキャッシュ（プロセスごと、webpro_layout.py 参照）
+LAYOUT_RESOLVER = LayoutResolver(TEMPLATE_REVISIONS)
+
 
 # =============================================================================
 # 基本情報抽出（様式0）
 # =============================================================================
 
-def extract_basic_info(xlsx_path: str) -> Dict[str, Any]:
+# 様式0の項目 → 行位置のインデックス（テンプレートごとに1回だけ作成、webpro_basic_info.py 参照）
+# 判定順は従来の行ごとの if / elif と同じ（1つの行は最初に一致した項目だけ）
+BASIC_INFO_SHEET = '0) 基本情報'
+BASIC_INFO_INDEX = LabelIndex([
+    LabelField('evaluation_target', ('評価対象',)),
+    LabelField('building_name', ('建物の名称',)),
+    LabelField('location', ('建築物所在地', '所在地')),
+    LabelField('region', ('地域の区分', '地域区分')),
+    LabelField('structure', ('構造',), exclude=('外壁',)),
+    LabelField('floors', ('階数',)),
+])
+# 値を読む列数（ラベル: Col1、値: Col2〜Col5）
+BASIC_INFO_MAX_COL = 6
+
+
+def _int_or_raw(val: Any) -> Any:
+    """整数に変換できる値は int、できない値はそのまま、空白は ''"""
+    if val is None:
+        return ''
+    try:
+        return int(float(val))
+    except (TypeError, ValueError, OverflowError):
+        return val
+
+
+def extract_basic_info(wb: WorkbookSession) -> Dict[str, Any]:
     """
     様式0から基本情報を抽出
     
@@ -718,9 +777,12 @@ def extract_basic_info(xlsx_path: str) -> Dict[str, Any]:
     - Row12: ⑥省エネ基準地域区分 → Col2に値
     - Row13: ⑦構造 → Col2に値
     - Row14: ⑧階数 → Col3:地上, Col4以降:地下
+
+    項目の行位置は BASIC_INFO_INDEX から直接引き、行のラベルが一致しない場合
+    （別のテンプレート）だけシート全体を走査する。
     """
     try:
-        df = pd.read_excel(xlsx_path, sheet_name='0) 基本情報', header=None)
+        rows, field_rows = BASIC_INFO_INDEX.read(wb, BASIC_INFO_SHEET, BASIC_INFO_MAX_COL)
     except Exception as e:
         print(f"Warning: 基本情報シートの読み込み失敗: {e}")
         return {}
@@ -729,65 +791,41 @@ def extract_basic_info(xlsx_path: str) -> Dict[str, Any]:
     
     def get_val(row, col):
         """安全に値を取得"""
-        try:
-            if row < df.shape[0] and col < df.shape[1]:
-                val = df.iloc[row, col]
-                if pd.notna(val) and str(val).strip() != '':
-                    return val
-        except:
-            pass
+        if row < len(rows) and col < len(rows[row]):
+            val = rows[row][col]
+            if pd.notna(val) and str(val).strip() != '':
+                return val
         return None
     
-    # 行ごとに解析（様式0は縦型フォーム）
-    for row_idx in range(df.shape[0]):
-        label = str(df.iloc[row_idx, 1]) if row_idx < df.shape[0] and 1 < df.shape[1] and pd.notna(df.iloc[row_idx, 1]) else ''
-        
-        if '評価対象' in label:
-            basic_info['evaluation_target'] = get_val(row_idx, 2) or ''
-            
-        elif '建物の名称' in label:
-            basic_info['building_name'] = get_val(row_idx, 2) or ''
-            
-        elif '建築物所在地' in label or '所在地' in label:
-            # 都道府県と市区町村を取得
-            # Col2に「都道府県」ラベル、Col3に値、Col4に「市区町村」ラベル、Col5に値
-            # または Col3に都道府県値、Col4以降に市区町村
-            pref = get_val(row_idx, 3)
-            city = get_val(row_idx, 5) or get_val(row_idx, 4)
-            basic_info['prefecture'] = pref or ''
-            basic_info['city'] = city or ''
-            
-        elif '地域の区分' in label or '地域区分' in label:
-            val = get_val(row_idx, 2)
-            if val is not None:
-                try:
-                    basic_info['region'] = int(float(val))
-                except:
-                    basic_info['region'] = val
-            else:
-                basic_info['region'] = ''
-                
-        elif '構造' in label and '外壁' not in label:
-            basic_info['structure'] = get_val(row_idx, 2) or ''
-            
-        elif '階数' in label:
-            # Col2に「地上」ラベル、Col3に値、Col4に「地下」ラベル、Col5に値
-            floors_above = get_val(row_idx, 3)
-            floors_below = get_val(row_idx, 5) or get_val(row_idx, 4)
-            if floors_above is not None:
-                try:
-                    basic_info['floors_above'] = int(float(floors_above))
-                except:
-                    basic_info['floors_above'] = floors_above
-            else:
-                basic_info['floors_above'] = ''
-            if floors_below is not None:
-                try:
-                    basic_info['floors_below'] = int(float(floors_below))
-                except:
-                    basic_info['floors_below'] = floors_below
-            else:
-                basic_info['floors_below'] = ''
+    row_idx = field_rows['evaluation_target']
+    if row_idx is not None:
+        basic_info['evaluation_target'] = get_val(row_idx, 2) or ''
+    
+    row_idx = field_rows['building_name']
+    if row_idx is not None:
+        basic_info['building_name'] = get_val(row_idx, 2) or ''
+    
+    row_idx = field_rows['location']
+    if row_idx is not None:
+        # 都道府県と市区町村を取得
+        # Col2に「都道府県」ラベル、Col3に値、Col4に「市区町村」ラベル、Col5に値
+        # または Col3に都道府県値、Col4以降に市区町村
+        basic_info['prefecture'] = get_val(row_idx, 3) or ''
+        basic_info['city'] = get_val(row_idx, 5) or get_val(row_idx, 4) or ''
+    
+    row_idx = field_rows['region']
+    if row_idx is not None:
+        basic_info['region'] = _int_or_raw(get_val(row_idx, 2))
+    
+    row_idx = field_rows['structure']
+    if row_idx is not None:
+        basic_info['structure'] = get_val(row_idx, 2) or ''
+    
+    row_idx = field_rows['floors']
+    if row_idx is not None:
+        # Col2に「地上」ラベル、Col3に値、Col4に「地下」ラベル、Col5に値
+        basic_info['floors_above'] = _int_or_raw(get_val(row_idx, 3))
+        basic_info['floors_below'] = _int_or_raw(get_val(row_idx, 5) or get_val(row_idx, 4))
     
     return basic_info
 
@@ -797,135 +835,637 @@ def extract_basic_info(xlsx_path: str) -> Dict[str, Any]:
 # =============================================================================
 
 def extract_sheet_data(
-    xlsx_path: str,
+    wb: WorkbookSession,
     entity_type: str,
-    config: Dict[str, Any]
+    config: Dict[str, Any],
+    typed: bool = False,
+    report: Optional[CoercionReport] = None
 ) -> List[Dict[str, Any]]:
     """
-    指定様式からデータを抽出
+    指定様式からデータを抽出（1行1レコードの dict 形式）
+
+    読み込み範囲は extract_file と同じく見出しからテンプレート改訂を判定して決める
+    （read_resolved_sheet_block）。
+    typed=True の場合は数値列を宣言した型（COLUMN_DTYPES）に変換する（変換できない値は None）。
+    """
+    _, block = read_resolved_sheet_block(wb, entity_type, config)
+    if typed:
+        block = typed_records_frame(coerce_frame(block, COLUMN_DTYPES[entity_type], report=report, table=entity_type))
+    block['entity_type'] = entity_type
+
+    return block.to_dict('records')
+
+
+def typed_records_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """型変換後の DataFrame をレコード化用に object 列へ（欠損は None、値は Python の数値）"""
+    df = df.astype(object)
+    return df.where(df.notna(), None)
+
+
+def read_resolved_sheet_block(
+    wb: WorkbookSession,
+    entity_type: str,
+    config: Dict[str, Any]
+) -> Tuple[Optional[SheetLayout], pd.DataFrame]:
     """
+    見出しからテンプレート改訂のレイアウトを判定し（LAYOUT_RESOLVER）、その範囲のデータを抽出
+
+    レイアウトの判定とデータの読み込みはシートの1回の解析で行う。
+    シートが存在しない場合は (None, 空のDataFrame)
+    """
+    if not wb.has_sheet(config['sheet_name']):
+        return None, pd.DataFrame(columns=config['columns'], dtype=object)
+    
+    resolved = []
+    
+    def resolve(header_rows):
+        layout = LAYOUT_RESOLVER.resolve(entity_type, header_rows, wb.path.name)
+        resolved.append(layout)
+        return layout.data_start_row, list(layout.col_mapping)
+    
     try:
-        df = pd.read_excel(xlsx_path, sheet_name=config['sheet_name'], header=None)
+        values = wb.read_columns_after_header(config['sheet_name'], LAYOUT_RESOLVER.header_rows(entity_type), resolve)
     except Exception as e:
-        # シートが存在しない場合は空リストを返す
-        return []
+        return None, pd.DataFrame(columns=config['columns'], dtype=object)
     
-    records = []
-    data_start_row = config['data_start_row']
-    col_mapping = config['col_mapping']
+    layout = resolved[0]
+    return layout, build_sheet_block(values, list(layout.col_mapping.values()), layout.apply(config))
+
+
+_is_blank_str = np.frompyfunc(lambda v: isinstance(v, str) and v.strip() == '', 1, 1)
+
+
+def build_sheet_block(values: np.ndarray, value_columns: List[str], config: Dict[str, Any]) -> pd.DataFrame:
+    """
+    データ範囲の値（行 × value_columns の2次元配列）から様式のブロックを作る
+
+    - 空白（NaN・空文字・空白のみ）のセルは None
+    - 全対象列が空白の行は除外
+    - values にない列は None で補完し、config['columns'] の列順に揃える
+    """
+    columns = config['columns']
     
-    # データ行を走査
-    for row_idx in range(data_start_row, df.shape[0]):
-        row_data = {}
-        has_data = False
-        
-        for col_idx, col_name in col_mapping.items():
-            if col_idx < df.shape[1]:
-                val = df.iloc[row_idx, col_idx]
-                if pd.notna(val) and str(val).strip() != '':
-                    row_data[col_name] = val
-                    has_data = True
-                else:
-                    row_data[col_name] = None
-            else:
-                row_data[col_name] = None
-        
-        # データがある行のみ追加
-        if has_data:
-            row_data['entity_type'] = entity_type
-            records.append(row_data)
+    # 空白セルのマスク（NaN・空文字・空白のみの文字列）
+    mask = pd.notna(values) & ~_is_blank_str(values).astype(bool)
     
-    return records
+    # データがある行のみ
+    has_data = mask.any(axis=1)
+    values = np.where(mask, values, None)[has_data]
+    
+    block = pd.DataFrame(values, columns=value_columns, dtype=object)
+    for col_name in columns:
+        if col_name not in block.columns:
+            block[col_name] = None
+    
+    return block[columns]
 
 
 # =============================================================================
 # 1ファイル処理
 # =============================================================================
 
-def process_single_file(xlsx_path: str, file_id: str) -> List[Dict[str, Any]]:
+# entity_type → 様式の抽出ブロック（データのある様式のみ、SHEET_CONFIG 順）
+EntityBlocks = Dict[str, pd.DataFrame]
+
+
+def extract_file(xlsx_path: str, profile: Optional[FileProfiler] = None) -> Tuple[Dict[str, Any], EntityBlocks]:
+    """
+    1つのWEBPROファイルから基本情報と全様式のデータブロックを抽出（共通情報の付与前）
+
+    ワークブックは1回だけ開き、解析したシートを各抽出処理で共有する。
+    様式ごとの読み込み範囲は見出しの指紋からテンプレート改訂を判定して決める（LAYOUT_RESOLVER）。
+    データは様式ごとの列指向ブロックのまま返し、行ごとの dict は作らない。
+    profile を渡すと基本情報・様式ごとの時間とメモリ割り当て量を記録する。
+    """
+    blocks = {}
+    profile = profile or NULL_FILE_PROFILER
+
+    with WorkbookSession(xlsx_path) as wb:
+        # 基本情報を抽出
+        with profile.stage('basic_info'):
+            basic_info = extract_basic_info(wb)
+
+        # 各様式からデータを抽出
+        for entity_type, config in SHEET_CONFIG.items():
+            with profile.stage(entity_type, sheet_name=config['sheet_name']) as stage:
+                layout, block = read_resolved_sheet_block(wb, entity_type, config)
+                stage['rows'] = len(block)
+                stage['layout'] = layout.status if layout is not None else 'missing'
+            if not block.empty:
+                blocks[entity_type] = block
+
+    return basic_info, blocks
+
+
+def extract_file_profiled(xlsx_path: str) -> Tuple[Tuple[Dict[str, Any], EntityBlocks], Dict[str, Any]]:
+    """extract_file を計測付きで実行し、(抽出結果, 計測結果) を返す（--profile 用、ワーカーで実行）"""
+    profile = FileProfiler()
+    with profile.total():
+        result = extract_file(xlsx_path, profile)
+    return result, profile.to_dict()
+
+
+def count_block_rows(blocks: EntityBlocks) -> int:
+    """全様式の行数の合計"""
+    return sum(len(block) for block in blocks.values())
+
+
+def blocks_to_records(
+    blocks: EntityBlocks,
+    typed: bool = False,
+    report: Optional[CoercionReport] = None
+) -> List[Dict[str, Any]]:
+    """
+    データブロックを1行1レコードの dict 形式に変換（entity_type 付き）
+
+    typed=True の場合は数値列を宣言した型（COLUMN_DTYPES）に変換する（変換できない値は None）。
+    """
+    records = []
+    for entity_type, block in blocks.items():
+        if typed:
+            block = typed_records_frame(coerce_frame(block, COLUMN_DTYPES[entity_type], report=report, table=entity_type))
+        records.extend(block.assign(entity_type=entity_type).to_dict('records'))
+    return records
+
+
+def attach_common_fields(
+    records: List[Dict[str, Any]],
+    basic_info: Dict[str, Any],
+    file_id: str
+) -> List[Dict[str, Any]]:
+    """
+    各レコードに共通情報（file_id・建物情報）を付与
+    """
+    for record in records:
+        record['file_id'] = file_id
+        record['building_name'] = basic_info.get('building_name', '')
+        record['prefecture'] = basic_info.get('prefecture', '')
+        record['city'] = basic_info.get('city', '')
+        record['region'] = basic_info.get('region', '')
+        record['structure'] = basic_info.get('structure', '')
+        record['floors_above'] = basic_info.get('floors_above', '')
+        record['floors_below'] = basic_info.get('floors_below', '')
+        record['evaluation_target'] = basic_info.get('evaluation_target', '')
+    
+    return records
+
+
+def process_single_file(
+    xlsx_path: str,
+    file_id: str,
+    typed: bool = False,
+    report: Optional[CoercionReport] = None
+) -> List[Dict[str, Any]]:
     """
     1つのWEBPROファイルを処理し、全レコードを返す
+
+    typed=True の場合は数値列を宣言した型に変換する（変換できない値は report に記録）。
     """
-    all_records = []
+    basic_info, blocks = extract_file(xlsx_path)
+    return attach_common_fields(blocks_to_records(blocks, typed, report), basic_info, file_id)
+
+
+# =============================================================================
+# 抽出結果キャッシュ
+# =============================================================================
+
+# 抽出ロジックを変更した場合は上げる（既存キャッシュを無効化）
+EXTRACTION_VERSION = 4
+
+
+def extraction_schema_key() -> str:
+    """抽出ロジック・様式設定（既知の改訂を含む）の識別子（キャッシュの互換性判定用）"""
+    return hashlib.sha256(repr((EXTRACTION_VERSION, TEMPLATE_REVISIONS)).encode('utf-8')).hexdigest()
+
+
+def iter_extracted_files(
+    xlsx_files: List[Path],
+    workers: int = 1,
+    cache: Optional[ExtractionCache] = None,
+    profiler: Optional[RunProfiler] = None,
+    executor: Optional[Executor] = None
+) -> Iterator[Tuple[Path, Optional[Tuple[Dict[str, Any], EntityBlocks]], Optional[BaseException], bool]]:
+    """
+    各ファイルの抽出結果を (パス, 抽出結果, 例外, キャッシュ利用) として入力順に返す
+
+    キャッシュが有効なファイルは読み込みのみ行い、新規・変更ファイルだけを
+    （workers > 1 ならプロセスプールで）抽出する。
+    executor を渡すとそのプール（create_pool()）で抽出する。
+    profiler を渡すとファイルごとの計測結果を記録する。
+    """
+    extract = extract_file if profiler is None else extract_file_profiled
     
-    # 基本情報を抽出
-    basic_info = extract_basic_info(xlsx_path)
+    def extract_one(xlsx_file):
+        try:
+            return extract(str(xlsx_file)), None
+        except Exception as e:
+            return None, e
     
-    # 各様式からデータを抽出
-    for entity_type, config in SHEET_CONFIG.items():
-        records = extract_sheet_data(xlsx_path, entity_type, config)
+    fresh = [cache is not None and cache.check(f) for f in xlsx_files]
+    misses = [(str(f),) for f, hit in zip(xlsx_files, fresh) if not hit]
+    miss_results = imap_ordered(extract, misses, workers, executor)
+    
+    for xlsx_file, hit in zip(xlsx_files, fresh):
+        if hit:
+            try:
+                if profiler is None:
+                    yield xlsx_file, cache.load(xlsx_file), None, True
+                    continue
+                profile = FileProfiler()
+                with profile.total():
+                    result = cache.load(xlsx_file)
+                profiler.add_file(xlsx_file.name, profile.to_dict(), cached=True)
+                yield xlsx_file, result, None, True
+                continue
+            except Exception as e:
+                # 壊れたエントリは再抽出する
+                print(f"Warning: キャッシュ読み込み失敗（再抽出します）: {xlsx_file.name}: {e}")
+                result, error = extract_one(xlsx_file)
+        else:
+            _, result, error = next(miss_results)
         
-        for record in records:
-            # 共通情報を付与
-            record['file_id'] = file_id
-            record['building_name'] = basic_info.get('building_name', '')
-            record['prefecture'] = basic_info.get('prefecture', '')
-            record['city'] = basic_info.get('city', '')
-            record['region'] = basic_info.get('region', '')
-            record['structure'] = basic_info.get('structure', '')
-            record['floors_above'] = basic_info.get('floors_above', '')
-            record['floors_below'] = basic_info.get('floors_below', '')
-            record['evaluation_target'] = basic_info.get('evaluation_target', '')
-            
-            all_records.append(record)
+        if profiler is not None:
+            result, file_profile = result if error is None else (None, None)
+            profiler.add_file(xlsx_file.name, file_profile, error=error)
+        if error is None and cache is not None:
+            cache.store(xlsx_file, result)
+        yield xlsx_file, result, error, False
+
+
+# =============================================================================
+# 出力マニフェスト（追記モード用）
+# =============================================================================
+
+def manifest_path_for(output_path: str) -> Path:
+    """出力ファイルに対応するマニフェストのパス（<出力ファイル名>.manifest.json）"""
+    output_path = Path(output_path)
+    return output_path.with_name(output_path.name + '.manifest.json')
+
+
+def load_manifest(output_path: str, output_format: str = 'xlsx', layout: str = 'wide') -> Dict[str, Any]:
+    """
+    既存出力のマニフェストを読み込み
+
+    マニフェストがない場合は出力の file_id 列から復元する（内容ハッシュなし）
+    """
+    manifest_path = manifest_path_for(output_path)
+    if manifest_path.exists():
+        return json.loads(manifest_path.read_text(encoding='utf-8'))
     
-    return all_records
+    if output_format == 'parquet':
+        file_ids = read_parquet_file_ids(
+            Path(output_path) / 'buildings' if layout == 'normalized' else output_path
+        )
+    elif output_format == 'sqlite':
+        file_ids = read_sqlite_file_ids(output_path, 'buildings' if layout == 'normalized' else 'all_data')
+    else:
+        sheet_name = 'buildings' if layout == 'normalized' else 'all_data'
+        existing = pd.read_excel(output_path, sheet_name=sheet_name, usecols=['file_id'], dtype=str)
+        file_ids = existing['file_id'].dropna().unique()
+    return {
+        'id_scheme': None,
+        'layout': layout,
+        'files': {file_id: {'source': None, 'sha256': None} for file_id in file_ids},
+    }
+
+
+def save_manifest(output_path: str, manifest: Dict[str, Any]):
+    """マニフェストを書き出し（一時ファイル経由で置き換え）"""
+    manifest_path = manifest_path_for(output_path)
+    tmp_path = manifest_path.with_suffix('.tmp')
+    tmp_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=1), encoding='utf-8')
+    os.replace(tmp_path, manifest_path)
 
 
 # =============================================================================
 # 全ファイル統合
 # =============================================================================
 
+def build_normalized_tables(
+    extracted: List[Tuple[str, Dict[str, Any], EntityBlocks]],
+    downcast: bool = False,
+    report: Optional[CoercionReport] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    (file_id, 基本情報, データブロック) の一覧から正規化テーブルを作成
+
+    - buildings: 1建物1行（BUILDING_COLUMNS）
+    - entity_type ごと: file_id + その様式の列だけ（SHEET_CONFIG の定義順）
+      様式ごとの ColumnAccumulator に列単位で蓄積する（行ごとの dict は作らない）
+    - 数値列はテーブルごとに列単位で1回だけ宣言した型（COLUMN_DTYPES）に変換する
+      （downcast=True の場合は float32 / Int32、変換できない値は欠損にして report に記録）
+    """
+    buildings = pd.DataFrame(
+        [
+            {'file_id': file_id, **{col: basic_info.get(col, '') for col in BUILDING_COLUMNS[1:]}}
+            for file_id, basic_info, _ in extracted
+        ],
+        columns=BUILDING_COLUMNS
+    )
+    tables = {'buildings': coerce_frame(buildings, COLUMN_DTYPES['buildings'], downcast, report, 'buildings')}
+    
+    accumulators = {
+        entity_type: ColumnAccumulator(['file_id'] + config['columns'])
+        for entity_type, config in SHEET_CONFIG.items()
+    }
+    for file_id, _, blocks in extracted:
+        for entity_type, block in blocks.items():
+            accumulators[entity_type].append_block(block, file_id=file_id)
+
+    for entity_type, accumulator in accumulators.items():
+        tables[entity_type] = coerce_frame(
+            accumulator.to_frame(), COLUMN_DTYPES[entity_type], downcast, report, entity_type
+        )
+
+    return tables
+
+
+def expand_building_columns(file_ids: pd.Series, buildings: pd.DataFrame) -> Dict[str, pd.Categorical]:
+    """
+    file_id 列に対応する建物属性列（BUILDING_COLUMNS）を展開
+
+    建物属性は buildings テーブルに1建物1回だけ保持し、行ごとの値は
+    categorical（建物ごとの値 + 行ごとの整数コード）として展開する。
+    行数分の文字列オブジェクトは作らない。
+    """
+    positions = pd.Index(buildings['file_id']).get_indexer(file_ids)
+    columns = {}
+    for col in BUILDING_COLUMNS:
+        codes, categories = pd.factorize(buildings[col])
+        row_codes = np.where(positions >= 0, codes[positions], -1)
+        columns[col] = pd.Categorical.from_codes(row_codes, categories=categories)
+    return columns
+
+
+def normalized_to_wide(tables: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    正規化テーブルから295列のワイド形式を作成（出力時の展開）
+
+    - 行順は建物順 → SHEET_CONFIG 順 → シート内の行順
+    - 建物属性列は expand_building_columns() による categorical
+    """
+    buildings = tables['buildings']
+    
+    facts = [
+        tables[entity_type].assign(entity_type=entity_type)
+        for entity_type in SHEET_CONFIG
+        if not tables[entity_type].empty
+    ]
+    if not facts:
+        return pd.DataFrame(columns=ALL_COLUMNS)
+    
+    wide = pd.concat(facts, ignore_index=True)
+    building_pos = pd.Index(buildings['file_id']).get_indexer(wide['file_id'])
+    wide = wide.iloc[np.argsort(building_pos, kind='stable')].reset_index(drop=True)
+    
+    for col, values in expand_building_columns(wide['file_id'], buildings).items():
+        wide[col] = values
+    return wide.reindex(columns=ALL_COLUMNS)
+
+
+def summary_table_name(output_format: str, layout: str) -> str:
+    """
+    建物ごとの集計テーブル（webpro_rollup.py）の出力先のテーブル・シート名
+
+    wide レイアウトの parquet 出力は entity_type=* のパーティションと同じディレクトリに置くため、
+    '_' で始まる名前にする（pyarrow がデータセットの読み込み時に無視する）。
+    """
+    return f"_{SUMMARY_TABLE}" if layout == 'wide' and output_format == 'parquet' else SUMMARY_TABLE
+
+
+def iter_building_results(
+    xlsx_files: List[Path],
+    file_hashes: Dict[Path, str],
+    manifest: Dict[str, Any],
+    append: bool,
+    workers: int = 1,
+    cache: Optional[ExtractionCache] = None,
+    profiler: Optional[RunProfiler] = None,
+    executor: Optional[Executor] = None,
+    input_files: Optional[List[Path]] = None
+) -> Iterator[Tuple[str, Dict[str, Any], EntityBlocks]]:
+    """
+    各ファイルを抽出し、file_id を採番して (file_id, 基本情報, データブロック) を入力順に返す
+
+    採番した file_id はマニフェストに登録する。
+    追記時に既存出力と同じ file_id になった建物、抽出に失敗したファイルは返さない。
+    キャッシュは input_files（入力ディレクトリの全ファイル、省略時は xlsx_files）に合わせて整理する
+    （追記時に xlsx_files から除いた変更のないファイルのエントリも残す）。
+    """
+    id_scheme = manifest['id_scheme']
+    existing_ids = set(manifest['files'])
+    used_ids = set(existing_ids)
+    # キャッシュから読み込んだ数・抽出した数・抽出に失敗した数（追記で除いた建物も含む）
+    n_cached = n_extracted = n_failed = 0
+    
+    extracted = iter_extracted_files(xlsx_files, workers, cache, profiler, executor)
+    for idx, (xlsx_file, result, error, cached) in enumerate(extracted, start=1):
+        print(f"Processing ({idx}/{len(xlsx_files)}) {xlsx_file.name}...")
+        
+        if error is not None:
+            n_failed += 1
+            print(f"  -> Error: {error}")
+            continue
+        if cached:
+            n_cached += 1
+        else:
+            n_extracted += 1
+        
+        basic_info, blocks = result
+        sha256 = file_hashes[xlsx_file]
+        file_id = make_file_id(id_scheme, basic_info.get('building_name'), sha256, seq=len(existing_ids) + idx)
+        if append and file_id in existing_ids:
+            print(f"  -> [{file_id}] already in output, skipped (re-run without --append to refresh)")
+            continue
+        file_id = disambiguate_file_id(file_id, sha256, used_ids)
+        used_ids.add(file_id)
+        manifest['files'][file_id] = {'source': xlsx_file.name, 'sha256': sha256}
+        
+        print(f"  -> [{file_id}] {count_block_rows(blocks)} records {'loaded from cache' if cached else 'extracted'}")
+        yield file_id, basic_info, blocks
+    
+    if cache is not None:
+        cache.prune(input_files if input_files is not None else xlsx_files)
+        cache.save()
+        print(f"Cache: {n_cached} reused, {n_extracted} extracted, {n_failed} failed")
+
+
 def consolidate_files(
     input_dir: str,
     output_path: str,
-    file_pattern: str = '*.xlsx'
-) -> pd.DataFrame:
+    file_pattern: str = '*.xlsx',
+    workers: int = 1,
+    cache_dir: Optional[str] = None,
+    id_scheme: str = 'name',
+    append: bool = False,
+    output_format: str = 'xlsx',
+    layout: str = 'wide',
+    wide_output: Optional[str] = None,
+    stream: bool = False,
+    profile: Optional[str] = None,
+    downcast: bool = False,
+    coercion_report: Optional[str] = None,
+    files: Optional[List[Path]] = None,
+    cache: Optional[ExtractionCache] = None,
+    executor: Optional[Executor] = None,
+    summary: bool = True
+) -> Union[pd.DataFrame, Dict[str, pd.DataFrame], Dict[str, int]]:
     """
     指定ディレクトリ内の全WEBPROファイルを統合
+
+    workers > 1 の場合はプロセスプールで並列処理する（0 は CPU コア数）。
+    結果は入力順に受け取るため、出力はシリアル実行と同一。
+    cache_dir を指定すると、ファイル単位の抽出結果をキャッシュし、
+    新規・変更ファイルだけを再抽出する（削除されたファイルはキャッシュからも除去）。
+    file_id は id_scheme（name / content / sequential、webpro_ids.py 参照）で採番する。
+    append=True の場合は既存出力にない建物だけを抽出して追記する
+    （既存の建物は再処理・再出力しない）。
+    output_format='parquet' の場合は output_path をディレクトリとして、
+    output_format='sqlite' の場合は SQLite データベースとして出力する
+    （webpro_output.py 参照）。
+    layout='wide' の場合は1シート295列、layout='normalized' の場合は
+    buildings テーブル + entity_type ごとのテーブルとして出力し、
+    wide_output を指定するとワイド形式も派生出力（xlsx）する。
+    stream=True の場合は全レコードを保持せず、ファイルごとに抽出結果を
+    出力へ逐次書き出す（メモリ使用量は建物数に依存しない）。
+    profile に JSON のパスを指定すると、ファイル・様式・処理段階ごとの時間と
+    メモリ割り当て量のレポートを書き出す（webpro_profile.py 参照）。
+    数値列は宣言した型（webpro_schema.py の COLUMN_DTYPES）に変換して出力する
+    （downcast=True の場合は float32 / Int32）。変換できない値は欠損として出力し、
+    件数を表示する（coercion_report を指定すると一覧を CSV / JSON に書き出す）。
+    summary=True の場合は建物ごとの集計テーブル（building_summary、webpro_rollup.py 参照）を
+    同じ出力に追加する（xlsx はシート、sqlite はテーブル、parquet はディレクトリ）。
+    files・cache・executor は常駐モード（watch_input_dir）用で、それぞれ
+    input_dir の検索結果・cache_dir のキャッシュ・呼び出しごとのプールの代わりに使う。
+    戻り値は今回出力した分の DataFrame（normalized の場合はテーブル名 → DataFrame、
+    stream の場合はテーブル名 → 書き出し行数）。
     """
     input_path = Path(input_dir)
-    xlsx_files = sorted(input_path.glob(file_pattern))
+    xlsx_files = sorted(files if files is not None else input_path.glob(file_pattern))
     
     if not xlsx_files:
         raise FileNotFoundError(f"No Excel files found in {input_dir}")
+    if id_scheme not in FILE_ID_SCHEMES:
+        raise ValueError(f"Unknown id_scheme: {id_scheme}")
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output_format: {output_format}")
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unknown layout: {layout}")
+    if output_format == 'parquet':
+        require_pyarrow()
+    
+    profiler = RunProfiler() if profile else None
+    run_info = {
+        'input_dir': str(input_dir), 'output_path': str(output_path), 'output_format': output_format,
+        'layout': layout, 'stream': stream, 'append': append, 'workers': workers, 'downcast': downcast,
+    }
+    report = CoercionReport()
+    
+    append = append and Path(output_path).exists()
+    if stream and append and output_format == 'xlsx':
+        raise ValueError("stream mode cannot append to an existing xlsx (use --format parquet or sqlite)")
+    if append:
+        manifest = load_manifest(output_path, output_format, layout)
+        if manifest['id_scheme'] not in (None, id_scheme):
+            raise ValueError(
+                f"id_scheme mismatch: existing output uses '{manifest['id_scheme']}', requested '{id_scheme}'"
+            )
+        if manifest.get('layout', 'wide') != layout:
+            raise ValueError(
+                f"layout mismatch: existing output uses '{manifest.get('layout', 'wide')}', requested '{layout}'"
+            )
+    else:
+        manifest = {'id_scheme': id_scheme, 'layout': layout, 'files': {}}
+    manifest['id_scheme'] = id_scheme
+    manifest['layout'] = layout
+    
+    if cache is None and cache_dir:
+        cache = ExtractionCache(cache_dir, extraction_schema_key())
     
-    print(f"Found {len(xlsx_files)} files to process")
+    # 内容ハッシュ（file_id 採番・追記時の既存判定に使用。キャッシュの索引と一致すれば再計算しない）
+    with profile_phase(profiler, 'hash'):
+        file_hash = cache.file_hash if cache is not None else file_sha256
+        file_hashes = {xlsx_file: file_hash(xlsx_file) for xlsx_file in xlsx_files}
+    input_files = xlsx_files
+    if append:
+        known_hashes = {entry['sha256'] for entry in manifest['files'].values()}
+        n_total = len(xlsx_files)
+        xlsx_files = [f for f in xlsx_files if file_hashes[f] not in known_hashes]
+        print(f"Append mode: {len(manifest['files'])} buildings in {output_path}, "
+              f"{n_total - len(xlsx_files)} input files unchanged")
     
-    all_records = []
+    workers = resolve_workers(workers)
+    print(f"Found {len(xlsx_files)} files to process (workers: {workers})")
     
-    for idx, xlsx_file in enumerate(xlsx_files, start=1):
-        file_id = f"{idx:03d}"
-        print(f"Processing [{file_id}] {xlsx_file.name}...")
+    buildings = iter_building_results(
+        xlsx_files, file_hashes, manifest, append, workers, cache, profiler, executor, input_files
+    )
+    if profiler is not None:
+        buildings = profiler.iter_phase('extract', buildings)
+    
+    if stream:
+        row_counts = write_streaming_output(
+            buildings, output_path, output_format, layout, append, wide_output, profiler, downcast, report,
+            summary
+        )
+        with profile_phase(profiler, 'output_write'):
+            save_manifest(output_path, manifest)
+        write_profile_report(profiler, profile, run_info)
+        write_coercion_report(report, coercion_report)
         
-        try:
-            records = process_single_file(str(xlsx_file), file_id)
-            all_records.extend(records)
-            print(f"  -> {len(records)} records extracted")
-        except Exception as e:
-            print(f"  -> Error: {e}")
+        print(f"\nDone!")
+        print(f"  Buildings: {row_counts.pop('_buildings')}")
+        print("\nRows by table:")
+        for name, n_rows in row_counts.items():
+            print(f"  {name}: {n_rows} rows")
+        return row_counts
     
-    # DataFrameに変換
-    df = pd.DataFrame(all_records)
+    extracted_files = list(buildings)
     
-    # 列順序を整理（定義順に並べる）
-    existing_columns = [col for col in ALL_COLUMNS if col in df.columns]
-    df = df[existing_columns]
+    if append and not extracted_files:
+        write_profile_report(profiler, profile, run_info)
+        print("\nNo new buildings to append.")
+        return {} if layout == 'normalized' else pd.DataFrame(columns=ALL_COLUMNS)
     
-    # 不足列を追加（NaN）
-    for col in ALL_COLUMNS:
-        if col not in df.columns:
-            df[col] = None
+    if layout == 'normalized':
+        with profile_phase(profiler, 'dataframe_build'):
+            tables = build_normalized_tables(extracted_files, downcast, report)
+            if summary:
+                tables[SUMMARY_TABLE] = building_summary(tables, downcast)
+        with profile_phase(profiler, 'output_write'):
+            write_normalized_output(tables, output_path, output_format, append, downcast)
+            save_manifest(output_path, manifest)
+        
+        if wide_output:
+            print(f"Writing wide view to {wide_output}...")
+            with profile_phase(profiler, 'dataframe_build'):
+                wide = normalized_to_wide(tables)
+            with profile_phase(profiler, 'output_write'):
+                write_tables_xlsx({'all_data': wide}, wide_output)
+        write_profile_report(profiler, profile, run_info)
+        write_coercion_report(report, coercion_report)
+        
+        print(f"\nDone!")
+        print(f"  Buildings: {len(tables['buildings'])}")
+        print("\nRows by table:")
+        for name, table in tables.items():
+            print(f"  {name}: {len(table)} rows x {len(table.columns)} columns")
+        return tables
     
-    # 最終的な列順序
-    df = df[ALL_COLUMNS]
+    # DataFrameに変換（建物属性は建物ごとに1回だけ保持し、出力用に展開）
+    with profile_phase(profiler, 'dataframe_build'):
+        tables = build_normalized_tables(extracted_files, downcast, report)
+        df = normalized_to_wide(tables)
+        summary_df = building_summary(tables, downcast) if summary else None
     
-    # Excel出力
-    print(f"\nWriting to {output_path}...")
-    df.to_excel(output_path, index=False, sheet_name='all_data')
+    with profile_phase(profiler, 'output_write'):
+        write_wide_output(df, output_path, output_format, append, summary_df, downcast)
+        save_manifest(output_path, manifest)
+    write_profile_report(profiler, profile, run_info)
+    write_coercion_report(report, coercion_report)
     
     print(f"\nDone!")
-    print(f"  Total records: {len(df)}")
+    print(f"  {'Appended' if append else 'Total'} records: {len(df)}")
     print(f"  Total columns: {len(df.columns)}")
     print(f"  Buildings: {df['file_id'].nunique()}")
     
@@ -936,6 +1476,227 @@ def consolidate_files(
     return df
 
 
+def write_profile_report(profiler: Optional[RunProfiler], report_path: Optional[str], run_info: Dict[str, Any]):
+    """プロファイルのレポートを書き出す（profiler が None の場合は何もしない）"""
+    if profiler is None:
+        return
+    path = profiler.write(report_path, **run_info)
+    print(f"Profile report: {path}")
+
+
+def write_coercion_report(report: CoercionReport, report_path: Optional[str]):
+    """数値に変換できなかった値の件数を表示し、report_path を指定した場合は一覧を書き出す"""
+    report.print_summary()
+    if report_path:
+        path = report.write(report_path)
+        print(f"Coercion report: {path} ({len(report)} cells)")
+
+
+def write_streaming_output(
+    buildings: Iterator[Tuple[str, Dict[str, Any], EntityBlocks]],
+    output_path: str,
+    output_format: str,
+    layout: str,
+    append: bool,
+    wide_output: Optional[str] = None,
+    profiler: Optional[RunProfiler] = None,
+    downcast: bool = False,
+    report: Optional[CoercionReport] = None,
+    summary: bool = True
+) -> Dict[str, int]:
+    """
+    建物ごとの抽出結果を受け取った順に出力へ逐次書き出す
+
+    保持するのは1建物分の DataFrame と書き出し待ちのバッファだけ。
+    summary=True の場合は建物ごとの集計テーブルにも1建物1行ずつ書き出す。
+    数値列は建物ごとに宣言した型へ変換する（parquet はテーブルの列の型を宣言どおりに固定）。
+    途中で失敗した場合は書きかけの出力を破棄する（既存の出力は置き換えない）。
+    戻り値はテーブル（シート・パーティション）ごとの書き出し行数と建物数（'_buildings'）。
+    """
+    entity_names = {
+        entity_type: partition_name(entity_type) if layout == 'wide' and output_format == 'parquet' else entity_type
+        for entity_type in SHEET_CONFIG
+    }
+    if layout == 'normalized':
+        table_columns = {'buildings': BUILDING_COLUMNS}
+        table_columns.update({
+            entity_type: ['file_id'] + config['columns'] for entity_type, config in SHEET_CONFIG.items()
+        })
+    elif output_format == 'parquet':
+        table_columns = {
+            entity_names[entity_type]: BUILDING_COLUMNS + config['columns']
+            for entity_type, config in SHEET_CONFIG.items()
+        }
+    else:
+        table_columns = {'all_data': ALL_COLUMNS}
+    summary_name = summary_table_name(output_format, layout)
+    if summary:
+        table_columns[summary_name] = SUMMARY_COLUMNS
+    
+    print(f"\nStreaming {layout} {output_format} output to {output_path}...")
+    if output_format == 'parquet':
+        writer = ParquetStreamWriter(output_path, table_columns, append=append, downcast=downcast)
+    elif output_format == 'sqlite':
+        writer = SqliteStreamWriter(output_path, table_columns, append=append)
+    else:
+        writer = XlsxStreamWriter(output_path, table_columns)
+    wide_writer = None
+    if layout == 'normalized' and wide_output:
+        wide_writer = XlsxStreamWriter(wide_output, {'all_data': ALL_COLUMNS})
+    
+    row_counts = {name: 0 for name in table_columns}
+    n_buildings = 0
+    
+    def write(target, name, df):
+        with profile_phase(profiler, 'output_write'):
+            target.write(name, df)
+        if target is writer:
+            row_counts[name] += len(df)
+    
+    try:
+        for file_id, basic_info, blocks in buildings:
+            n_buildings += 1
+            with profile_phase(profiler, 'dataframe_build'):
+                tables = build_normalized_tables([(file_id, basic_info, blocks)], downcast, report)
+            if summary:
+                with profile_phase(profiler, 'dataframe_build'):
+                    summary_df = building_summary(tables, downcast)
+                write(writer, summary_name, summary_df)
+            if layout == 'normalized':
+                for name, table in tables.items():
+                    write(writer, name, table)
+                if wide_writer is not None:
+                    with profile_phase(profiler, 'dataframe_build'):
+                        wide = normalized_to_wide(tables)
+                    write(wide_writer, 'all_data', wide)
+                continue
+            
+            with profile_phase(profiler, 'dataframe_build'):
+                df = normalized_to_wide(tables)
+            if output_format == 'parquet':
+                for entity_type, group in df.groupby('entity_type', sort=False):
+                    write(writer, entity_names[entity_type], group)
+            else:
+                write(writer, 'all_data', df)
+    except BaseException:
+        writer.abort()
+        if wide_writer is not None:
+            wide_writer.abort()
+        raise
+    
+    with profile_phase(profiler, 'output_write'):
+        writer.close()
+        if wide_writer is not None:
+            wide_writer.close()
+    
+    row_counts['_buildings'] = n_buildings
+    return row_counts
+
+
+def write_wide_output(
+    df: pd.DataFrame,
+    output_path: str,
+    output_format: str,
+    append: bool,
+    summary: Optional[pd.DataFrame] = None,
+    downcast: bool = False
+):
+    """
+    ワイド形式（295列）の出力（summary: 建物ごとの集計テーブル、省略時は出力しない）
+
+    downcast は parquet の列の型（宣言した型の数値列を float32 / Int32 で固定するか）。
+    """
+    extra_tables = {} if summary is None else {summary_table_name(output_format, 'wide'): summary}
+    if output_format == 'parquet':
+        # entity_type 別パーティション出力
+        print(f"\n{'Appending' if append else 'Writing'} parquet partitions to {output_path}...")
+        entity_columns = {entity_type: config['columns'] for entity_type, config in SHEET_CONFIG.items()}
+        write_parquet_partitions(
+            df, output_path, entity_columns, COMMON_COLUMNS, append=append, extra_tables=extra_tables,
+            downcast=downcast
+        )
+    elif output_format == 'sqlite':
+        # all_data テーブル（インデックス付き）
+        print(f"\n{'Appending' if append else 'Writing'} SQLite table to {output_path}...")
+        write_tables_sqlite({'all_data': df, **extra_tables}, output_path, append=append)
+    # Excel出力（追記時は既存シートの末尾に追加）
+    else:
+        print(f"\n{'Appending to' if append else 'Writing to'} {output_path}...")
+        write_tables_xlsx({'all_data': df, **extra_tables}, output_path, append=append)
+
+
+def write_normalized_output(
+    tables: Dict[str, pd.DataFrame],
+    output_path: str,
+    output_format: str,
+    append: bool,
+    downcast: bool = False
+):
+    """正規化テーブルの出力（downcast は write_wide_output と同じく parquet の列の型）"""
+    print(f"\n{'Appending' if append else 'Writing'} normalized tables to {output_path}...")
+    if output_format == 'parquet':
+        write_tables_parquet(tables, output_path, append=append, downcast=downcast)
+    elif output_format == 'sqlite':
+        write_tables_sqlite(tables, output_path, append=append)
+    else:
+        write_tables_xlsx(tables, output_path, append=append)
+
+
+# =============================================================================
+# 常駐モード（--watch）
+# =============================================================================
+
+def watch_input_dir(
+    input_dir: str,
+    output_path: str,
+    file_pattern: str = '*.xlsx',
+    workers: int = 1,
+    cache_dir: Optional[str] = None,
+    poll_interval: float = 2.0,
+    settle: float = 2.0,
+    **options
+):
+    """
+    入力ディレクトリを監視し、ファイルの追加・更新・削除のたびに統合出力を作り直す（Ctrl-C で終了）
+
+    - 書き込みが完了したファイルだけを対象にする（settle 秒間変化なし、webpro_watch.py 参照）
+    - 抽出結果キャッシュ（cache_dir、省略時は <出力パス>.extract_cache）をプロセス内にも保持し、
+      新規・変更ファイルだけを抽出する（再起動時はディスクのキャッシュから再開）
+    - workers > 1 の場合はプロセスプールを1回だけ作り、ワーカーを使い回す
+      （ワーカーが異常終了した場合はプールを作り直して再試行）
+    - 毎回全建物から出力を作り直して置き換える（追記ではないため、更新・削除も反映される）
+    options は consolidate_files のその他の引数（append は指定不可）。
+    """
+    if options.get('append'):
+        raise ValueError("watch mode rebuilds the output on every change (--append is not supported)")
+    workers = resolve_workers(workers)
+    cache = ExtractionCache(
+        cache_dir or f"{output_path}.extract_cache", extraction_schema_key(), keep_in_memory=True
+    )
+    executor = create_pool(workers)
+    
+    def rebuild(files: List[Path]):
+        nonlocal executor
+        if not files:
+            print(f"Warning: 対象ファイルがありません（前回の出力を保持します）: {input_dir}")
+            return
+        try:
+            consolidate_files(
+                input_dir, output_path, file_pattern, workers,
+                files=files, cache=cache, executor=executor, **options
+            )
+        except BrokenProcessPool:
+            executor.shutdown(cancel_futures=True)
+            executor = create_pool(workers)
+            raise
+    
+    try:
+        watch_loop(DirectoryWatcher(input_dir, file_pattern, settle), rebuild, poll_interval)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
 # =============================================================================
 # メイン
 # =============================================================================
@@ -951,21 +1712,147 @@ def main():
     )
     parser.add_argument(
         '--output', '-o',
-        default='webpro_all_data.xlsx',
-        help='出力Excelファイルパス（デフォルト: webpro_all_data.xlsx）'
+        default=None,
+        help='出力パス（デフォルト: webpro_all_data.<形式>、parquet の場合はディレクトリ）'
     )
     parser.add_argument(
         '--pattern', '-p',
         default='*.xlsx',
         help='ファイルパターン（デフォルト: *.xlsx）'
     )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=1,
+        help='並列処理のプロセス数（0: CPUコア数、デフォルト: 1）'
+    )
+    parser.add_argument(
+        '--cache_dir',
+        default=None,
+        help='抽出結果キャッシュのディレクトリ（指定時は新規・変更ファイルのみ再抽出）'
+    )
+    parser.add_argument(
+        '--id_scheme',
+        choices=FILE_ID_SCHEMES,
+        default='name',
+        help='file_id の採番方式（name: 建物名, content: ファイル内容, sequential: 連番、デフォルト: name）'
+    )
+    parser.add_argument(
+        '--format', '-f',
+        choices=OUTPUT_FORMATS,
+        default='xlsx',
+        help='出力形式（xlsx: 1シート295列, parquet: entity_type別パーティション, '
+             'sqlite: インデックス付き SQLite、デフォルト: xlsx）'
+    )
+    parser.add_argument(
+        '--layout',
+        choices=LAYOUTS,
+        default='wide',
+        help='出力レイアウト（wide: 295列, normalized: buildings + entity_type別テーブル、デフォルト: wide）'
+    )
+    parser.add_argument(
+        '--wide_output',
+        default=None,
+        help='normalized 出力時にワイド形式（295列）も派生出力する xlsx パス'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='全レコードをメモリに保持せず、ファイルごとに逐次出力する（大量ファイル向け）'
+    )
+    parser.add_argument(
+        '--append',
+        action='store_true',
+        help='既存の出力ファイルに新しい建物だけを追記する'
+    )
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='',
+        default=None,
+        metavar='REPORT_JSON',
+        help='ファイル・様式・処理段階ごとの時間とメモリ割り当て量を JSON に出力する'
+             '（パス省略時: <出力パス>.profile.json）'
+    )
+    parser.add_argument(
+        '--downcast',
+        action='store_true',
+        help='数値列を float32 / Int32 で出力する（デフォルト: float64 / Int64）'
+    )
+    parser.add_argument(
+        '--coercion_report',
+        default=None,
+        metavar='PATH',
+        help='数値に変換できなかった値の一覧（テーブル・列・file_id ごと）を CSV（.json の場合は JSON）に出力する'
+    )
+    parser.add_argument(
+        '--no_summary',
+        action='store_true',
+        help='建物ごとの集計テーブル（building_summary）を出力しない'
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='入力ディレクトリを監視し、ファイルの追加・更新・削除のたびに出力を作り直す（Ctrl-C で終了）'
+    )
+    parser.add_argument(
+        '--poll_interval',
+        type=float,
+        default=2.0,
+        help='--watch: 入力ディレクトリを確認する間隔（秒、デフォルト: 2）'
+    )
+    parser.add_argument(
+        '--settle',
+        type=float,
+        default=2.0,
+        help='--watch: サイズ・更新時刻がこの秒数変わらないファイルを書き込み完了とみなす（デフォルト: 2）'
+    )
     
     args = parser.parse_args()
+    output_path = args.output or f"webpro_all_data.{args.format}"
+    profile = args.profile
+    if profile == '':
+        profile = f"{output_path}.profile.json"
+    
+    if args.watch:
+        if args.append:
+            parser.error('--watch rebuilds the output on every change and cannot be combined with --append')
+        watch_input_dir(
+            input_dir=args.input_dir,
+            output_path=output_path,
+            file_pattern=args.pattern,
+            workers=args.workers,
+            cache_dir=args.cache_dir,
+            poll_interval=args.poll_interval,
+            settle=args.settle,
+            id_scheme=args.id_scheme,
+            output_format=args.format,
+            layout=args.layout,
+            wide_output=args.wide_output,
+            stream=args.stream,
+            profile=profile,
+            downcast=args.downcast,
+            coercion_report=args.coercion_report,
+            summary=not args.no_summary
+        )
+        return
     
     consolidate_files(
         input_dir=args.input_dir,
-        output_path=args.output,
-        file_pattern=args.pattern
+        output_path=output_path,
+        file_pattern=args.pattern,
+        workers=args.workers,
+        cache_dir=args.cache_dir,
+        id_scheme=args.id_scheme,
+        append=args.append,
+        output_format=args.format,
+        layout=args.layout,
+        wide_output=args.wide_output,
+        stream=args.stream,
+        profile=profile,
+        downcast=args.downcast,
+        coercion_report=args.coercion_report,
+        summary=not args.no_summary
     )
 
 
@@ -1,29 +1,89 @@
 #!/usr/bin/env python3
 """
 WEBPRO統合データ読み込みサンプル
-統合後のExcelファイルをPythonで読み込んで分析する例
+統合後のExcelファイル（または SQLite データベース）をPythonで読み込んで分析する例
 """
 
+import csv
+import gzip
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Iterator, List, NamedTuple, Optional
+
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+from webpro_cache import SheetCache
+from webpro_parallel import imap_ordered, resolve_workers
+
+SQLITE_HEADER = b'SQLite format 3\x00'
+
+# search_rooms の対象シート・列
+ROOM_SHEET = '01_室仕様'
+ROOM_TYPE_COLUMN = '室用途_小分類'
+ROOM_AREA_COLUMN = '室面積'
+
+# RoomSearchIndex が保持する室用途の検索条件の件数（最後に使ったのが古いものから破棄）
+MAX_MATCHED_TYPES = 1024
+
 
 # ============================================
 # 読み込みパターン
 # ============================================
 
+def is_sqlite_file(file_path: str) -> bool:
+    """SQLite データベース（output_format='sqlite' の出力）かどうか"""
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+    except OSError:
+        return False
+
+
+def _quote(name: str) -> str:
+    """SQL 識別子のクォート"""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _to_number(value):
+    """数値に変換できない値は None（pd.to_numeric(errors='coerce') 相当、SQLite 関数用）"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _read_sqlite_tables(file_path: str, tables: list = None) -> dict:
+    """SQLite の各テーブルを辞書形式で読み込み（tables 省略時は全テーブル）"""
+    with sqlite3.connect(file_path) as conn:
+        if tables is None:
+            tables = [name for name, in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY rowid"
+            )]
+        return {name: pd.read_sql_query(f"SELECT * FROM {_quote(name)}", conn) for name in tables}
+
+
 def load_all_sheets(file_path: str) -> dict:
     """全シートを辞書形式で読み込み"""
+    if is_sqlite_file(file_path):
+        return _read_sqlite_tables(file_path)
     return pd.read_excel(file_path, sheet_name=None)
 
 
 def load_specific_sheets(file_path: str, sheets: list) -> dict:
     """指定したシートのみ読み込み"""
+    if is_sqlite_file(file_path):
+        return _read_sqlite_tables(file_path, sheets)
     return pd.read_excel(file_path, sheet_name=sheets)
 
 
 def load_single_sheet(file_path: str, sheet_name: str) -> pd.DataFrame:
     """1シートだけ読み込み"""
+    if is_sqlite_file(file_path):
+        return _read_sqlite_tables(file_path, [sheet_name])[sheet_name]
     return pd.read_excel(file_path, sheet_name=sheet_name)
 
 
@@ -55,8 +115,12 @@ def example_analysis(file_path: str):
     
     # ------------------------------
     # サンプル2: 室面積の集計
+    # （consolidate_webpro_full.py の出力は集計済みの building_summary を読むだけでよい）
     # ------------------------------
-    if '01_室仕様' in all_data:
+    if 'building_summary' in all_data:
+        print(f"\n【建物別 室面積合計】")
+        print(all_data['building_summary'][['file_id', 'building_name', 'total_floor_area', 'room_count']].head(10))
+    elif '01_室仕様' in all_data:
         df_rooms = all_data['01_室仕様']
         
         # 数値変換（文字列の場合に備えて）
@@ -96,10 +160,11 @@ def example_analysis(file_path: str):
     # ------------------------------
     # サンプル5: 特定建物の詳細抽出
     # ------------------------------
-    print(f"\n【特定建物（file_id=001）のデータ抽出】")
+    target_id = all_data['00_基本情報']['file_id'].iloc[0] if '00_基本情報' in all_data else '001'
+    print(f"\n【特定建物（file_id={target_id}）のデータ抽出】")
     for sheet_name, df in all_data.items():
         if 'file_id' in df.columns:
-            building_data = df[df['file_id'] == '001']
+            building_data = df[df['file_id'] == target_id]
             if len(building_data) > 0:
                 print(f"  {sheet_name}: {len(building_data)}行")
 
@@ -108,59 +173,456 @@ def example_analysis(file_path: str):
 # CSVエクスポート
 # ============================================
 
-def export_to_csv(file_path: str, output_dir: str):
-    """各シートをCSVとして出力（Python以外のツール連携用）"""
+CSV_COMPRESSIONS = (None, 'gzip')
+
+
+def list_sheet_names(file_path: str) -> List[str]:
+    """統合ファイルのシート名（SQLite の場合はテーブル名）一覧"""
+    if is_sqlite_file(file_path):
+        with sqlite3.connect(file_path) as conn:
+            return [name for name, in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY rowid"
+            )]
+    from openpyxl import load_workbook
+    wb = load_workbook(file_path, read_only=True)
+    try:
+        return wb.sheetnames
+    finally:
+        wb.close()
+
+
+def iter_sheet_rows(file_path: str, sheet_name: str) -> Iterator[tuple]:
+    """
+    シートの行（先頭はヘッダー）をセルの値のタプルとして順に返す
+
+    DataFrame を作らず、xlsx は openpyxl の read_only モード、SQLite はカーソルから
+    1行ずつ読むため、メモリ使用量はシートの行数によらない。
+    末尾の空行は返さない（pd.read_excel と同じ）。
+    """
+    if is_sqlite_file(file_path):
+        conn = sqlite3.connect(file_path)
+        try:
+            cursor = conn.execute(f"SELECT * FROM {_quote(sheet_name)}")
+            yield tuple(desc[0] for desc in cursor.description)
+            yield from cursor
+        finally:
+            conn.close()
+        return
+    
+    from openpyxl import load_workbook
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = wb[sheet_name].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        yield header
+        n_empty = 0
+        for row in rows:
+            if all(value is None for value in row):
+                # 後ろにデータ行が続く場合だけ空行として出力
+                n_empty += 1
+                continue
+            for _ in range(n_empty):
+                yield (None,) * len(header)
+            n_empty = 0
+            yield row
+    finally:
+        wb.close()
+
+
+def _open_csv(csv_path: Path, compression: Optional[str]):
+    if compression == 'gzip':
+        return gzip.open(csv_path, 'wt', encoding='utf-8-sig', newline='')
+    return open(csv_path, 'w', encoding='utf-8-sig', newline='')
+
+
+def export_sheet_csv(file_path: str, sheet_name: str, csv_path: Path, compression: Optional[str] = None) -> int:
+    """
+    1シートを行ごとに読みながら CSV に書き出し、データ行数を返す
+
+    一時ファイルに書いてから置き換えるため、途中で失敗しても書きかけの CSV は残らない。
+    """
+    tmp_path = csv_path.with_name(csv_path.name + '.tmp')
+    n_rows = -1  # ヘッダー行を除く
+    try:
+        with _open_csv(tmp_path, compression) as f:
+            writer = csv.writer(f, lineterminator='\n')
+            for row in iter_sheet_rows(file_path, sheet_name):
+                writer.writerow(row)
+                n_rows += 1
+        os.replace(tmp_path, csv_path)
+    except BaseException:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+    return max(n_rows, 0)
+
+
+def export_to_csv(file_path: str, output_dir: str, workers: int = 1, compression: Optional[str] = None) -> List[Path]:
+    """
+    各シートをCSVとして出力（Python以外のツール連携用）
+
+    シート全体を DataFrame に読み込まず、行を読みながらそのまま書き出す。
+    workers > 1（0 は CPU コア数）でシートごとにプロセス並列、compression='gzip' で
+    <シート名>.csv.gz として出力する。セルの値はシート上の値のまま書き出す。
+    """
+    if compression not in CSV_COMPRESSIONS:
+        raise ValueError(f"未対応の圧縮形式: {compression}（{', '.join(map(str, CSV_COMPRESSIONS))}）")
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
+    suffix = '.csv.gz' if compression == 'gzip' else '.csv'
     
-    all_data = load_all_sheets(file_path)
+    tasks = [
+        (file_path, name, output_path / f"{name}{suffix}", compression)
+        for name in list_sheet_names(file_path)
+    ]
+    workers = min(resolve_workers(workers), max(len(tasks), 1))
     
-    for name, df in all_data.items():
-        csv_path = output_path / f"{name}.csv"
-        df.to_csv(csv_path, index=False, encoding='utf-8-sig')
-        print(f"出力: {csv_path}")
+    written = []
+    errors = []
+    for (_, name, csv_path, _), n_rows, error in imap_ordered(export_sheet_csv, tasks, workers):
+        if error is not None:
+            print(f"  エラー: {name} の出力に失敗: {error}")
+            errors.append(name)
+            continue
+        print(f"出力: {csv_path}（{n_rows}行）")
+        written.append(csv_path)
+    if errors:
+        raise RuntimeError(f"CSV 出力に失敗したシート: {', '.join(errors)}")
+    return written
 
 
 # ============================================
 # クエリ用ユーティリティ
 # ============================================
 
+def build_file_id_index(df: pd.DataFrame) -> dict:
+    """
+    file_id → 行位置の索引
+
+    建物の行が連続している場合（統合ファイルは建物順に出力される）は slice、
+    そうでなければ行位置の配列。file_id 列がないシートは空。
+    """
+    if 'file_id' not in df.columns:
+        return {}
+    index = {}
+    for file_id, positions in df.groupby('file_id', sort=False).indices.items():
+        start, stop = int(positions[0]), int(positions[-1]) + 1
+        index[file_id] = slice(start, stop) if stop - start == len(positions) else positions
+    return index
+
+
+class RoomSearchIndex:
+    """
+    室仕様シートの検索用索引（search_rooms 用）
+
+    - 室面積: 数値に変換した値と、その昇順の行位置（範囲検索は二分探索）
+    - 室用途: 値の種類（カテゴリ）ごとの行位置（部分一致は種類の一覧に対してだけ評価。
+      SQLite 版の instr と同じく、正規表現ではなく文字列としての部分一致）
+    - 室用途の検索条件ごとの一致したカテゴリは、最大 max_matched_types 件まで LRU で保持する
+      （HTTP サービスから任意の条件で検索されても増え続けない。スレッド間で共有できる）
+    シートの DataFrame 自体は変更しない。
+    列名の既定は consolidate_webpro.py の出力（室用途_小分類・室面積）。
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        type_column: str = ROOM_TYPE_COLUMN,
+        area_column: str = ROOM_AREA_COLUMN,
+        max_matched_types: int = MAX_MATCHED_TYPES
+    ):
+        self.n_rows = len(df)
+
+        if area_column in df.columns:
+            area = pd.to_numeric(df[area_column], errors='coerce').to_numpy(dtype=float)
+        else:
+            area = np.full(self.n_rows, np.nan)
+        valid = np.flatnonzero(~np.isnan(area))
+        order = np.argsort(area[valid], kind='stable')
+        self._area_rows = valid[order]
+        self._area_sorted = area[valid][order]
+
+        if type_column in df.columns:
+            codes, categories = pd.factorize(df[type_column])
+        else:
+            codes, categories = np.full(self.n_rows, -1), pd.Index([])
+        self._type_categories = pd.Series(np.asarray(categories, dtype=object), dtype=object)
+        rows_by_code = np.argsort(codes, kind='stable')
+        bounds = np.searchsorted(codes[rows_by_code], np.arange(len(categories) + 1))
+        self._type_rows = [rows_by_code[bounds[i]:bounds[i + 1]] for i in range(len(categories))]
+        # room_type → 一致したカテゴリのコード（同じ条件での再検索用、LRU）
+        self.max_matched_types = max_matched_types
+        self._matched_codes: 'OrderedDict[str, np.ndarray]' = OrderedDict()
+        self._matched_lock = threading.Lock()
+
+    def area_rows(self, min_area: float = None, max_area: float = None) -> np.ndarray:
+        """室面積が範囲内の行位置（昇順でない）"""
+        lo = 0 if min_area is None else np.searchsorted(self._area_sorted, min_area, side='left')
+        hi = len(self._area_sorted) if max_area is None else np.searchsorted(self._area_sorted, max_area, side='right')
+        return self._area_rows[lo:hi]
+
+    def type_rows(self, room_type: str) -> np.ndarray:
+        """室用途に room_type を文字列として含む行位置（正規表現ではない部分一致、昇順でない）"""
+        with self._matched_lock:
+            matched = self._matched_codes.get(room_type)
+            if matched is not None:
+                self._matched_codes.move_to_end(room_type)
+        if matched is None:
+            matched = np.flatnonzero(
+                self._type_categories.str.contains(room_type, regex=False, na=False).to_numpy(dtype=bool)
+            )
+            with self._matched_lock:
+                self._matched_codes[room_type] = matched
+                while len(self._matched_codes) > self.max_matched_types:
+                    self._matched_codes.popitem(last=False)
+        if len(matched) == 0:
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate([self._type_rows[code] for code in matched])
+
+    def search(self, room_type: str = None, min_area: float = None, max_area: float = None) -> np.ndarray:
+        """条件に合う行位置（シート上の行順）"""
+        conditions = []
+        if room_type:
+            conditions.append(self.type_rows(room_type))
+        if min_area is not None or max_area is not None:
+            conditions.append(self.area_rows(min_area, max_area))
+        if not conditions:
+            return np.arange(self.n_rows)
+
+        # 各条件の行位置をマスクに展開して積を取る（ソート不要で行順になる）
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[conditions[0]] = True
+        for rows in conditions[1:]:
+            hit = np.zeros(self.n_rows, dtype=bool)
+            hit[rows] = True
+            mask &= hit
+        return np.flatnonzero(mask)
+
+
+class SheetLRUCache:
+    """
+    バイト予算付きの LRU キャッシュ（読み込んだシート用）
+
+    max_bytes を超えたら最後に使ったのが古いものから破棄する
+    （直前に追加したエントリは予算を超えていても保持する）。
+    max_bytes=None は無制限。hits / misses / evictions で使用状況を確認できる。
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        """値を取得（なければ None）。取得したエントリは最新として扱う"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: str, value: Any, nbytes: int):
+        """値を追加し、予算を超えた分だけ古いエントリを破棄"""
+        if key in self._entries:
+            self.current_bytes -= self._entries.pop(key)[1]
+        self._entries[key] = (value, nbytes)
+        self.current_bytes += nbytes
+        while self.max_bytes is not None and self.current_bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, evicted_bytes) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_bytes
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def stats(self) -> dict:
+        """使用状況（件数・推定バイト数・ヒット/ミス/破棄の回数）"""
+        return {
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+class _LoadedSheet(NamedTuple):
+    """キャッシュするシートと、その読み込み時に作った索引"""
+    df: pd.DataFrame
+    file_id_index: dict
+    room_index: Optional[RoomSearchIndex]
+
+
+def estimate_frame_bytes(df: pd.DataFrame) -> int:
+    """DataFrame のメモリ使用量の推定（文字列などの中身を含む）"""
+    return int(df.memory_usage(deep=True).sum())
+
+
 class WebproData:
-    """WEBPRO統合データへの便利なアクセスを提供"""
+    """
+    WEBPRO統合データへの便利なアクセスを提供
+
+    file_path が SQLite データベース（output_format='sqlite' の出力）の場合は
+    get_building・search_rooms をインデックスを使った SQL で実行し、
+    シート全体は読み込まない。
+    xlsx の場合、読み込んだシートは統合ファイルの隣の <ファイル名>.cache/ にも保存し、
+    次回以降のセッションでは read_excel せずにそこから読み込む
+    （統合ファイルが変わっていればキャッシュを作り直す。sheet_cache=False で無効）。
+    シートを読み込んだ時点で file_id → 行位置の索引を作り、get_building は
+    列全体を比較せずに該当行だけを取り出す。
+    読み込んだシート（と索引）はメモリ上の LRU キャッシュに保持する。max_cache_bytes を
+    指定すると、シートの推定サイズ（memory_usage(deep=True)）の合計がそれを超えた時点で
+    最後に使ったのが古いシートから破棄する（None は無制限）。cache_stats() で使用状況を確認できる。
+    """
     
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, sheet_cache: bool = True, max_cache_bytes: Optional[int] = None):
         self.file_path = file_path
-        self._cache = {}
+        self._cache = SheetLRUCache(max_cache_bytes)
+        self._conn = sqlite3.connect(file_path) if is_sqlite_file(file_path) else None
+        if self._conn is not None:
+            self._conn.create_function('to_number', 1, _to_number, deterministic=True)
+        # SQLite のテーブル → 列 → 宣言された型
+        self._column_types = {}
+        self._sheet_cache = SheetCache(file_path) if sheet_cache and self._conn is None else None
+    
+    def close(self):
+        """SQLite の接続を閉じる"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def _query(self, sql: str, params: list = ()) -> pd.DataFrame:
+        return pd.read_sql_query(sql, self._conn, params=list(params))
     
     def get_sheet(self, sheet_name: str) -> pd.DataFrame:
         """シートを取得（キャッシュ付き）"""
-        if sheet_name not in self._cache:
-            self._cache[sheet_name] = pd.read_excel(
-                self.file_path, sheet_name=sheet_name
-            )
-        return self._cache[sheet_name]
+        return self._load_sheet(sheet_name).df
+    
+    def cache_stats(self) -> dict:
+        """メモリ上のシートキャッシュの使用状況（件数・推定バイト数・ヒット/ミス/破棄の回数）"""
+        return self._cache.stats()
+    
+    def _load_sheet(self, sheet_name: str) -> _LoadedSheet:
+        """シートと索引を取得（キャッシュになければ読み込んで索引を作る）"""
+        loaded = self._cache.get(sheet_name)
+        if loaded is not None:
+            return loaded
+        
+        if self._conn is not None:
+            df = self._query(f"SELECT * FROM {_quote(sheet_name)}")
+        else:
+            df = self._read_excel_sheet(sheet_name)
+        loaded = _LoadedSheet(
+            df=df,
+            file_id_index=build_file_id_index(df),
+            room_index=RoomSearchIndex(df) if sheet_name == ROOM_SHEET else None,
+        )
+        self._cache.put(sheet_name, loaded, estimate_frame_bytes(df))
+        return loaded
+    
+    def _read_excel_sheet(self, sheet_name: str) -> pd.DataFrame:
+        """xlsx からシートを読み込み（シートキャッシュがあればそこから）"""
+        if self._sheet_cache is not None:
+            df = self._sheet_cache.load(sheet_name)
+            if df is not None:
+                return df
+        
+        df = pd.read_excel(self.file_path, sheet_name=sheet_name)
+        if self._sheet_cache is not None:
+            self._sheet_cache.store(sheet_name, df)
+        return df
     
     def get_building(self, file_id: str, sheet_name: str) -> pd.DataFrame:
         """特定建物の特定シートデータを取得"""
-        df = self.get_sheet(sheet_name)
-        return df[df['file_id'] == file_id]
+        if self._conn is not None:
+            # file_id のインデックスで該当行だけを取得
+            return self._query(f"SELECT * FROM {_quote(sheet_name)} WHERE file_id = ?", [file_id])
+        loaded = self._load_sheet(sheet_name)
+        rows = loaded.file_id_index.get(file_id)
+        if rows is None:
+            return loaded.df.iloc[0:0]
+        return loaded.df.iloc[rows]
     
     def get_all_buildings(self) -> pd.DataFrame:
         """全建物の基本情報を取得"""
         return self.get_sheet('00_基本情報')
     
-    def search_rooms(self, room_type: str = None, min_area: float = None) -> pd.DataFrame:
-        """室を検索"""
-        df = self.get_sheet('01_室仕様')
+    def search_rooms(self, room_type: str = None, min_area: float = None, max_area: float = None) -> pd.DataFrame:
+        """
+        室を検索
+
+        room_type は室用途（小分類）の部分一致（正規表現ではなく文字列として、xlsx・SQLite で同じ判定）、
+        min_area・max_area は室面積の範囲（両端を含む）。
+        シート読み込み時に作る RoomSearchIndex で検索し、キャッシュしたシートは変更しない。
+        """
+        if self._conn is not None:
+            return self._search_rooms_sql(room_type, min_area, max_area)
+        
+        loaded = self._load_sheet(ROOM_SHEET)
+        # min_area=0 は従来どおり条件なし
+        rows = loaded.room_index.search(room_type, min_area or None, max_area)
+        return loaded.df.iloc[rows]
+    
+    def _is_real_column(self, table: str, column: str) -> bool:
+        """SQLite のテーブルの列が REAL 型で宣言されているか"""
+        if table not in self._column_types:
+            rows = self._conn.execute(f"PRAGMA table_info({_quote(table)})").fetchall()
+            self._column_types[table] = {name: col_type.upper() for _, name, col_type, *_ in rows}
+        return self._column_types[table].get(column) == 'REAL'
+    
+    def _search_rooms_sql(self, room_type: str = None, min_area: float = None, max_area: float = None) -> pd.DataFrame:
+        """
+        search_rooms の SQL 版
+
+        室用途は種類が少ないため、まず室用途のインデックスだけを走査して
+        部分一致する値を求め、その値でインデックス検索する。
+        室面積は REAL 列（consolidate の SQLite 出力）ならそのまま比較してインデックスで範囲検索する。
+        型が宣言されていない旧形式の出力では to_number() で変換して比較する（全行走査）。
+        """
+        table, type_col, area_col = _quote(ROOM_SHEET), _quote(ROOM_TYPE_COLUMN), _quote(ROOM_AREA_COLUMN)
+        conditions, params = [], []
         
         if room_type:
-            df = df[df['室用途_小分類'].str.contains(room_type, na=False)]
+            conditions.append(
+                f"{type_col} IN (SELECT DISTINCT {type_col} FROM {table} WHERE instr({type_col}, ?) > 0)"
+            )
+            params.append(room_type)
         
+        area_expr = area_col if self._is_real_column(ROOM_SHEET, ROOM_AREA_COLUMN) else f"to_number({area_col})"
         if min_area:
-            df['室面積'] = pd.to_numeric(df['室面積'], errors='coerce')
-            df = df[df['室面積'] >= min_area]
+            conditions.append(f"{area_expr} >= ?")
+            params.append(min_area)
         
-        return df
+        if max_area is not None:
+            conditions.append(f"{area_expr} <= ?")
+            params.append(max_area)
+        
+        sql = f"SELECT * FROM {table}"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        # シート上の行順で返す
+        return self._query(sql + " ORDER BY rowid", params)
 
 
 # ============================================
@@ -176,8 +638,9 @@ if __name__ == '__main__':
     
     # CSVエクスポート（必要に応じて）
     # export_to_csv(combined_file, './output/csv/')
+    # export_to_csv(combined_file, './output/csv/', workers=0, compression='gzip')  # シート並列・gzip 圧縮
     
-    # クラスを使った例
+    # クラスを使った例（SQLite 出力 webpro_combined_data.sqlite も指定可）
     # data = WebproData(combined_file)
-    # print(data.get_building('001', '01_室仕様'))
+    # print(data.get_building('B8b3bb7c12d', '01_室仕様'))  # file_id は 00_基本情報 で確認
     # print(data.search_rooms(room_type='事務室', min_area=100))
@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+"""webpro_basic_info.py の項目名インデックス（項目が欠けたテンプレートで後のファイルの項目を取りこぼさない）"""
+
+from webpro_basic_info import LabelField, LabelIndex
+
+FIELDS = [LabelField('building_name', ('建物の名称',)), LabelField('structure', ('構造',))]
+
+
+def sheet(labels):
+    return [[None, label, f'値{row}'] for row, label in enumerate(labels)]
+
+
+def test_partial_template_does_not_hide_later_fields():
+    index = LabelIndex(FIELDS)
+    # 1件目: 構造の行がないテンプレート
+    assert index.locate(sheet(['', '④建物の名称', ''])) == {'building_name': 1, 'structure': None}
+    # 2件目: 同じ行に建物の名称があり、3行目に構造がある
+    assert index.locate(sheet(['', '④建物の名称', '', '⑦構造'])) == {'building_name': 1, 'structure': 3}
+    # 3件目: 全項目がそろったテンプレートは行位置の確認だけで読む
+    assert index.locate(sheet(['', '④建物の名称', '', '⑦構造'])) == {'building_name': 1, 'structure': 3}
+    assert index.cache_info() == {'hits': 1, 'misses': 2, 'templates': 1}
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""webpro_cache.py の抽出結果キャッシュ（統合の繰り返し・追記でエントリを再利用する）"""
+
+import json
+import os
+import shutil
+
+import pytest
+
+import webpro_cache
+from consolidate_webpro_full import SHEET_CONFIG, consolidate_files
+from webpro_cache import CACHE_INDEX_NAME, ExtractionCache
+from webpro_synthetic import write_webpro_workbook
+
+ROWS = {entity_type: 2 for entity_type in SHEET_CONFIG}
+
+
+@pytest.fixture
+def input_dir(tmp_path):
+    path = tmp_path / 'input'
+    path.mkdir()
+    for seed in range(3):
+        write_webpro_workbook(path / f'webpro_{seed:03d}.xlsx', ROWS, seed=seed, catalogues=False)
+    return path
+
+
+def consolidate(input_dir, tmp_path, **kwargs):
+    return consolidate_files(
+        str(input_dir), str(tmp_path / 'out.sqlite'), cache_dir=str(tmp_path / 'cache'),
+        output_format='sqlite', **kwargs
+    )
+
+
+def test_append_keeps_cache_entries_of_unchanged_files(input_dir, tmp_path, capsys):
+    consolidate(input_dir, tmp_path)
+    write_webpro_workbook(input_dir / 'webpro_003.xlsx', ROWS, seed=3, catalogues=False)
+    consolidate(input_dir, tmp_path, append=True)
+
+    index = json.loads((tmp_path / 'cache' / CACHE_INDEX_NAME).read_text(encoding='utf-8'))
+    assert len(index['files']) == 4
+    assert len(list((tmp_path / 'cache' / 'entries').glob('*.pkl'))) == 4
+
+    capsys.readouterr()
+    consolidate(input_dir, tmp_path)
+    assert 'Cache: 4 reused, 0 extracted, 0 failed' in capsys.readouterr().out
+
+
+def test_summary_counts_failed_files_separately(input_dir, tmp_path, capsys):
+    (input_dir / 'broken.xlsx').write_bytes(b'not a workbook')
+    consolidate(input_dir, tmp_path)
+    assert 'Cache: 0 reused, 3 extracted, 1 failed' in capsys.readouterr().out
+
+
+# ============================================
+# ExtractionCache の判定（パス・サイズ・mtime → 内容ハッシュ）
+# ============================================
+
+def store(cache, path, result):
+    assert not cache.check(path)
+    cache.store(path, result)
+
+
+def test_same_path_size_and_mtime_is_reused_without_hashing(tmp_path, monkeypatch):
+    path = tmp_path / 'a.xlsx'
+    path.write_bytes(b'content')
+    cache = ExtractionCache(tmp_path / 'cache', 'v1')
+    store(cache, path, 'result')
+    cache.save()
+
+    def no_hash(path):
+        raise AssertionError('hashed')
+
+    monkeypatch.setattr(webpro_cache, 'file_sha256', no_hash)
+    cache = ExtractionCache(tmp_path / 'cache', 'v1')
+    assert cache.check(path)
+    assert cache.load(path) == 'result'
+
+
+def test_touched_or_copied_file_with_same_content_is_reused(tmp_path):
+    path = tmp_path / 'a.xlsx'
+    path.write_bytes(b'content')
+    cache = ExtractionCache(tmp_path / 'cache', 'v1')
+    store(cache, path, 'result')
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    copy = tmp_path / 'copy.xlsx'
+    shutil.copyfile(path, copy)
+    assert cache.check(path) and cache.load(path) == 'result'
+    assert cache.check(copy) and cache.load(copy) == 'result'
+
+
+def test_changed_content_is_extracted_again(tmp_path):
+    path = tmp_path / 'a.xlsx'
+    path.write_bytes(b'content')
+    cache = ExtractionCache(tmp_path / 'cache', 'v1')
+    store(cache, path, 'old')
+
+    path.write_bytes(b'changed content')
+    store(cache, path, 'new')
+    assert cache.check(path) and cache.load(path) == 'new'
+
+
+def test_schema_change_invalidates_all_entries(tmp_path):
+    path = tmp_path / 'a.xlsx'
+    path.write_bytes(b'content')
+    cache = ExtractionCache(tmp_path / 'cache', 'v1')
+    store(cache, path, 'result')
+    cache.save()
+
+    cache = ExtractionCache(tmp_path / 'cache', 'v2')
+    assert not cache.check(path)
+    assert not list((tmp_path / 'cache' / 'entries').glob('*.pkl'))
+
+
+def test_prune_removes_entries_of_deleted_files(tmp_path):
+    kept, removed = tmp_path / 'a.xlsx', tmp_path / 'b.xlsx'
+    kept.write_bytes(b'a')
+    removed.write_bytes(b'b')
+    cache = ExtractionCache(tmp_path / 'cache', 'v1')
+    store(cache, kept, 'a')
+    store(cache, removed, 'b')
+
+    cache.prune([kept])
+    assert cache.check(kept)
+    assert not cache.check(removed)
+    assert len(list((tmp_path / 'cache' / 'entries').glob('*.pkl'))) == 1
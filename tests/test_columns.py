@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""webpro_columns.py の COLUMN_SPECS と列定義書（webpro_complete_column_definition.md）の一致"""
+
+import re
+from pathlib import Path
+
+from webpro_columns import COLUMN_SPECS, ColumnSpec
+
+DEFINITION_PATH = Path(__file__).resolve().parents[1] / 'webpro_complete_column_definition.md'
+
+
+def definition_specs():
+    """列定義書の「列定義一覧」の表（| # | 列名 | 説明 | 型 | 単位 |）"""
+    specs = {}
+    in_section = False
+    for line in DEFINITION_PATH.read_text(encoding='utf-8').splitlines():
+        if re.match(r'^##\s', line):
+            in_section = line.startswith('## 列定義一覧')
+        cells = [cell.strip() for cell in line.strip().strip('|').split('|')]
+        if in_section and len(cells) >= 5 and cells[0].isdigit():
+            specs[cells[1].strip('*')] = ColumnSpec(label=cells[2], dtype=cells[3], unit=cells[4])
+    return specs
+
+
+def test_column_specs_match_definition():
+    assert COLUMN_SPECS == definition_specs()
+    assert list(COLUMN_SPECS) == list(definition_specs())
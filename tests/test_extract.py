@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""consolidate_webpro_full.py の様式データ抽出（改訂で位置のずれた様式も判定したレイアウトで読む）"""
+
+import random
+
+from consolidate_webpro_full import SHEET_CONFIG, extract_file, extract_sheet_data
+from webpro_synthetic import _write_xlsx, make_sheet_cells
+from webpro_workbook import WorkbookSession
+
+
+def test_extract_sheet_data_uses_resolved_layout(tmp_path):
+    config = SHEET_CONFIG['room']
+    # 1行下・1列右にずれた改訂（既知の改訂にはない）
+    shifted = dict(config, data_start_row=config['data_start_row'] + 1,
+                   col_mapping={col_idx + 1: name for col_idx, name in config['col_mapping'].items()})
+    path = tmp_path / 'shifted.xlsx'
+    _write_xlsx(path, {config['sheet_name']: make_sheet_cells('room', shifted, 5, random.Random(0))})
+
+    with WorkbookSession(path) as wb:
+        records = extract_sheet_data(wb, 'room', config)
+    _, blocks = extract_file(str(path))
+
+    assert len(records) == 5
+    assert all(record['room_name'] is not None for record in records)
+    assert records == blocks['room'].assign(entity_type='room').to_dict('records')
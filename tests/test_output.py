@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""webpro_output.py の parquet 出力（追記した part ファイル間の型の一致）"""
+
+import pandas as pd
+import pytest
+
+from webpro_output import ParquetStreamWriter, write_parquet_partitions, write_tables_parquet
+
+pytest.importorskip('pyarrow')
+
+
+def room_table(file_id, floors, areas):
+    return pd.DataFrame({'file_id': file_id, 'room_floor': floors, 'room_area': areas})
+
+
+def test_tables_append_keeps_one_schema(tmp_path):
+    output_dir = tmp_path / 'tables.parquet'
+    write_tables_parquet({'room': room_table('A', [1, 2], [10.0, 20.0])}, output_dir)
+    write_tables_parquet({'room': room_table('B', ['B1'], [None])}, output_dir, append=True)
+
+    room = pd.read_parquet(output_dir / 'room')
+    assert room['room_floor'].tolist() == ['1', '2', 'B1']
+    assert room['room_area'].dtype == 'float64'
+    assert room['room_area'].isna().tolist() == [False, False, True]
+
+
+def test_partitions_append_keeps_one_schema(tmp_path):
+    output_dir = tmp_path / 'wide.parquet'
+    entity_columns = {'room': ['room_floor', 'room_area']}
+    common_columns = ['file_id', 'floors_above', 'entity_type']
+
+    first = room_table('A', [1, 2], [10.0, 20.0]).assign(floors_above=[3, 3], entity_type='room')
+    second = room_table('B', ['B1'], ['12.5']).assign(floors_above=[None], entity_type='room')
+    write_parquet_partitions(first, output_dir, entity_columns, common_columns)
+    write_parquet_partitions(second, output_dir, entity_columns, common_columns, append=True)
+
+    room = pd.read_parquet(output_dir / 'entity_type=room')
+    assert room['room_floor'].tolist() == ['1', '2', 'B1']
+    assert room['room_area'].tolist() == [10.0, 20.0, 12.5]
+    assert str(room['floors_above'].dtype) == 'Int64'
+
+
+def test_stream_writer_matches_batch_schema(tmp_path):
+    import pyarrow.parquet as pq
+
+    batch_dir = tmp_path / 'batch.parquet'
+    stream_dir = tmp_path / 'stream.parquet'
+    table = room_table('A', [1, 'B1'], [10.0, None])
+    write_tables_parquet({'room': table}, batch_dir)
+    writer = ParquetStreamWriter(stream_dir, {'room': list(table.columns)})
+    writer.write('room', table)
+    writer.close()
+    # バッチ出力に逐次出力を追記しても読み込める
+    write_tables_parquet({'room': room_table('B', [3], [5.0])}, stream_dir, append=True)
+
+    assert pq.read_schema(batch_dir / 'room' / 'part-0.parquet').types == \
+        pq.read_schema(stream_dir / 'room' / 'part-0.parquet').types
+    assert pd.read_parquet(stream_dir / 'room')['room_floor'].tolist() == ['1', 'B1', '3']
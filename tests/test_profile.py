@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""webpro_profile.py の実行全体のピーク割り当て量（入れ子の区間でピークをリセットしても保つ）"""
+
+import tracemalloc
+
+from webpro_profile import RunProfiler
+
+
+def test_run_peak_survives_later_phases():
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+    profiler = RunProfiler(trace_memory=True)
+    try:
+        with profiler.phase('extract'):
+            block = bytearray(20_000_000)
+            del block
+        with profiler.phase('output_write'):
+            with profiler.phase('dataframe_build'):
+                pass
+
+        report = profiler.report()
+        assert profiler.phases['extract']['peak_bytes'] >= 20_000_000
+        assert report['run']['peak_traced_bytes'] >= 20_000_000
+    finally:
+        tracemalloc.stop()
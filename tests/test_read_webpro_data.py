@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""read_webpro_data.py の WebproData.search_rooms（xlsx と SQLite で同じ結果）"""
+
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from read_webpro_data import ROOM_SHEET, RoomSearchIndex, WebproData
+from webpro_output import write_tables_sqlite
+
+ROOMS = pd.DataFrame({
+    'file_id': ['A', 'A', 'B', 'B', 'C'],
+    '室名': ['r1', 'r2', 'r3', 'r4', 'r5'],
+    '室用途_小分類': ['事務室', '事務室(A).', '会議室', None, '室'],
+    '室面積': [12.5, '30', 55.0, 'なし', 100.0],
+})
+
+
+@pytest.fixture
+def backends(tmp_path):
+    xlsx_path, sqlite_path = tmp_path / 'rooms.xlsx', tmp_path / 'rooms.sqlite'
+    with pd.ExcelWriter(xlsx_path) as writer:
+        ROOMS.to_excel(writer, sheet_name=ROOM_SHEET, index=False)
+    write_tables_sqlite({ROOM_SHEET: ROOMS}, sqlite_path)
+    with WebproData(str(xlsx_path), sheet_cache=False) as xlsx, WebproData(str(sqlite_path)) as sqlite:
+        yield xlsx, sqlite
+
+
+@pytest.mark.parametrize('room_type, min_area, max_area, expected', [
+    ('事務室', None, None, ['r1', 'r2']),
+    ('(A).', None, None, ['r2']),
+    ('(', None, None, ['r2']),
+    ('.', None, None, ['r2']),
+    ('室', 20, 60, ['r2', 'r3']),
+    (None, 30, 100, ['r2', 'r3', 'r5']),
+])
+def test_search_rooms_same_rows_on_both_backends(backends, room_type, min_area, max_area, expected):
+    for data in backends:
+        assert data.search_rooms(room_type, min_area, max_area)['室名'].tolist() == expected
+
+
+def test_sqlite_area_is_indexed_real_column(backends):
+    _, sqlite = backends
+    conn = sqlite3.connect(sqlite.file_path)
+    try:
+        types = {name: col_type for _, name, col_type, *_ in conn.execute(f"PRAGMA table_info('{ROOM_SHEET}')")}
+        plan = conn.execute(f"EXPLAIN QUERY PLAN SELECT * FROM '{ROOM_SHEET}' WHERE \"室面積\" >= 20").fetchall()
+    finally:
+        conn.close()
+    assert types['室面積'] == 'REAL'
+    assert 'USING INDEX' in plan[0][-1]
+
+
+def test_room_type_match_cache_is_bounded():
+    index = RoomSearchIndex(ROOMS, max_matched_types=2)
+    for room_type in ['事務', '会議', '室', '事務']:
+        index.type_rows(room_type)
+    assert list(index._matched_codes) == ['室', '事務']
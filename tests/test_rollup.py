@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""webpro_rollup.py の建物ごとの集計（照明電力密度の分母は室面積を1室1回だけ数える）"""
+
+import pandas as pd
+import pytest
+
+from webpro_rollup import building_summary
+
+
+def make_tables():
+    empty = pd.DataFrame()
+    return {
+        'buildings': pd.DataFrame({'file_id': ['A', 'B'], 'building_name': ['Aビル', 'Bビル']}),
+        'room': pd.DataFrame({
+            'file_id': ['A', 'A'],
+            'room_area': [100.0, 50.0],
+            'room_is_ac_target': ['■', None],
+        }),
+        # 事務室（100㎡）に器具が2種類、倉庫（50㎡）に1種類
+        'lighting': pd.DataFrame({
+            'file_id': ['A', 'A', 'A'],
+            'lt_room_name': ['事務室', '事務室', '倉庫'],
+            'lt_room_area': [100.0, 100.0, 50.0],
+            'lt_fixture_power': [40.0, 20.0, 10.0],
+            'lt_fixture_count': [10, 5, None],
+        }),
+        'heatsource': empty, 'ahu': empty, 'vent_fan': empty, 'elevator': empty, 'pv': empty,
+    }
+
+
+def test_lighting_power_density_counts_room_area_once():
+    summary = building_summary(make_tables()).set_index('file_id')
+
+    assert summary.loc['A', 'total_floor_area'] == 150.0
+    assert summary.loc['A', 'lighting_power'] == 40.0 * 10 + 20.0 * 5 + 10.0
+    assert summary.loc['A', 'lighting_power_density'] == pytest.approx(510.0 / 150.0)
+    assert pd.isna(summary.loc['B', 'lighting_power_density'])
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""webpro_service.py の要求の処理（誤った要求・想定外の失敗でも JSON で応答する）"""
+
+import json
+
+import pandas as pd
+
+from read_webpro_data import ROOM_SHEET
+from webpro_service import WebproQueryService
+
+ROOMS = pd.DataFrame({
+    'file_id': ['A', 'A', 'B'],
+    '室名': ['r1', 'r2', 'r3'],
+    '室用途_小分類': ['事務室', '事務室(A)', '会議室'],
+    '室面積': [12.5, 30.0, 55.0],
+})
+
+
+def make_service(tmp_path):
+    path = tmp_path / 'rooms.xlsx'
+    with pd.ExcelWriter(path) as writer:
+        ROOMS.to_excel(writer, sheet_name=ROOM_SHEET, index=False)
+    return WebproQueryService(str(path), reload_interval=0)
+
+
+def test_room_type_is_matched_literally(tmp_path):
+    service = make_service(tmp_path)
+    for room_type, expected in [('(A)', 1), ('(', 1), ('[', 0), ('.*', 0)]:
+        status, body = service.handle(f'/rooms?room_type={room_type}')
+        assert status == 200
+        assert json.loads(body)['count'] == expected
+
+
+def test_bad_and_failed_requests_return_json_errors(tmp_path, monkeypatch):
+    service = make_service(tmp_path)
+    status, body = service.handle('/rooms?min_area=abc')
+    assert status == 400 and 'error' in json.loads(body)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError('boom')
+
+    monkeypatch.setattr(service.index, 'search_room_rows', fail)
+    status, body = service.handle('/rooms?room_type=x')
+    assert status == 500 and 'error' in json.loads(body)
+    assert service.cache_stats()['entries'] == 0
+
+
+def test_unknown_file_id_is_404_on_both_building_endpoints(tmp_path):
+    service = make_service(tmp_path)
+    for target in ['/buildings/Z', f'/buildings/Z/{ROOM_SHEET}']:
+        status, body = service.handle(target)
+        assert status == 404 and 'error' in json.loads(body)
+
+    status, body = service.handle(f'/buildings/A/{ROOM_SHEET}')
+    assert status == 200 and json.loads(body)['count'] == 2
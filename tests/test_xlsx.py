@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""webpro_xlsx.py の日付セル（表示形式が日付・時刻のセルを pd.read_excel と同じ値で返す）"""
+
+import datetime
+
+import pandas as pd
+import pytest
+
+from webpro_xlsx import XlsxReader
+
+openpyxl = pytest.importorskip('openpyxl')
+
+
+def test_date_cells_match_read_excel(tmp_path):
+    path = tmp_path / 'dates.xlsx'
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = '0) 基本情報'
+    ws.append(['シート作成月日', datetime.datetime(2024, 4, 1)])
+    ws.append(['和暦', datetime.datetime(2023, 10, 17)])
+    ws['B2'].number_format = 'ggge"年"m"月"d"日"'
+    ws.append(['時刻', datetime.time(9, 30)])
+    ws.append(['年月日（文字列）', 45000])
+    ws['B4'].number_format = '0"年"'
+    ws.append(['数値', 45383])
+    ws.append(['小数', 1.5])
+    ws['B6'].number_format = '0.00E+00'
+    wb.save(path)
+
+    with XlsxReader(path) as reader:
+        rows = reader.read_sheet('0) 基本情報')
+    expected = pd.read_excel(path, header=None).to_numpy().tolist()
+
+    assert [row[1] for row in rows] == [row[1] for row in expected]
+    assert rows[0][1] == datetime.datetime(2024, 4, 1)
+    assert rows[2][1] == datetime.time(9, 30)
+    assert rows[3][1] == 45000 and rows[4][1] == 45383
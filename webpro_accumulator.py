@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+列指向のレコード蓄積
+
+抽出したシートのブロック（DataFrame）を列ごとの配列チャンクとして蓄積し、
+最後に列ごとに1回だけ連結して DataFrame を作る。
+行ごとの dict（列名 → 値）を作らないため、数万行規模でも
+変換時間・メモリが行数 × 列数の Python オブジェクトに比例しない。
+"""
+
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+class ColumnAccumulator:
+    """
+    列ごとの配列チャンクに行を追加し、to_frame() で DataFrame を作る
+
+    列の型は to_frame() 時に列単位で推論する
+    （値がすべて数値の列は float64 など。pd.DataFrame(レコード一覧) と同じ結果）。
+    """
+
+    def __init__(self, columns: List[str]):
+        self.columns = list(columns)
+        self._chunks: Dict[str, List[np.ndarray]] = {col: [] for col in self.columns}
+        self.n_rows = 0
+
+    def append_block(self, block: pd.DataFrame, **constants: Any):
+        """
+        ブロックの行を追加
+
+        constants で指定した列（file_id など）は全行同じ値で埋める。
+        ブロックにも constants にもない列は None で埋める。
+        """
+        n_rows = len(block)
+        if n_rows == 0:
+            return
+        # ブロック全体を1回で2次元配列に変換し、列はそのビューとして保持する
+        values = block.to_numpy(dtype=object)
+        positions = {col: pos for pos, col in enumerate(block.columns.tolist())}
+        for col in self.columns:
+            if col in constants:
+                column = np.full(n_rows, constants[col], dtype=object)
+            elif col in positions:
+                column = values[:, positions[col]]
+            else:
+                column = np.full(n_rows, None, dtype=object)
+            self._chunks[col].append(column)
+        self.n_rows += n_rows
+
+    def to_frame(self) -> pd.DataFrame:
+        """蓄積した行を DataFrame に変換（列ごとに1回だけ連結）"""
+        data = {
+            col: np.concatenate(chunks) if chunks else np.empty(0, dtype=object)
+            for col, chunks in self._chunks.items()
+        }
+        return pd.DataFrame(data, columns=self.columns).infer_objects()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+様式0（基本情報、縦型フォーム）の項目名インデックス
+
+基本情報は項目名の列（B列）に「④建物の名称」などのラベルがあり、同じ行の右側に値がある。
+毎ファイル全行を走査してラベルを文字列比較するのではなく、項目 → 行位置のインデックスを
+テンプレートごとに1回だけ作り、2件目以降はインデックスの行のラベルを確認するだけで値を読む。
+
+- 確認はインデックスの各行のラベルが同じ項目に一致するかどうか（行数 = 項目数）
+- 確認に失敗した場合（別のテンプレート）はシート全体を走査してインデックスを作り直し、
+  既知のテンプレートとして追加する
+- テンプレートとして登録するのは全項目が見つかったシートだけ。見つからない項目がある
+  シートは毎回走査する（先頭の行だけの確認では、後のファイルでその項目が別の行に
+  記入されていても読めないため）
+- インデックスはプロセス内で保持する（並列時はワーカーごと）
+
+シートは行のリスト（WorkbookSession.read_rows / DataFrame の値、空セルは None または NaN）で扱う。
+
+使用例:
+    index = LabelIndex([LabelField('building_name', ('建物の名称',)), ...])
+    rows, field_rows = index.read(wb, '0) 基本情報', max_col=6)
+    building_name = rows[field_rows['building_name']][2]
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import pandas as pd
+
+Rows = Sequence[Sequence[Any]]
+
+# 項目 → 行位置（0始まり、走査でシートに見つからなかった項目は None。登録するテンプレートには None はない）
+FieldRows = Dict[str, Optional[int]]
+
+
+class LabelField(NamedTuple):
+    """項目（key）とラベルの判定（keywords のいずれかを含み、exclude のいずれも含まない）"""
+    key: str
+    keywords: Tuple[str, ...]
+    exclude: Tuple[str, ...] = ()
+
+    def matches(self, label: str) -> bool:
+        return any(word in label for word in self.keywords) and not any(word in label for word in self.exclude)
+
+
+class LabelIndex:
+    """
+    縦型フォームの項目 → 行位置のインデックス（テンプレートごとにキャッシュ）
+
+    exclusive=True の場合、1つの行は最初に一致した項目だけに対応する（if / elif の判定順）。
+    同じ項目に一致する行が複数ある場合は最後の行を使う（全行を走査して上書きする従来の抽出と同じ）。
+    """
+
+    def __init__(self, fields: Sequence[LabelField], label_col: int = 1, exclusive: bool = True):
+        self.fields = list(fields)
+        self.label_col = label_col
+        self.exclusive = exclusive
+        self._templates: List[FieldRows] = []
+        self.hits = 0
+        self.misses = 0
+
+    def cache_info(self) -> Dict[str, int]:
+        """キャッシュの状況（hits: 行位置の確認で読み込み, misses: 全行を走査, templates: 既知のテンプレート数）"""
+        return {'hits': self.hits, 'misses': self.misses, 'templates': len(self._templates)}
+
+    def clear(self):
+        self._templates.clear()
+        self.hits = self.misses = 0
+
+    @property
+    def max_row(self) -> Optional[int]:
+        """既知のテンプレートの確認に必要な行数（テンプレートが未登録なら None）"""
+        if not self._templates:
+            return None
+        return max(row for template in self._templates for row in template.values()) + 1
+
+    def _label(self, rows: Rows, row_idx: int) -> str:
+        if row_idx >= len(rows) or self.label_col >= len(rows[row_idx]):
+            return ''
+        value = rows[row_idx][self.label_col]
+        return str(value) if pd.notna(value) else ''
+
+    def _fields_for(self, label: str) -> List[LabelField]:
+        matched = [field for field in self.fields if field.matches(label)]
+        return matched[:1] if self.exclusive else matched
+
+    # ------------------------------------------------------------------
+    # 行位置の確認・走査
+    # ------------------------------------------------------------------
+
+    def lookup(self, rows: Rows) -> Optional[FieldRows]:
+        """既知のテンプレートの行位置でラベルを確認（一致するテンプレートがなければ None）"""
+        for template in self._templates:
+            if all(field in self._fields_for(self._label(rows, template[field.key])) for field in self.fields):
+                self.hits += 1
+                return template
+        return None
+
+    def scan(self, rows: Rows) -> FieldRows:
+        """シート全体を走査して行位置を求め、全項目が見つかった場合はテンプレートとして登録"""
+        self.misses += 1
+        field_rows: FieldRows = {field.key: None for field in self.fields}
+        for row_idx in range(len(rows)):
+            for field in self._fields_for(self._label(rows, row_idx)):
+                field_rows[field.key] = row_idx
+        if all(row is not None for row in field_rows.values()) and field_rows not in self._templates:
+            self._templates.append(field_rows)
+        return field_rows
+
+    def locate(self, rows: Rows) -> FieldRows:
+        """項目 → 行位置（既知のテンプレートの確認に失敗した場合のみ走査）"""
+        field_rows = self.lookup(rows)
+        return field_rows if field_rows is not None else self.scan(rows)
+
+    def read(self, wb: Any, sheet_name: str, max_col: Optional[int] = None) -> Tuple[List[List[Any]], FieldRows]:
+        """
+        ワークブック（WorkbookSession）のシートを読み、(シートの行のリスト, 項目 → 行位置) を返す
+
+        既知のテンプレートがある場合は確認に必要な先頭の行だけを読み、
+        確認に失敗した場合のみシート全体を読んで走査する。
+        """
+        max_row = self.max_row
+        if max_row is not None:
+            rows = wb.read_rows(sheet_name, max_col, max_row)
+            field_rows = self.lookup(rows)
+            if field_rows is not None:
+                return rows, field_rows
+        rows = wb.read_rows(sheet_name, max_col)
+        return rows, self.scan(rows)
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WEBPROファイル単位の抽出結果キャッシュ
+
+ファイルごとの抽出結果をキャッシュディレクトリに保存し、再統合時は
+新規・変更ファイルだけを再抽出する。
+
+キャッシュディレクトリの構成:
+    index.json          パス → {size, mtime_ns, sha256} の索引
+    entries/<sha256>.pkl 抽出結果（内容ハッシュ単位）
+
+判定:
+    1. パス・サイズ・mtime が索引と一致 → ハッシュ計算なしで再利用
+    2. サイズ・mtime が変わっていても同一内容のエントリがあれば再利用（索引のみ更新）
+    3. それ以外 → 再抽出
+    抽出ロジック（schema）が変わった場合はキャッシュ全体を無効化する。
+    索引は最後に統合した入力ファイル群に合わせて整理されるため、
+    キャッシュディレクトリは入力ディレクトリごとに分けること。
+    keep_in_memory=True の場合は読み込み・保存した抽出結果をプロセス内にも保持し、
+    同じインスタンスで統合を繰り返すとき（--watch）はエントリを読み直さない。
+
+SheetCache は読み込み側（read_webpro_data.WebproData）で使う、統合ファイルの
+シート単位のキャッシュ（統合ファイルの隣の <ファイル名>.cache/）。
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Iterable, Union
+
+CACHE_INDEX_NAME = 'index.json'
+CACHE_ENTRY_DIR = 'entries'
+
+
+def file_sha256(path: Union[str, Path], chunk_size: int = 1024 * 1024) -> str:
+    """ファイル内容のSHA-256"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """ファイル単位の抽出結果キャッシュ"""
+
+    def __init__(self, cache_dir: Union[str, Path], schema: str, keep_in_memory: bool = False):
+        self.cache_dir = Path(cache_dir)
+        self.schema = schema
+        self.keep_in_memory = keep_in_memory
+        self._entry_dir = self.cache_dir / CACHE_ENTRY_DIR
+        self._entry_dir.mkdir(parents=True, exist_ok=True)
+        self._files: Dict[str, Dict[str, Any]] = {}
+        # check() で計算した最新のキー（store() で使用）
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        # file_hash() で計算したキー（同じサイズ・mtime の間はハッシュを再計算しない）
+        self._hashed: Dict[str, Dict[str, Any]] = {}
+        # sha256 → 抽出結果（keep_in_memory=True の場合）
+        self._memory: Dict[str, Any] = {}
+
+        index_path = self.cache_dir / CACHE_INDEX_NAME
+        index = {}
+        if index_path.exists():
+            try:
+                index = json.loads(index_path.read_text(encoding='utf-8'))
+            except (OSError, ValueError) as e:
+                print(f"Warning: キャッシュ索引の読み込み失敗（再作成します）: {e}")
+        if index.get('schema') == schema:
+            self._files = index.get('files', {})
+        else:
+            # 抽出ロジックが異なるエントリは使えないため全削除
+            for entry_path in self._entry_dir.glob('*.pkl'):
+                entry_path.unlink()
+
+    @staticmethod
+    def _key(path: Union[str, Path]) -> str:
+        return str(Path(path).resolve())
+
+    def _entry_path(self, sha256: str) -> Path:
+        return self._entry_dir / f"{sha256}.pkl"
+
+    def _state(self, path: Union[str, Path]) -> Dict[str, Any]:
+        """ファイルの {size, mtime_ns, sha256}（サイズ・mtime が既知の値と一致すればハッシュ計算なし）"""
+        key = self._key(path)
+        stat = os.stat(path)
+        for known in (self._files.get(key), self._hashed.get(key)):
+            if known is not None and known['size'] == stat.st_size and known['mtime_ns'] == stat.st_mtime_ns:
+                return known
+        return {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': file_sha256(path),
+        }
+
+    def file_hash(self, path: Union[str, Path]) -> str:
+        """ファイル内容のSHA-256（索引とサイズ・mtime が一致すれば索引の値）"""
+        current = self._state(path)
+        self._hashed[self._key(path)] = current
+        return current['sha256']
+
+    def check(self, path: Union[str, Path]) -> bool:
+        """キャッシュが有効か判定（サイズ・mtime → 内容ハッシュの順に確認）"""
+        key = self._key(path)
+        current = self._state(path)
+        if current['sha256'] in self._memory or self._entry_path(current['sha256']).exists():
+            # 同一内容の抽出結果あり（touch・コピー・移動等の場合は索引だけ更新）
+            self._files[key] = current
+            return True
+
+        self._pending[key] = current
+        return False
+
+    def load(self, path: Union[str, Path]) -> Any:
+        """キャッシュ済みの抽出結果を読み込み（check() が True の場合のみ）"""
+        sha256 = self._files[self._key(path)]['sha256']
+        if sha256 in self._memory:
+            return self._memory[sha256]
+        with open(self._entry_path(sha256), 'rb') as f:
+            result = pickle.load(f)
+        if self.keep_in_memory:
+            self._memory[sha256] = result
+        return result
+
+    def store(self, path: Union[str, Path], result: Any):
+        """抽出結果を保存"""
+        key = self._key(path)
+        current = self._pending.pop(key, None) or self._state(path)
+        entry_path = self._entry_path(current['sha256'])
+        tmp_path = entry_path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, entry_path)
+        self._files[key] = current
+        if self.keep_in_memory:
+            self._memory[current['sha256']] = result
+
+    def prune(self, paths: Iterable[Union[str, Path]]):
+        """指定パス以外（削除されたファイル）の索引と、参照されないエントリを削除"""
+        keep = {self._key(p) for p in paths}
+        self._files = {k: v for k, v in self._files.items() if k in keep}
+        self._hashed = {k: v for k, v in self._hashed.items() if k in keep}
+        referenced = {v['sha256'] for v in self._files.values()}
+        self._memory = {k: v for k, v in self._memory.items() if k in referenced}
+        for entry_path in self._entry_dir.glob('*.pkl'):
+            if entry_path.stem not in referenced:
+                entry_path.unlink()
+
+    def save(self):
+        """索引を書き出し（一時ファイル経由で置き換え）"""
+        index_path = self.cache_dir / CACHE_INDEX_NAME
+        tmp_path = index_path.with_suffix('.tmp')
+        tmp_path.write_text(
+            json.dumps({'schema': self.schema, 'files': self._files}, ensure_ascii=False, indent=1),
+            encoding='utf-8'
+        )
+        os.replace(tmp_path, index_path)
+
+
+# =============================================================================
+# 統合ファイルのシートキャッシュ（読み込み側）
+# =============================================================================
+
+SHEET_CACHE_VERSION = 1
+
+
+class SheetCache:
+    """
+    統合ファイル（xlsx）のシートを読み込んだ DataFrame のキャッシュ
+
+    統合ファイルの隣に <ファイル名>.cache/ を作り、シートごとに pickle で保存する。
+    次回以降のセッションでは read_excel の代わりにここから読み込む。
+
+        index.json      統合ファイルの {size, mtime_ns, sha256} と シート名 → エントリ名
+        <sha1>.pkl      シートの DataFrame
+
+    統合ファイルのサイズ・mtime が索引と一致すれば有効。変わっていても内容ハッシュが
+    一致すれば有効（索引のみ更新）。内容が変わっていればキャッシュ全体を作り直す。
+    """
+
+    def __init__(self, source_path: Union[str, Path], cache_dir: Union[str, Path, None] = None):
+        self.source_path = Path(source_path)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.source_path.with_name(self.source_path.name + '.cache')
+        self._index_path = self.cache_dir / CACHE_INDEX_NAME
+        self._sheets: Dict[str, str] = {}
+        self._source: Dict[str, Any] = {}
+        self._validate()
+
+    def _validate(self):
+        """索引を読み込み、統合ファイルが変わっていればエントリを破棄"""
+        index = {}
+        if self._index_path.exists():
+            try:
+                index = json.loads(self._index_path.read_text(encoding='utf-8'))
+            except (OSError, ValueError) as e:
+                print(f"Warning: シートキャッシュ索引の読み込み失敗（再作成します）: {e}")
+
+        stat = os.stat(self.source_path)
+        source = index.get('source', {})
+        if index.get('version') != SHEET_CACHE_VERSION:
+            source = {}
+        if source.get('size') == stat.st_size and source.get('mtime_ns') == stat.st_mtime_ns:
+            self._source = source
+            self._sheets = index.get('sheets', {})
+            return
+
+        sha256 = file_sha256(self.source_path)
+        self._source = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': sha256}
+        if source.get('sha256') == sha256:
+            # touch・コピー等で内容は同じ → 索引だけ更新
+            self._sheets = index.get('sheets', {})
+            self._save_index()
+            return
+
+        self._sheets = {}
+        if self.cache_dir.exists():
+            for entry_path in self.cache_dir.glob('*.pkl'):
+                entry_path.unlink()
+
+    def _entry_path(self, entry: str) -> Path:
+        return self.cache_dir / f"{entry}.pkl"
+
+    def _save_index(self):
+        tmp_path = self._index_path.with_suffix('.tmp')
+        tmp_path.write_text(
+            json.dumps({'version': SHEET_CACHE_VERSION, 'source': self._source, 'sheets': self._sheets},
+                       ensure_ascii=False, indent=1),
+            encoding='utf-8'
+        )
+        os.replace(tmp_path, self._index_path)
+
+    def load(self, sheet_name: str) -> Any:
+        """キャッシュ済みのシートを読み込み（なければ None）"""
+        entry = self._sheets.get(sheet_name)
+        if entry is None:
+            return None
+        try:
+            with open(self._entry_path(entry), 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"Warning: シートキャッシュ読み込み失敗（再読み込みします）: {sheet_name}: {e}")
+            return None
+
+    def store(self, sheet_name: str, df: Any):
+        """シートを保存（書き込めない場所では警告のみ）"""
+        entry = hashlib.sha1(sheet_name.encode('utf-8')).hexdigest()
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            entry_path = self._entry_path(entry)
+            tmp_path = entry_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+            self._sheets[sheet_name] = entry
+            self._save_index()
+        except OSError as e:
+            print(f"Warning: シートキャッシュを保存できません: {e}")
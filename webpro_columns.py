@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+列定義（列名ごとの見出し（説明）・型・単位）
+
+列定義書（webpro_complete_column_definition.md）の「列定義一覧」を COLUMN_SPECS として
+保持する。合成データの生成（webpro_synthetic.py）やテンプレート改訂の判定（webpro_layout.py）、
+列の型の宣言（webpro_schema.py）で見出しの項目名・値の型を参照するために使う。
+実行時に定義書を読み込まないため、定義書を変更した場合は COLUMN_SPECS も合わせて更新する
+（tests/test_columns.py で定義書との一致を確認する）。
+
+使用例:
+    spec = get_column_spec('room_area')   # ColumnSpec(label='室面積', dtype='float', unit='㎡')
+"""
+
+from typing import Dict, NamedTuple
+
+
+class ColumnSpec(NamedTuple):
+    """列定義（見出し・型・単位）"""
+    label: str
+    dtype: str
+    unit: str
+
+
+# 列名 → 列定義（列定義書の節の順）
+COLUMN_SPECS: Dict[str, ColumnSpec] = {
+    # A. 共通列（全行に値あり）
+    'file_id': ColumnSpec('ファイル識別子', 'str', '建物名から導出（例: B8b3bb7c12d）、連番指定時は001〜100'),
+    'building_name': ColumnSpec('建物の名称', 'str', '様式0より'),
+    'prefecture': ColumnSpec('都道府県', 'str', '様式0より'),
+    'city': ColumnSpec('市区町村', 'str', '様式0より'),
+    'region': ColumnSpec('省エネ基準地域区分', 'int', '1〜8'),
+    'structure': ColumnSpec('構造', 'str', 'RC/S/SRC等'),
+    'floors_above': ColumnSpec('地上階数', 'int', ''),
+    'floors_below': ColumnSpec('地下階数', 'int', ''),
+    'evaluation_target': ColumnSpec('評価対象', 'str', '様式0より'),
+    'entity_type': ColumnSpec('データ種別', 'str', '下記参照'),
+
+    # B. 様式1：室仕様（entity_type = 'room'）
+    'room_floor': ColumnSpec('階', 'str', ''),
+    'room_name': ColumnSpec('室名', 'str', ''),
+    'room_building_type': ColumnSpec('建物用途', 'str', '選択'),
+    'room_type_major': ColumnSpec('室用途（大分類）', 'str', '選択'),
+    'room_type_minor': ColumnSpec('室用途（小分類）', 'str', '選択'),
+    'room_area': ColumnSpec('室面積', 'float', '㎡'),
+    'room_floor_height': ColumnSpec('階高', 'float', 'm'),
+    'room_ceiling_height': ColumnSpec('天井高', 'float', 'm'),
+    'room_is_ac_target': ColumnSpec('空調計算対象室', 'str', '選択'),
+    'room_is_vent_target': ColumnSpec('換気計算対象室', 'str', '選択'),
+    'room_is_light_target': ColumnSpec('照明計算対象室', 'str', '選択'),
+    'room_is_hotwater_target': ColumnSpec('給湯計算対象室', 'str', '選択'),
+    'room_building_group': ColumnSpec('建築物の名称', 'str', '複数建築物用'),
+    'room_note': ColumnSpec('備考', 'str', ''),
+
+    # C. 様式2-1：空調ゾーン（entity_type = 'zone'）
+    'zone_floor': ColumnSpec('階', 'str', '転記'),
+    'zone_room_name': ColumnSpec('室名', 'str', '転記'),
+    'zone_room_type_major': ColumnSpec('室用途（大分類）', 'str', '転記'),
+    'zone_room_type_minor': ColumnSpec('室用途（小分類）', 'str', '転記'),
+    'zone_room_area': ColumnSpec('室面積', 'float', '㎡'),
+    'zone_floor_height': ColumnSpec('階高', 'float', 'm'),
+    'zone_ceiling_height': ColumnSpec('天井高', 'float', 'm'),
+    'zone_ac_floor': ColumnSpec('空調ゾーン階', 'str', ''),
+    'zone_name': ColumnSpec('空調ゾーン名', 'str', ''),
+    'zone_ahu_group_room': ColumnSpec('室負荷処理（空調機群名称）', 'str', '転記'),
+    'zone_ahu_group_oa': ColumnSpec('外気負荷処理（空調機群名称）', 'str', '転記'),
+    'zone_note': ColumnSpec('備考', 'str', ''),
+
+    # D. 様式2-2：外壁構成（entity_type = 'wall'）
+    'wall_name': ColumnSpec('外壁名称', 'str', ''),
+    'wall_type': ColumnSpec('壁の種類', 'str', '選択（外壁/接地壁）'),
+    'wall_u_value': ColumnSpec('熱貫流率', 'float', 'W/㎡K'),
+    'wall_material_no': ColumnSpec('建材番号', 'int', '選択'),
+    'wall_material_name': ColumnSpec('建材名称', 'str', '選択'),
+    'wall_conductivity': ColumnSpec('熱伝導率', 'float', 'W/mK'),
+    'wall_thickness': ColumnSpec('厚み', 'float', 'mm'),
+    'wall_solar_absorption': ColumnSpec('日射吸収率', 'float', '-'),
+    'wall_note': ColumnSpec('備考', 'str', ''),
+
+    # E. 様式2-3：窓仕様（entity_type = 'window'）
+    'window_name': ColumnSpec('開口部名称', 'str', ''),
+    'window_u_value': ColumnSpec('窓の熱貫流率', 'float', 'W/㎡K'),
+    'window_eta_value': ColumnSpec('窓の日射熱取得率', 'float', '-'),
+    'window_frame_type': ColumnSpec('建具の種類', 'str', '選択'),
+    'window_glass_type': ColumnSpec('ガラスの種類', 'str', '選択'),
+    'window_glass_u_value': ColumnSpec('ガラスの熱貫流率', 'float', 'W/(㎡･K)'),
+    'window_glass_eta_value': ColumnSpec('ガラスの日射熱取得率', 'float', '-'),
+    'window_note': ColumnSpec('備考', 'str', ''),
+
+    # F. 様式2-4：外皮（entity_type = 'envelope'）
+    'env_floor': ColumnSpec('階', 'str', '転記'),
+    'env_zone_name': ColumnSpec('空調ゾーン名', 'str', '転記'),
+    'env_direction': ColumnSpec('方位', 'str', '選択'),
+    'env_shade_coef_cooling': ColumnSpec('日除け効果係数（冷房）', 'float', '-'),
+    'env_shade_coef_heating': ColumnSpec('日除け効果係数（暖房）', 'float', '-'),
+    'env_wall_name': ColumnSpec('外壁名称', 'str', '転記'),
+    'env_wall_area': ColumnSpec('外皮面積（窓含）', 'float', '㎡'),
+    'env_window_name': ColumnSpec('開口部名称', 'str', '転記'),
+    'env_window_area': ColumnSpec('窓面積', 'float', '㎡'),
+    'env_has_blind': ColumnSpec('ブラインドの有無', 'str', '選択'),
+    'env_note': ColumnSpec('備考', 'str', ''),
+
+    # G. 様式2-5：熱源（entity_type = 'heatsource'）
+    'hs_group_name': ColumnSpec('熱源群名称', 'str', ''),
+    'hs_simultaneous': ColumnSpec('冷暖同時供給有無', 'str', '選択'),
+    'hs_staging_control': ColumnSpec('台数制御', 'str', '選択'),
+    'hs_operation_mode': ColumnSpec('運転モード', 'str', '選択（無/追掛/氷蓄熱/水蓄熱）'),
+    'hs_storage_capacity': ColumnSpec('蓄熱容量', 'float', 'MJ'),
+    'hs_type': ColumnSpec('熱源機種', 'str', '選択'),
+    'hs_cooling_order': ColumnSpec('冷熱生成運転順位', 'int', '選択'),
+    'hs_cooling_count': ColumnSpec('冷熱生成台数', 'int', '台'),
+    'hs_cooling_supply_temp': ColumnSpec('冷熱生成送水温度', 'float', '℃'),
+    'hs_cooling_capacity': ColumnSpec('定格冷却能力', 'float', 'kW/台'),
+    'hs_cooling_main_power': ColumnSpec('主機定格消費エネルギー（冷）', 'float', 'kW/台'),
+    'hs_cooling_sub_power': ColumnSpec('補機定格消費電力（冷）', 'float', 'kW/台'),
+    'hs_cooling_pump_power': ColumnSpec('一次ポンプ定格消費電力（冷）', 'float', 'kW/台'),
+    'hs_ct_capacity': ColumnSpec('冷却塔定格冷却能力', 'float', 'kW/台'),
+    'hs_ct_fan_power': ColumnSpec('冷却塔ファン消費電力', 'float', 'kW/台'),
+    'hs_ct_pump_power': ColumnSpec('冷却水ポンプ消費電力', 'float', 'kW/台'),
+    'hs_heating_order': ColumnSpec('温熱生成運転順位', 'int', '選択'),
+    'hs_heating_count': ColumnSpec('温熱生成台数', 'int', '台'),
+    'hs_heating_supply_temp': ColumnSpec('温熱生成送水温度', 'float', '℃'),
+    'hs_heating_capacity': ColumnSpec('定格加熱能力', 'float', 'kW/台'),
+    'hs_heating_main_power': ColumnSpec('主機定格消費エネルギー（温）', 'float', 'kW/台'),
+    'hs_heating_sub_power': ColumnSpec('補機定格消費電力（温）', 'float', 'kW/台'),
+    'hs_heating_pump_power': ColumnSpec('一次ポンプ定格消費電力（温）', 'float', 'kW/台'),
+    'hs_note': ColumnSpec('備考', 'str', ''),
+
+    # H. 様式2-6：二次ポンプ（entity_type = 'pump'）
+    'pump_group_name': ColumnSpec('二次ポンプ群名称', 'str', ''),
+    'pump_staging_control': ColumnSpec('台数制御の有無', 'str', '選択'),
+    'pump_cooling_temp_diff': ColumnSpec('冷房時温度差', 'float', '℃'),
+    'pump_heating_temp_diff': ColumnSpec('暖房時温度差', 'float', '℃'),
+    'pump_order': ColumnSpec('運転順位', 'int', '選択'),
+    'pump_count': ColumnSpec('台数', 'int', '台'),
+    'pump_rated_flow': ColumnSpec('定格流量', 'float', 'm3/h台'),
+    'pump_rated_power': ColumnSpec('定格消費電力', 'float', 'kW/台'),
+    'pump_flow_control': ColumnSpec('流量制御方式', 'str', '選択'),
+    'pump_min_flow_ratio': ColumnSpec('変流量時最小流量比', 'float', '%'),
+    'pump_note': ColumnSpec('備考', 'str', ''),
+
+    # I. 様式2-7：空調機（entity_type = 'ahu'）
+    'ahu_group_name': ColumnSpec('空調機群名称', 'str', ''),
+    'ahu_count': ColumnSpec('台数', 'int', '台'),
+    'ahu_type': ColumnSpec('空調機タイプ', 'str', '選択'),
+    'ahu_cooling_capacity': ColumnSpec('定格冷却（冷房）能力', 'float', 'kW/台'),
+    'ahu_heating_capacity': ColumnSpec('定格加熱（暖房）能力', 'float', 'kW/台'),
+    'ahu_oa_flow': ColumnSpec('設計最大外気風量', 'float', 'm3/h台'),
+    'ahu_sa_fan_power': ColumnSpec('給気ファン定格消費電力', 'float', 'kW/台'),
+    'ahu_ra_fan_power': ColumnSpec('還気ファン定格消費電力', 'float', 'kW/台'),
+    'ahu_oa_fan_power': ColumnSpec('外気ファン定格消費電力', 'float', 'kW/台'),
+    'ahu_ea_fan_power': ColumnSpec('排気ファン定格消費電力', 'float', 'kW/台'),
+    'ahu_air_flow_control': ColumnSpec('風量制御方式', 'str', '選択'),
+    'ahu_min_air_ratio': ColumnSpec('変風量時最小風量比', 'float', '%'),
+    'ahu_preheat_oa_stop': ColumnSpec('予熱時外気取り入れ停止の有無', 'str', '選択'),
+    'ahu_economizer': ColumnSpec('外気冷房制御の有無', 'str', '選択'),
+    'ahu_has_hex': ColumnSpec('全熱交換器の有無', 'str', '選択'),
+    'ahu_hex_name': ColumnSpec('全熱交換器の名称', 'str', '転記'),
+    'ahu_hex_flow': ColumnSpec('全熱交換器の設計風量', 'float', 'm3/h台'),
+    'ahu_hex_eff_cooling': ColumnSpec('全熱交換効率（冷房時）', 'float', '%'),
+    'ahu_hex_eff_heating': ColumnSpec('全熱交換効率（暖房時）', 'float', '%'),
+    'ahu_auto_bypass': ColumnSpec('自動換気切替機能の有無', 'str', '選択'),
+    'ahu_rotor_power': ColumnSpec('ローター消費電力', 'float', 'kW/台'),
+    'ahu_pump_group_cooling': ColumnSpec('二次ポンプ群名称（冷熱）', 'str', '転記'),
+    'ahu_pump_group_heating': ColumnSpec('二次ポンプ群名称（温熱）', 'str', '転記'),
+    'ahu_hs_group_cooling': ColumnSpec('熱源群名称（冷熱）', 'str', '転記'),
+    'ahu_hs_group_heating': ColumnSpec('熱源群名称（温熱）', 'str', '転記'),
+    'ahu_note': ColumnSpec('備考', 'str', ''),
+
+    # J. 様式2-8：熱源水温度（entity_type = 'hs_water_temp'）
+    'hswt_group_name': ColumnSpec('熱源群名称', 'str', ''),
+    'hswt_temp_jan': ColumnSpec('熱源水温度（1月）', 'float', '℃'),
+    'hswt_temp_feb': ColumnSpec('熱源水温度（2月）', 'float', '℃'),
+    'hswt_temp_mar': ColumnSpec('熱源水温度（3月）', 'float', '℃'),
+    'hswt_temp_apr': ColumnSpec('熱源水温度（4月）', 'float', '℃'),
+    'hswt_temp_may': ColumnSpec('熱源水温度（5月）', 'float', '℃'),
+    'hswt_temp_jun': ColumnSpec('熱源水温度（6月）', 'float', '℃'),
+    'hswt_temp_jul': ColumnSpec('熱源水温度（7月）', 'float', '℃'),
+    'hswt_temp_aug': ColumnSpec('熱源水温度（8月）', 'float', '℃'),
+    'hswt_temp_sep': ColumnSpec('熱源水温度（9月）', 'float', '℃'),
+    'hswt_temp_oct': ColumnSpec('熱源水温度（10月）', 'float', '℃'),
+    'hswt_temp_nov': ColumnSpec('熱源水温度（11月）', 'float', '℃'),
+    'hswt_temp_dec': ColumnSpec('熱源水温度（12月）', 'float', '℃'),
+
+    # K. 様式2-9：全熱交換器（entity_type = 'heat_exchanger'）
+    'hex_name': ColumnSpec('全熱交換器名称', 'str', ''),
+    'hex_type': ColumnSpec('全熱交換器の方式', 'str', '選択（静止形/回転形）'),
+    'hex_oa_flow': ColumnSpec('設計外気量又は設計給気量', 'float', 'm3/h台'),
+    'hex_ea_flow': ColumnSpec('設計排気量又は設計還気量', 'float', 'm3/h台'),
+    'hex_count': ColumnSpec('台数', 'int', '台'),
+    'hex_eff_cooling_1': ColumnSpec('全熱交換効率（冷房時）試験1', 'float', '%'),
+    'hex_eff_heating_1': ColumnSpec('全熱交換効率（暖房時）試験1', 'float', '%'),
+    'hex_test_sa_flow_1': ColumnSpec('測定時給気量 試験1', 'float', 'm3/h台'),
+    'hex_test_ra_flow_1': ColumnSpec('測定時還気量 試験1', 'float', 'm3/h台'),
+    'hex_vent_eff_1': ColumnSpec('有効換気量率 試験1', 'float', '%'),
+    'hex_eff_cooling_2': ColumnSpec('全熱交換効率（冷房時）試験2', 'float', '%'),
+    'hex_eff_heating_2': ColumnSpec('全熱交換効率（暖房時）試験2', 'float', '%'),
+    'hex_test_sa_flow_2': ColumnSpec('測定時給気量 試験2', 'float', 'm3/h台'),
+    'hex_test_ra_flow_2': ColumnSpec('測定時還気量 試験2', 'float', 'm3/h台'),
+    'hex_vent_eff_2': ColumnSpec('有効換気量率 試験2', 'float', '%'),
+    'hex_eff_cooling_3': ColumnSpec('全熱交換効率（冷房時）試験3', 'float', '%'),
+    'hex_eff_heating_3': ColumnSpec('全熱交換効率（暖房時）試験3', 'float', '%'),
+    'hex_test_sa_flow_3': ColumnSpec('測定時給気量 試験3', 'float', 'm3/h台'),
+    'hex_test_ra_flow_3': ColumnSpec('測定時還気量 試験3', 'float', 'm3/h台'),
+    'hex_vent_eff_3': ColumnSpec('有効換気量率 試験3', 'float', '%'),
+
+    # L. 様式2-10：変流量二次ポンプシステム（entity_type = 'vwv_pump'）
+    'vwv_group_name': ColumnSpec('二次ポンプ群名称', 'str', ''),
+    'vwv_cooling_temp_diff': ColumnSpec('冷房時温度差', 'float', '℃'),
+    'vwv_heating_temp_diff': ColumnSpec('暖房時温度差', 'float', '℃'),
+    'vwv_rated_flow': ColumnSpec('定格流量', 'float', 'm3/h'),
+    'vwv_rated_power': ColumnSpec('定格消費電力', 'float', 'kW'),
+    'vwv_min_flow_ratio': ColumnSpec('変流量時最小流量比', 'float', '%'),
+    'vwv_coef_3rd': ColumnSpec('3次の項の係数', 'float', ''),
+    'vwv_coef_2nd': ColumnSpec('2次の項の係数', 'float', ''),
+    'vwv_coef_1st': ColumnSpec('1次の項の係数', 'float', ''),
+    'vwv_coef_const': ColumnSpec('定数項', 'float', ''),
+
+    # M. 様式2-11：PAC部分負荷特性（entity_type = 'pac_partial'）
+    'pac_hs_name': ColumnSpec('熱源機種名称', 'str', ''),
+    'pac_cooling_coef_2nd': ColumnSpec('部分負荷特性（冷房）2次の項の係数', 'float', ''),
+    'pac_cooling_coef_1st': ColumnSpec('部分負荷特性（冷房）1次の項の係数', 'float', ''),
+    'pac_cooling_const': ColumnSpec('部分負荷特性（冷房）定数項', 'float', ''),
+    'pac_cooling_min_output': ColumnSpec('部分負荷特性（冷房）最小出力比', 'float', ''),
+    'pac_heating_coef_2nd': ColumnSpec('部分負荷特性（暖房）2次の項の係数', 'float', ''),
+    'pac_heating_coef_1st': ColumnSpec('部分負荷特性（暖房）1次の項の係数', 'float', ''),
+    'pac_heating_const': ColumnSpec('部分負荷特性（暖房）定数項', 'float', ''),
+    'pac_heating_min_output': ColumnSpec('部分負荷特性（暖房）最小出力比', 'float', ''),
+
+    # N. 様式3-1：換気室（entity_type = 'vent_room'）
+    'vr_floor': ColumnSpec('階', 'str', '転記'),
+    'vr_room_name': ColumnSpec('室名', 'str', '転記'),
+    'vr_room_type_major': ColumnSpec('室用途（大分類）', 'str', '転記'),
+    'vr_room_type_minor': ColumnSpec('室用途（小分類）', 'str', '転記'),
+    'vr_room_area': ColumnSpec('室面積', 'float', '㎡'),
+    'vr_vent_type': ColumnSpec('換気種類', 'str', '選択（給気/排気/循環/空調）'),
+    'vr_vent_equip_name': ColumnSpec('換気機器名称', 'str', '転記'),
+    'vr_note': ColumnSpec('備考', 'str', ''),
+
+    # O. 様式3-2：換気送風機（entity_type = 'vent_fan'）
+    'vf_equip_name': ColumnSpec('換気機器名称', 'str', ''),
+    'vf_design_flow': ColumnSpec('設計風量', 'float', 'm3/h'),
+    'vf_motor_power': ColumnSpec('電動機定格出力', 'float', 'kW'),
+    'vf_high_eff_motor': ColumnSpec('高効率電動機の有無', 'str', '選択'),
+    'vf_has_inverter': ColumnSpec('インバータの有無', 'str', '選択'),
+    'vf_flow_control': ColumnSpec('送風量制御', 'str', '選択'),
+    'vf_note': ColumnSpec('備考', 'str', ''),
+
+    # P. 様式3-3：換気空調機（entity_type = 'vent_ahu'）
+    'va_equip_name': ColumnSpec('換気機器名称', 'str', ''),
+    'va_room_type': ColumnSpec('換気対象室の用途', 'str', '選択'),
+    'va_cooling_capacity': ColumnSpec('必要冷却能力', 'float', 'kW'),
+    'va_hs_efficiency': ColumnSpec('熱源効率（一次換算値）', 'float', '-'),
+    'va_pump_power': ColumnSpec('ポンプ定格出力', 'float', 'kW'),
+    'va_fan_type': ColumnSpec('送風機の種類', 'str', '選択'),
+    'va_design_flow': ColumnSpec('設計風量', 'float', 'm3/h'),
+    'va_motor_power': ColumnSpec('電動機定格出力', 'float', 'kW'),
+    'va_high_eff_motor': ColumnSpec('高効率電動機の有無', 'str', '選択'),
+    'va_has_inverter': ColumnSpec('インバータの有無', 'str', '選択'),
+    'va_flow_control': ColumnSpec('送風量制御', 'str', '選択'),
+    'va_note': ColumnSpec('備考', 'str', ''),
+
+    # Q. 様式3-4：年間平均負荷率（entity_type = 'vent_load_rate'）
+    'vlr_equip_name': ColumnSpec('換気機器名称', 'str', ''),
+    'vlr_annual_load_rate': ColumnSpec('年間平均負荷率', 'float', '-'),
+    'vlr_note': ColumnSpec('備考', 'str', ''),
+
+    # R. 様式4：照明（entity_type = 'lighting'）
+    'lt_floor': ColumnSpec('階', 'str', '転記'),
+    'lt_room_name': ColumnSpec('室名', 'str', '転記'),
+    'lt_room_type_major': ColumnSpec('室用途（大分類）', 'str', '転記'),
+    'lt_room_type_minor': ColumnSpec('室用途（小分類）', 'str', '転記'),
+    'lt_room_area': ColumnSpec('室面積', 'float', '㎡'),
+    'lt_floor_height': ColumnSpec('階高', 'float', 'm'),
+    'lt_ceiling_height': ColumnSpec('天井高', 'float', 'm'),
+    'lt_room_width': ColumnSpec('室の間口', 'float', 'm'),
+    'lt_room_depth': ColumnSpec('室の奥行', 'float', 'm'),
+    'lt_room_index': ColumnSpec('室指数', 'float', '-'),
+    'lt_fixture_name': ColumnSpec('機器名称', 'str', ''),
+    'lt_fixture_power': ColumnSpec('定格消費電力', 'float', 'W/台'),
+    'lt_fixture_count': ColumnSpec('台数', 'int', '台'),
+    'lt_occupancy_control': ColumnSpec('在室検知制御', 'str', '選択'),
+    'lt_daylight_control': ColumnSpec('明るさ検知制御', 'str', '選択'),
+    'lt_schedule_control': ColumnSpec('タイムスケジュール制御', 'str', '選択'),
+    'lt_initial_correction': ColumnSpec('初期照度補正機能', 'str', '選択'),
+    'lt_note': ColumnSpec('備考', 'str', ''),
+
+    # S. 様式5-1：給湯室（entity_type = 'hotwater_room'）
+    'hwr_floor': ColumnSpec('階', 'str', '転記'),
+    'hwr_room_name': ColumnSpec('室名', 'str', '転記'),
+    'hwr_room_type_major': ColumnSpec('室用途（大分類）', 'str', '転記'),
+    'hwr_room_type_minor': ColumnSpec('室用途（小分類）', 'str', '転記'),
+    'hwr_room_area': ColumnSpec('室面積', 'float', '㎡'),
+    'hwr_supply_location': ColumnSpec('給湯箇所', 'str', ''),
+    'hwr_water_saving': ColumnSpec('節湯器具', 'str', '選択'),
+    'hwr_equip_name': ColumnSpec('給湯機器名称', 'str', '転記'),
+    'hwr_note': ColumnSpec('備考', 'str', ''),
+
+    # T. 様式5-2：給湯機器（entity_type = 'hotwater_equip'）
+    'hwe_equip_name': ColumnSpec('給湯機器名称', 'str', ''),
+    'hwe_fuel_type': ColumnSpec('燃料種類', 'str', '選択'),
+    'hwe_heating_capacity': ColumnSpec('定格加熱能力', 'float', 'kW'),
+    'hwe_efficiency': ColumnSpec('熱源効率（一次エネルギー換算）', 'float', '-'),
+    'hwe_insulation': ColumnSpec('配管保温仕様', 'str', '選択'),
+    'hwe_pipe_diameter': ColumnSpec('接続口径', 'float', 'mm'),
+    'hwe_solar_area': ColumnSpec('有効集熱面積', 'float', '㎡'),
+    'hwe_solar_azimuth': ColumnSpec('集熱面の方位角', 'float', '°'),
+    'hwe_solar_tilt': ColumnSpec('集熱面の傾斜角', 'float', '°'),
+    'hwe_note': ColumnSpec('備考', 'str', ''),
+
+    # U. 様式6：昇降機（entity_type = 'elevator'）
+    'ev_floor': ColumnSpec('階', 'str', '転記'),
+    'ev_room_name': ColumnSpec('室名', 'str', '転記'),
+    'ev_room_type_major': ColumnSpec('室用途（大分類）', 'str', '転記'),
+    'ev_room_type_minor': ColumnSpec('室用途（小分類）', 'str', '転記'),
+    'ev_equip_name': ColumnSpec('機器名称', 'str', ''),
+    'ev_count': ColumnSpec('台数', 'int', '台'),
+    'ev_capacity': ColumnSpec('積載量', 'float', 'kg'),
+    'ev_speed': ColumnSpec('速度', 'float', 'm/min'),
+    'ev_transport_coef': ColumnSpec('輸送能力係数', 'float', '-'),
+    'ev_control_type': ColumnSpec('速度制御方式', 'str', '選択'),
+    'ev_note': ColumnSpec('備考', 'str', ''),
+
+    # V. 様式7-1：太陽光発電（entity_type = 'pv'）
+    'pv_system_name': ColumnSpec('太陽光発電システム名称', 'str', ''),
+    'pv_pcs_efficiency': ColumnSpec('パワーコンディショナの効率', 'float', '-'),
+    'pv_cell_type': ColumnSpec('太陽電池の種類', 'str', '選択'),
+    'pv_install_type': ColumnSpec('アレイ設置方式', 'str', '選択'),
+    'pv_capacity': ColumnSpec('アレイのシステム容量', 'float', 'kW'),
+    'pv_azimuth': ColumnSpec('パネルの方位角', 'float', '°'),
+    'pv_tilt': ColumnSpec('パネルの傾斜角', 'float', '°'),
+    'pv_note': ColumnSpec('備考', 'str', ''),
+
+    # W. 様式7-3：コージェネレーション（entity_type = 'cgs'）
+    'cgs_name': ColumnSpec('コージェネレーション設備名称', 'str', ''),
+    'cgs_rated_output': ColumnSpec('定格発電出力', 'float', 'kW'),
+    'cgs_count': ColumnSpec('設置台数', 'int', '台'),
+    'cgs_gen_eff_100': ColumnSpec('発電効率（負荷率1.00）', 'float', '-'),
+    'cgs_gen_eff_75': ColumnSpec('発電効率（負荷率0.75）', 'float', '-'),
+    'cgs_gen_eff_50': ColumnSpec('発電効率（負荷率0.50）', 'float', '-'),
+    'cgs_heat_eff_100': ColumnSpec('排熱効率（負荷率1.00）', 'float', '-'),
+    'cgs_heat_eff_75': ColumnSpec('排熱効率（負荷率0.75）', 'float', '-'),
+    'cgs_heat_eff_50': ColumnSpec('排熱効率（負荷率0.50）', 'float', '-'),
+    'cgs_priority_ac_cool': ColumnSpec('排熱利用優先順位（空調冷熱源）', 'int', '-'),
+    'cgs_priority_ac_heat': ColumnSpec('排熱利用優先順位（空調温熱源）', 'int', '-'),
+    'cgs_priority_hotwater': ColumnSpec('排熱利用優先順位（給湯）', 'int', '-'),
+    'cgs_24h_operation': ColumnSpec('24時間運転の有無', 'str', '-'),
+    'cgs_ac_cool_hs_group': ColumnSpec('排熱利用系統（空調冷熱源）', 'str', '選択'),
+    'cgs_ac_heat_hs_group': ColumnSpec('排熱利用系統（空調温熱源）', 'str', '選択'),
+    'cgs_hotwater_equip': ColumnSpec('排熱利用系統（給湯機器）', 'str', '選択'),
+    'cgs_note': ColumnSpec('備考', 'str', ''),
+
+    # X. 様式8：非空調外皮（entity_type = 'envelope_non_ac'）
+    'nac_floor': ColumnSpec('階', 'str', ''),
+    'nac_zone_name': ColumnSpec('非空調ゾーン名', 'str', ''),
+    'nac_room_type_major': ColumnSpec('室用途（大分類）', 'str', ''),
+    'nac_room_type_minor': ColumnSpec('室用途（小分類）', 'str', ''),
+    'nac_room_area': ColumnSpec('室面積', 'float', '㎡'),
+    'nac_floor_height': ColumnSpec('階高', 'float', 'm'),
+    'nac_direction': ColumnSpec('方位', 'str', '選択'),
+    'nac_shade_coef_cooling': ColumnSpec('日除け効果係数（冷房）', 'float', '-'),
+    'nac_shade_coef_heating': ColumnSpec('日除け効果係数（暖房）', 'float', '-'),
+    'nac_wall_name': ColumnSpec('外壁名称', 'str', '転記'),
+    'nac_wall_area': ColumnSpec('外皮面積（窓含）', 'float', '㎡'),
+    'nac_window_name': ColumnSpec('窓名称', 'str', '転記'),
+    'nac_window_area': ColumnSpec('窓面積', 'float', '㎡'),
+    'nac_has_blind': ColumnSpec('ブラインドの有無', 'str', '選択'),
+    'nac_note': ColumnSpec('備考', 'str', ''),
+}
+
+
+def get_column_spec(col_name: str) -> ColumnSpec:
+    """列名の ColumnSpec（記載のない列は、列名を見出しとする文字列列として扱う）"""
+    return COLUMN_SPECS.get(col_name, ColumnSpec(label=col_name, dtype='str', unit=''))
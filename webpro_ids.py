@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WEBPROファイルの file_id 採番
+
+ファイル名のソート順で採番すると、1ファイル追加しただけで後続の建物の
+file_id がすべてずれる。ここでは建物名またはファイル内容から導出した
+安定な file_id を生成する。
+
+採番方式:
+    name        建物の名称（NFKC正規化）のハッシュ: 'B' + 10桁
+                （建物名が空の場合は content にフォールバック）
+    content     ファイル内容のハッシュ: 'F' + 10桁
+    sequential  従来どおりソート順の連番: '001', '002', ...
+"""
+
+import hashlib
+import unicodedata
+from typing import Any, Container, Optional
+
+FILE_ID_SCHEMES = ('name', 'content', 'sequential')
+
+
+def make_file_id(
+    scheme: str,
+    building_name: Any,
+    sha256: str,
+    seq: Optional[int] = None
+) -> str:
+    """採番方式に従って file_id を生成"""
+    if scheme == 'sequential':
+        return f"{seq:03d}"
+
+    name = unicodedata.normalize('NFKC', str(building_name or '')).strip()
+    if scheme == 'name' and name:
+        return 'B' + hashlib.sha1(name.encode('utf-8')).hexdigest()[:10]
+
+    if scheme not in FILE_ID_SCHEMES:
+        raise ValueError(f"未対応の採番方式: {scheme}")
+    return 'F' + sha256[:10]
+
+
+def disambiguate_file_id(file_id: str, sha256: str, used: Container[str]) -> str:
+    """同名の建物が複数ある場合、2件目以降に内容ハッシュの接尾辞を付ける"""
+    if file_id not in used:
+        return file_id
+    return f"{file_id}-{sha256[:6]}"
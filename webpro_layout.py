@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WEBPRO入力シートのテンプレート改訂（レイアウト）の判定
+
+SHEET_CONFIG（consolidate_webpro_full.py）の data_start_row（5 / 8 / 9）・列位置は
+1つのテンプレート改訂（Rev.2）のもの。別の改訂のワークブックをそのまま読むと、
+行・列がずれたまま黙って誤読する。そこで様式ごとに見出し部分（データ開始行より上の行）の
+指紋（fingerprint）を取り、既知の改訂と照合して読み込み範囲（レイアウト）を決める。
+
+- 指紋 → レイアウトはプロセス内でキャッシュし、照合・検出は改訂（指紋）ごとに1回だけ行う
+  （2回目以降のワークブックは先頭の数行を読んで指紋を計算するだけ）
+- 未知の指紋は、見出し行の項目名（列定義書の説明・列名）から見出し行・列位置を求め、
+  既知の改訂のレイアウトと一致すればその改訂、一致しなければ検出したレイアウトを使う
+- 見出しを照合できない場合は既定の改訂のレイアウトで読み込み、警告を出す（指紋ごとに1回）
+
+レイアウトの状態（SheetLayout.status）:
+    known       既知の改訂と一致
+    detected    見出しから検出（既知の改訂と異なる）
+    unverified  見出しを照合できず、既定の改訂のレイアウトを使用
+
+使用例:
+    resolver = LayoutResolver({'Rev.2': SHEET_CONFIG})
+    header = reader.read_sheet('1) 室仕様', max_row=resolver.header_rows('room'))
+    layout = resolver.resolve('room', header)
+    config = layout.apply(SHEET_CONFIG['room'])
+"""
+
+import hashlib
+import json
+import math
+import unicodedata
+from collections import Counter
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from webpro_columns import get_column_spec
+
+# 見出し行の位置（data_start_row の4行前: Row5 項目名 / Row7 単位 / Row8 入力タイプ / Row9 データ）
+HEADER_ROW_OFFSET = 4
+# 見出し行として照合する行数（項目名が2行に分かれている場合、例: 室用途 / 大分類）
+HEADER_BAND_ROWS = 2
+# 既知の data_start_row より下に何行まで見出しを探すか
+HEADER_SCAN_MARGIN = 6
+# 見出し行とみなす、項目名が一致した列の割合
+MIN_HEADER_MATCH = 0.5
+
+LAYOUT_KNOWN = 'known'
+LAYOUT_DETECTED = 'detected'
+LAYOUT_UNVERIFIED = 'unverified'
+
+
+class SheetLayout(NamedTuple):
+    """様式シートの読み込み範囲"""
+    status: str
+    revision: Optional[str]
+    fingerprint: Optional[str]
+    data_start_row: int
+    col_mapping: Dict[int, str]
+
+    def apply(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """様式設定（SHEET_CONFIG の値）にこのレイアウトを適用した設定"""
+        if self.data_start_row == config['data_start_row'] and self.col_mapping == config['col_mapping']:
+            return config
+        return {**config, 'data_start_row': self.data_start_row, 'col_mapping': self.col_mapping}
+
+
+def normalize_label(value: Any) -> str:
+    """見出しセルの比較用の文字列（全角・半角を統一し、空白・改行を除く）"""
+    if value is None:
+        return ''
+    text = unicodedata.normalize('NFKC', str(value))
+    return ''.join(text.split())
+
+
+def header_fingerprint(rows: List[List[Any]], n_rows: int) -> str:
+    """先頭 n_rows 行（見出し部分）の指紋（値のあるセルの位置と正規化した値のハッシュ）"""
+    cells = [
+        [[pos, text] for pos, text in ((pos, normalize_label(value)) for pos, value in enumerate(row)) if text]
+        for row in rows[:n_rows]
+    ]
+    payload = json.dumps([n_rows, cells], ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def _header_cells(rows: List[List[Any]], header_row: int, band_rows: int = HEADER_BAND_ROWS) -> Dict[int, List[str]]:
+    """見出し行（header_row から band_rows 行）の列位置 → 項目名"""
+    cells: Dict[int, List[str]] = {}
+    for row in rows[header_row:header_row + band_rows]:
+        for pos, value in enumerate(row):
+            text = normalize_label(value)
+            if text:
+                cells.setdefault(pos, []).append(text)
+    return cells
+
+
+class LayoutResolver:
+    """
+    様式ごとのレイアウトを見出しの指紋で判定し、指紋ごとにキャッシュする
+
+    revisions は 改訂名 → SHEET_CONFIG 形式の様式設定（先頭を既定の改訂とする）。
+    シート名は既定の改訂のものを使う。
+    """
+
+    def __init__(self, revisions: Dict[str, Dict[str, Dict[str, Any]]]):
+        self.revisions = revisions
+        self.default_revision = next(iter(revisions))
+        self._layouts: Dict[Tuple[str, str], SheetLayout] = {}
+        # 様式 → 指紋を計算する見出しの行数（既知の改訂・検出したレイアウトの data_start_row）
+        self._windows: Dict[str, Set[int]] = {}
+        self._labels: Dict[str, Tuple[str, ...]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def cache_info(self) -> Dict[str, int]:
+        """キャッシュの状況（hits: 指紋が一致, misses: 照合・検出を実行, layouts: キャッシュ件数）"""
+        return {'hits': self.hits, 'misses': self.misses, 'layouts': len(self._layouts)}
+
+    def clear(self):
+        self._layouts.clear()
+        self._windows.clear()
+        self.hits = self.misses = 0
+
+    # ------------------------------------------------------------------
+    # 判定
+    # ------------------------------------------------------------------
+
+    def _header_windows(self, entity_type: str) -> Set[int]:
+        """様式の指紋を計算する見出しの行数の候補"""
+        windows = self._windows.get(entity_type)
+        if windows is None:
+            windows = self._windows[entity_type] = {
+                sheets[entity_type]['data_start_row']
+                for sheets in self.revisions.values() if entity_type in sheets
+            }
+        return windows
+
+    def header_rows(self, entity_type: str) -> int:
+        """判定に使う先頭の行数（この行数だけ全列を読んで resolve() に渡す）"""
+        return max(self._header_windows(entity_type)) + HEADER_SCAN_MARGIN
+
+    def resolve(self, entity_type: str, rows: List[List[Any]], file_name: str = '') -> SheetLayout:
+        """
+        様式 entity_type の見出し部分 rows（先頭 header_rows() 行）からレイアウトを判定
+
+        指紋がキャッシュにあればそのレイアウトを返し、なければ照合・検出してキャッシュする。
+        """
+        windows = self._header_windows(entity_type)
+        for n_rows in sorted(windows):
+            layout = self._layouts.get((entity_type, header_fingerprint(rows, n_rows)))
+            if layout is not None:
+                self.hits += 1
+                return layout
+
+        self.misses += 1
+        layout = self._match(entity_type, rows)
+        fingerprint = header_fingerprint(rows, layout.data_start_row)
+        layout = layout._replace(fingerprint=fingerprint)
+        windows.add(layout.data_start_row)
+        self._layouts[(entity_type, fingerprint)] = layout
+
+        sheet_name = self.revisions[self.default_revision][entity_type]['sheet_name']
+        if layout.status == LAYOUT_DETECTED:
+            print(f"Warning: {sheet_name}: 既知の改訂と異なるレイアウトを検出しました"
+                  f"（データ開始行 {layout.data_start_row + 1}、{len(layout.col_mapping)}列）: {file_name}", flush=True)
+        elif layout.status == LAYOUT_UNVERIFIED and any(rows):
+            print(f"Warning: {sheet_name}: 見出しを照合できません。"
+                  f"既定の改訂（{self.default_revision}）のレイアウトで読み込みます: {file_name}", flush=True)
+        return layout
+
+    def _match(self, entity_type: str, rows: List[List[Any]]) -> SheetLayout:
+        """見出しを既知の改訂と照合し、一致しなければ見出し行・列位置を検出する"""
+        # 既知の改訂: 見出し行の位置で、項目名が改訂どおりの列位置にあるか
+        for revision, sheets in self.revisions.items():
+            config = sheets.get(entity_type)
+            if config is None:
+                continue
+            col_mapping = config['col_mapping']
+            header_row = max(config['data_start_row'] - HEADER_ROW_OFFSET, 0)
+            matched = self._match_header(_header_cells(rows, header_row), list(col_mapping.values()))
+            in_place = sum(1 for name, pos in matched.items() if col_mapping.get(pos) == name)
+            if in_place >= self._required(col_mapping):
+                return SheetLayout(LAYOUT_KNOWN, revision, None, config['data_start_row'], col_mapping)
+
+        # 検出: 既定の改訂の列について、項目名の一致が最も多い行を見出し行とする
+        # （見出し行自体に項目名がある行のみ。空行を見出し行とするとデータ開始行が1行ずれる）
+        config = self.revisions[self.default_revision][entity_type]
+        col_mapping = config['col_mapping']
+        names = list(col_mapping.values())
+        best_row, best = None, {}
+        for row_idx in range(len(rows)):
+            if not self._match_header(_header_cells(rows, row_idx, 1), names):
+                continue
+            matched = self._match_header(_header_cells(rows, row_idx), names)
+            if len(matched) > len(best):
+                best_row, best = row_idx, matched
+        if best_row is None or len(best) < self._required(col_mapping):
+            return SheetLayout(LAYOUT_UNVERIFIED, self.default_revision, None, config['data_start_row'], col_mapping)
+
+        # 一致しなかった列は、一致した列で最も多いずれ幅だけ既定の位置からずらす
+        registered = {name: pos for pos, name in col_mapping.items()}
+        shift = Counter(pos - registered[name] for name, pos in best.items()).most_common(1)[0][0]
+        positions = dict(best)
+        used = set(positions.values())
+        for name in names:
+            if name not in positions and registered[name] + shift >= 0 and registered[name] + shift not in used:
+                positions[name] = registered[name] + shift
+                used.add(positions[name])
+        detected = {positions[name]: name for name in names if name in positions}
+        data_start_row = best_row + config['data_start_row'] - max(config['data_start_row'] - HEADER_ROW_OFFSET, 0)
+
+        for revision, sheets in self.revisions.items():
+            known = sheets.get(entity_type)
+            if known is not None and (known['data_start_row'], known['col_mapping']) == (data_start_row, detected):
+                return SheetLayout(LAYOUT_KNOWN, revision, None, data_start_row, known['col_mapping'])
+        return SheetLayout(LAYOUT_DETECTED, None, None, data_start_row, detected)
+
+    @staticmethod
+    def _required(col_mapping: Dict[int, str]) -> int:
+        return max(1, math.ceil(len(col_mapping) * MIN_HEADER_MATCH))
+
+    # ------------------------------------------------------------------
+    # 項目名の照合
+    # ------------------------------------------------------------------
+
+    def _column_labels(self, name: str) -> Tuple[str, ...]:
+        """列の項目名の候補（列定義書の説明・列名）"""
+        labels = self._labels.get(name)
+        if labels is None:
+            labels = self._labels[name] = tuple(
+                dict.fromkeys(label for label in (normalize_label(get_column_spec(name).label), name) if label)
+            )
+        return labels
+
+    def _match_header(self, cells: Dict[int, List[str]], names: List[str]) -> Dict[str, int]:
+        """見出しセル（列位置 → 項目名）と列の対応（列名 → 列位置）"""
+        matched: Dict[str, int] = {}
+        for pos in sorted(cells):
+            for text in cells[pos]:
+                name = self._match_label(text, names, matched)
+                if name is not None:
+                    matched[name] = pos
+                    break
+        return matched
+
+    def _match_label(self, text: str, names: List[str], matched: Dict[str, int]) -> Optional[str]:
+        """項目名 text に一致する未対応の列（完全一致を優先し、次に2文字以上の部分一致）"""
+        candidates = [name for name in names if name not in matched]
+        for name in candidates:
+            if text in self._column_labels(name):
+                return name
+        if len(text) >= 2:
+            for name in candidates:
+                if any(len(label) >= 2 and (label in text or text in label) for label in self._column_labels(name)):
+                    return name
+        return None
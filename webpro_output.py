@@ -0,0 +1,558 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WEBPRO統合データの出力形式
+
+統合データの書き出し処理（xlsx 以外の形式・正規化テーブル）をまとめる。
+
+parquet:
+    entity_type ごとに1パーティション（Hive形式のディレクトリ）を作成し、
+    共通列とそのデータ種別の列だけを型付きで保存する。
+
+        <output>/entity_type=room/part-0.parquet
+        <output>/entity_type=lighting/part-0.parquet
+        ...
+
+    読み込み例:
+        pd.read_parquet('webpro_all_data.parquet/entity_type=lighting')
+
+    列の型は全 part ファイル共通のスキーマ（to_arrow_table）で固定する。型宣言のある列
+    （webpro_schema.py の COLUMN_DTYPES）は宣言した型、それ以外の列は値が数字だけでも文字列
+    （part ごとに型を推論すると、追記した part と型が食い違って読み込めなくなるため）。
+
+    pyarrow が必要（pip install pyarrow）
+
+sqlite:
+    出力シート（またはテーブル）ごとに1テーブルの SQLite データベース。
+    file_id・entity_type・室用途（room_type）の列にインデックスを作成する。
+    追加パッケージは不要（標準ライブラリの sqlite3）。
+
+        sqlite3 webpro_all_data.sqlite "SELECT * FROM all_data WHERE file_id = 'B8b3bb7c12d'"
+
+正規化レイアウト（layout='normalized'）:
+    buildings テーブル（1建物1行）と entity_type ごとのテーブル（file_id で結合）。
+    xlsx はテーブルごとのシート、parquet は <output>/<テーブル名>/part-N.parquet、
+    sqlite はテーブルごとの SQLite テーブル。
+"""
+
+import os
+import shutil
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from webpro_schema import DECLARED_DTYPES, declared_column_dtypes
+
+OUTPUT_FORMATS = ('xlsx', 'parquet', 'sqlite')
+LAYOUTS = ('wide', 'normalized')
+
+# 値が数字だけでも文字列として保存する列（'001' 形式の file_id を数値にしない）
+TEXT_COLUMNS = ('file_id', 'entity_type')
+
+# 宣言した型に変換済みの数値列の型（webpro_schema.py）。保存時もこの型のまま残す
+TYPED_NUMERIC_DTYPES = ('float64', 'float32', 'Int64', 'Int32')
+
+# 室面積の列（SQLite では常に REAL で保存し、範囲検索用のインデックスを作成する）
+AREA_COLUMNS = ('room_area', '室面積')
+
+# 宣言した型 → SQLite の列の型（逐次書き出しのテーブル作成用）
+SQLITE_COLUMN_TYPES = {'float': 'REAL', 'int': 'INTEGER'}
+
+
+def require_pyarrow():
+    """pyarrow の有無を確認（なければ ImportError）"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ImportError("parquet 出力には pyarrow が必要です: pip install pyarrow") from e
+
+
+def coerce_column_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    object 列を SQLite 保存用の型に変換（数値列 → REAL、それ以外 → TEXT）
+
+    - 宣言した型に変換済みの数値列（TYPED_NUMERIC_DTYPES）→ そのまま
+    - 非空の値がすべて数値に変換できる列 → float64（整数も float64 に統一）
+    - それ以外の値がある列 → string
+    - 全て空の列 → そのまま
+    - TEXT_COLUMNS（file_id など）→ 常に string
+    categorical 列（展開済みの建物属性）は値に戻してから同様に変換する
+    （宣言した型の値の categorical はその型に戻す）。
+    """
+    df = df.copy()
+    for col in df.columns:
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            categories_dtype = str(series.cat.categories.dtype)
+            series = series.astype(categories_dtype if categories_dtype in TYPED_NUMERIC_DTYPES else object)
+            df[col] = series
+        if (col not in TEXT_COLUMNS and pd.api.types.is_numeric_dtype(series)
+                and not pd.api.types.is_bool_dtype(series)):
+            if str(series.dtype) not in TYPED_NUMERIC_DTYPES:
+                df[col] = series.astype('float64')
+            continue
+        non_null = series.notna()
+        if not non_null.any():
+            continue
+        numeric = pd.to_numeric(series, errors='coerce')
+        if col not in TEXT_COLUMNS and numeric[non_null].notna().all():
+            df[col] = numeric.astype('float64')
+        else:
+            df[col] = series.where(non_null, None).astype('string')
+    return df
+
+
+def partition_name(entity_type: str) -> str:
+    return f"entity_type={entity_type}"
+
+
+def partition_dir(output_dir: Union[str, Path], entity_type: str) -> Path:
+    return Path(output_dir) / partition_name(entity_type)
+
+
+def _staging_dir(output_dir: Path, append: bool) -> Path:
+    """書き込み先ディレクトリ（置き換え時は一時ディレクトリ）"""
+    if append:
+        target_dir = output_dir
+    else:
+        target_dir = output_dir.with_name(output_dir.name + '.tmp')
+        if target_dir.exists():
+            shutil.rmtree(target_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    return target_dir
+
+
+def _publish_dir(target_dir: Path, output_dir: Path):
+    """
+    一時ディレクトリを出力ディレクトリに置き換え
+
+    既存の出力は削除前に退避名へ rename する（出力ディレクトリがない時間は rename 2回の間だけ）。
+    """
+    if target_dir == output_dir:
+        return
+    old_dir = output_dir.with_name(output_dir.name + '.old')
+    if old_dir.exists():
+        shutil.rmtree(old_dir)
+    if output_dir.exists():
+        output_dir.rename(old_dir)
+    target_dir.rename(output_dir)
+    if old_dir.exists():
+        shutil.rmtree(old_dir)
+
+
+def parquet_schema(columns: List[str], downcast: bool = False):
+    """
+    parquet の列の型（pyarrow.Schema）
+
+    型宣言のある列は宣言した型（downcast=True の場合は float32 / Int32）、それ以外の列は文字列。
+    """
+    import pyarrow as pa
+
+    types = declared_column_dtypes(columns, downcast)
+    return pa.schema([
+        (col, pa.from_numpy_dtype(np.dtype(types[col].lower())) if col in types else pa.string())
+        for col in columns
+    ])
+
+
+def to_arrow_table(df: pd.DataFrame, downcast: bool = False):
+    """
+    DataFrame を parquet_schema() のスキーマの pyarrow.Table に変換
+
+    型宣言のある列は宣言した型に、それ以外の列は値を文字列に変換する（欠損は null）。
+    categorical 列（展開済みの建物属性）は値に戻してから変換する。
+    """
+    import pyarrow as pa
+
+    columns = list(df.columns)
+    types = declared_column_dtypes(columns, downcast)
+    df = df.copy()
+    for col in columns:
+        series = df[col]
+        if col in types:
+            if str(series.dtype) != types[col]:
+                df[col] = pd.to_numeric(series.astype(object), errors='coerce').astype(types[col])
+        else:
+            series = series.astype(object)
+            df[col] = series.where(series.notna(), None).map(lambda v: v if v is None else str(v))
+    # pandas のメタデータ付きで作成（Int64 などの列を pandas で読み戻したときに同じ型になる）
+    return pa.Table.from_pandas(df, schema=parquet_schema(columns, downcast), preserve_index=False)
+
+
+def _write_part(df: pd.DataFrame, part_dir: Path, downcast: bool = False):
+    """ディレクトリに次の番号の part ファイルとして書き出し（列の型は parquet_schema()）"""
+    import pyarrow.parquet as pq
+
+    part_dir.mkdir(parents=True, exist_ok=True)
+    part_index = len(list(part_dir.glob('part-*.parquet')))
+    pq.write_table(to_arrow_table(df, downcast), part_dir / f"part-{part_index}.parquet")
+
+
+def write_parquet_partitions(
+    df: pd.DataFrame,
+    output_dir: Union[str, Path],
+    entity_columns: Dict[str, List[str]],
+    common_columns: List[str],
+    append: bool = False,
+    extra_tables: Optional[Dict[str, pd.DataFrame]] = None,
+    downcast: bool = False
+) -> Dict[str, int]:
+    """
+    entity_type ごとのパーティションとして parquet 出力
+
+    append=False の場合は既存の出力ディレクトリを置き換える。
+    append=True の場合は各パーティションに新しい part ファイルを追加する
+    （既存の part ファイルは書き換えない）。
+    extra_tables（テーブル名 → DataFrame）はパーティションと同じ出力ディレクトリの
+    <テーブル名>/ に part ファイルとして書き出す。
+    列の型は parquet_schema()（downcast は宣言した型の数値列を float32 / Int32 にするか）。
+    戻り値は entity_type ごとの書き出し行数。
+    """
+    require_pyarrow()
+    output_dir = Path(output_dir)
+    base_columns = [col for col in common_columns if col != 'entity_type']
+    target_dir = _staging_dir(output_dir, append)
+
+    written = {}
+    for entity_type, group in df.groupby('entity_type', sort=False):
+        columns = base_columns + entity_columns[entity_type]
+        _write_part(group[columns].reset_index(drop=True), partition_dir(target_dir, entity_type), downcast)
+        written[entity_type] = len(group)
+    for name, table in (extra_tables or {}).items():
+        if not table.empty:
+            _write_part(table, target_dir / name, downcast)
+
+    _publish_dir(target_dir, output_dir)
+    return written
+
+
+def write_tables_parquet(
+    tables: Dict[str, pd.DataFrame],
+    output_dir: Union[str, Path],
+    append: bool = False,
+    downcast: bool = False
+):
+    """
+    正規化テーブルを <output>/<テーブル名>/part-N.parquet として出力
+
+    append=True の場合は各テーブルに新しい part ファイルを追加する（空のテーブルは追加しない）。
+    列の型は parquet_schema()。
+    """
+    require_pyarrow()
+    output_dir = Path(output_dir)
+    target_dir = _staging_dir(output_dir, append)
+
+    for name, table in tables.items():
+        if append and table.empty:
+            continue
+        _write_part(table, target_dir / name, downcast)
+
+    _publish_dir(target_dir, output_dir)
+
+
+def write_tables_xlsx(
+    tables: Dict[str, pd.DataFrame],
+    output_path: Union[str, Path],
+    append: bool = False
+):
+    """
+    正規化テーブルをテーブルごとのシートとして xlsx 出力
+
+    append=True の場合は既存シートの末尾に行を追加する（シートがなければ作成）。
+    どちらの場合も一時ファイルに書き出してから出力パスを置き換える
+    （追記時は既存ファイルの複製に追記する。保存中に失敗しても既存の出力は壊れない）。
+    """
+    output_path = Path(output_path)
+    tmp_path = _temp_path(output_path)
+    try:
+        if not append:
+            with pd.ExcelWriter(tmp_path, engine='openpyxl') as writer:
+                for name, table in tables.items():
+                    table.to_excel(writer, sheet_name=name, index=False)
+        else:
+            shutil.copyfile(output_path, tmp_path)
+            with pd.ExcelWriter(tmp_path, engine='openpyxl', mode='a', if_sheet_exists='overlay') as writer:
+                for name, table in tables.items():
+                    if table.empty:
+                        continue
+                    if name in writer.sheets:
+                        table.to_excel(writer, sheet_name=name, index=False, header=False,
+                                       startrow=writer.sheets[name].max_row)
+                    else:
+                        table.to_excel(writer, sheet_name=name, index=False)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, output_path)
+
+
+def read_parquet_file_ids(output_dir: Union[str, Path]) -> List[str]:
+    """parquet 出力（またはそのテーブル）に含まれる file_id 一覧"""
+    require_pyarrow()
+    df = pd.read_parquet(output_dir, columns=['file_id'])
+    return list(df['file_id'].dropna().astype(str).unique())
+
+
+# =============================================================================
+# SQLite 出力
+# =============================================================================
+
+def sqlite_index_columns(columns: Iterable[str]) -> List[str]:
+    """インデックスを作成する列（file_id・entity_type・室用途・室面積の列）"""
+    return [
+        col for col in columns
+        if col in ('file_id', 'entity_type') or col in AREA_COLUMNS or 'room_type' in col or '室用途' in col
+    ]
+
+
+def sqlite_column_type(col: str) -> str:
+    """列の SQLite の型（室面積・型宣言のある数値列は REAL / INTEGER、それ以外は宣言しない）"""
+    if col in AREA_COLUMNS:
+        return 'REAL'
+    return SQLITE_COLUMN_TYPES.get(DECLARED_DTYPES.get(col), '')
+
+
+def _quote(name: str) -> str:
+    """SQL 識別子のクォート"""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _unique_columns(columns: Iterable[str]) -> List[str]:
+    """重複する列名に _2, _3, ... を付けて一意にする（SQLite は列名の重複不可）"""
+    seen: Dict[str, int] = {}
+    unique = []
+    for col in map(str, columns):
+        seen[col] = seen.get(col, 0) + 1
+        unique.append(col if seen[col] == 1 else f"{col}_{seen[col]}")
+    return unique
+
+
+def _create_indexes(conn: sqlite3.Connection, name: str, columns: Iterable[str]):
+    for col in sqlite_index_columns(columns):
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {_quote(f'idx_{name}_{col}')} ON {_quote(name)} ({_quote(col)})"
+        )
+
+
+def write_tables_sqlite(
+    tables: Dict[str, pd.DataFrame],
+    output_path: Union[str, Path],
+    append: bool = False
+):
+    """
+    テーブルごとに SQLite テーブルとして出力（インデックス付き）
+
+    列の型は数値列 → REAL、それ以外 → TEXT（室面積の列は数値に変換できない値を NULL にして常に REAL）。
+    append=False の場合は一時ファイルに書き出してから出力パスを置き換える。
+    append=True の場合は既存テーブルに行を追加する（テーブルがなければ作成）。
+    """
+    output_path = Path(output_path)
+    target_path = output_path if append else _temp_path(output_path)
+    if not append and target_path.exists():
+        target_path.unlink()
+
+    conn = sqlite3.connect(target_path)
+    try:
+        for name, table in tables.items():
+            if append and table.empty:
+                continue
+            table = table.set_axis(_unique_columns(table.columns), axis=1)
+            for col in table.columns.intersection(AREA_COLUMNS):
+                if not pd.api.types.is_float_dtype(table[col]):
+                    table[col] = pd.to_numeric(table[col].astype(object), errors='coerce').astype('float64')
+            table = coerce_column_dtypes(table)
+            table.to_sql(name, conn, if_exists='append', index=False, chunksize=10000)
+            _create_indexes(conn, name, table.columns)
+        conn.commit()
+    finally:
+        conn.close()
+
+    if not append:
+        os.replace(target_path, output_path)
+
+
+def read_sqlite_file_ids(output_path: Union[str, Path], table: str) -> List[str]:
+    """SQLite 出力のテーブルに含まれる file_id 一覧"""
+    conn = sqlite3.connect(output_path)
+    try:
+        rows = conn.execute(
+            f"SELECT DISTINCT file_id FROM {_quote(table)} WHERE file_id IS NOT NULL"
+        ).fetchall()
+    finally:
+        conn.close()
+    return [str(file_id) for file_id, in rows]
+
+
+# =============================================================================
+# 逐次書き出し（ストリーミング）
+# =============================================================================
+
+def _temp_path(output_path: Path) -> Path:
+    return output_path.with_name(f"{output_path.stem}.tmp{output_path.suffix}")
+
+
+class XlsxStreamWriter:
+    """
+    xlsx の逐次書き出し（openpyxl の write-only モード）
+
+    行は追加した時点でシートごとの一時ファイルへ書き出されるため、
+    全行を DataFrame として保持する必要がない。
+    一時ファイル名で保存し、close() で出力パスに置き換える。
+    """
+
+    def __init__(self, output_path: Union[str, Path], sheet_columns: Dict[str, List[str]]):
+        from openpyxl import Workbook
+
+        self.output_path = Path(output_path)
+        self._columns = sheet_columns
+        self._wb = Workbook(write_only=True)
+        self._sheets = {}
+        for name, columns in sheet_columns.items():
+            ws = self._wb.create_sheet(name)
+            ws.append(columns)
+            self._sheets[name] = ws
+
+    def write(self, name: str, df: pd.DataFrame):
+        values = df.reindex(columns=self._columns[name]).astype(object)
+        values = values.where(values.notna(), None)
+        ws = self._sheets[name]
+        for row in values.itertuples(index=False, name=None):
+            ws.append(row)
+
+    def close(self):
+        tmp_path = _temp_path(self.output_path)
+        self._wb.save(tmp_path)
+        os.replace(tmp_path, self.output_path)
+
+    def abort(self):
+        self._wb.close()
+
+
+class ParquetStreamWriter:
+    """
+    parquet の逐次書き出し（テーブルごとに pyarrow.parquet.ParquetWriter）
+
+    行はテーブルごとに row_group_rows 行までバッファしてから row group として
+    書き出す。列の型はバッチ書き出しと同じ parquet_schema()（型宣言のある列は宣言した型、
+    それ以外の列は文字列、downcast=True の場合は float32 / Int32）。
+    テーブル名は出力ディレクトリ内のサブディレクトリ名
+    （'entity_type=room' や 'buildings'）で、各テーブルに part ファイルを1つ作る。
+    """
+
+    def __init__(
+        self,
+        output_dir: Union[str, Path],
+        table_columns: Dict[str, List[str]],
+        append: bool = False,
+        row_group_rows: int = 50000,
+        downcast: bool = False
+    ):
+        require_pyarrow()
+
+        self.output_dir = Path(output_dir)
+        self._append = append
+        self._target_dir = _staging_dir(self.output_dir, append)
+        self._row_group_rows = row_group_rows
+        self._columns = table_columns
+        self._downcast = downcast
+        self._buffers: Dict[str, List[pd.DataFrame]] = {name: [] for name in table_columns}
+        self._buffered_rows = {name: 0 for name in table_columns}
+        self._writers = {}
+
+    def write(self, name: str, df: pd.DataFrame):
+        if df.empty:
+            return
+        self._buffers[name].append(df.reindex(columns=self._columns[name]))
+        self._buffered_rows[name] += len(df)
+        if self._buffered_rows[name] >= self._row_group_rows:
+            self._flush(name)
+
+    def _flush(self, name: str):
+        import pyarrow.parquet as pq
+
+        if not self._buffers[name]:
+            return
+        table = to_arrow_table(pd.concat(self._buffers[name], ignore_index=True), self._downcast)
+
+        if name not in self._writers:
+            part_dir = self._target_dir / name
+            part_dir.mkdir(parents=True, exist_ok=True)
+            part_index = len(list(part_dir.glob('part-*.parquet')))
+            # 型付きの列を pandas で読み戻したときに Int64 などになるよう、pandas のメタデータ付きのスキーマで作成
+            self._writers[name] = pq.ParquetWriter(part_dir / f"part-{part_index}.parquet", table.schema)
+        self._writers[name].write_table(table)
+
+        self._buffers[name] = []
+        self._buffered_rows[name] = 0
+
+    def close(self):
+        for name in self._columns:
+            self._flush(name)
+        for writer in self._writers.values():
+            writer.close()
+        _publish_dir(self._target_dir, self.output_dir)
+
+    def abort(self):
+        for writer in self._writers.values():
+            writer.close()
+        if not self._append and self._target_dir.exists():
+            shutil.rmtree(self._target_dir)
+
+
+class SqliteStreamWriter:
+    """
+    SQLite の逐次書き出し
+
+    テーブルは室面積・型宣言のある数値列だけ型（REAL / INTEGER）を宣言して作成し、
+    値は抽出した型のまま保存する。
+    インデックスは全行の挿入後に close() で作成する（挿入ごとの索引更新を避ける）。
+    append=False の場合は一時ファイルに書き出し、close() で出力パスに置き換える。
+    """
+
+    def __init__(
+        self,
+        output_path: Union[str, Path],
+        table_columns: Dict[str, List[str]],
+        append: bool = False
+    ):
+        self.output_path = Path(output_path)
+        self._append = append
+        self._target_path = self.output_path if append else _temp_path(self.output_path)
+        if not append and self._target_path.exists():
+            self._target_path.unlink()
+        self._columns = table_columns
+        self._conn = sqlite3.connect(self._target_path)
+        self._inserts = {}
+        for name, columns in table_columns.items():
+            quoted = [_quote(col) for col in _unique_columns(columns)]
+            definitions = [
+                f"{quoted_col} {sqlite_column_type(col)}".rstrip() for col, quoted_col in zip(columns, quoted)
+            ]
+            self._conn.execute(f"CREATE TABLE IF NOT EXISTS {_quote(name)} ({', '.join(definitions)})")
+            self._inserts[name] = (
+                f"INSERT INTO {_quote(name)} ({', '.join(quoted)}) VALUES ({', '.join('?' * len(quoted))})"
+            )
+
+    def write(self, name: str, df: pd.DataFrame):
+        if df.empty:
+            return
+        values = df.reindex(columns=self._columns[name]).astype(object)
+        values = values.where(values.notna(), None)
+        self._conn.executemany(self._inserts[name], values.itertuples(index=False, name=None))
+
+    def close(self):
+        for name, columns in self._columns.items():
+            _create_indexes(self._conn, name, _unique_columns(columns))
+        self._conn.commit()
+        self._conn.close()
+        if not self._append:
+            os.replace(self._target_path, self.output_path)
+
+    def abort(self):
+        self._conn.rollback()
+        self._conn.close()
+        if not self._append and self._target_path.exists():
+            self._target_path.unlink()
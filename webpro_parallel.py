@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WEBPROファイル処理の並列実行ヘルパー
+
+ファイル単位の処理をプロセスプールで並列実行し、結果は入力順に返す。
+そのため並列実行しても出力はシリアル実行と同一になる。
+
+プールは呼び出しごとに作成する。常駐モード（--watch）のように繰り返し実行する場合は
+create_pool() で作成したプールを executor として渡し、ワーカープロセス
+（インポート済みのモジュール・レイアウト等のプロセス内キャッシュ）を使い回す。
+"""
+
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """ワーカー数を決定（0 または None は CPU コア数）"""
+    if not workers:
+        return os.cpu_count() or 1
+    return max(1, workers)
+
+
+def create_pool(workers: int) -> Optional[ProcessPoolExecutor]:
+    """繰り返し使うプロセスプール（workers <= 1 の場合は None = 現在のプロセスで順次実行）"""
+    return ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+
+def imap_ordered(
+    func: Callable[..., Any],
+    tasks: Iterable[Tuple],
+    workers: int = 1,
+    executor: Optional[Executor] = None,
+) -> Iterator[Tuple[Tuple, Any, Optional[BaseException]]]:
+    """
+    func(*task) を各タスクに適用し、(task, 結果, 例外) を入力順に返す
+
+    - workers <= 1 の場合は現在のプロセスで順次実行
+    - executor を渡した場合はそのプールで実行し、終了後もシャットダウンしない
+    - 実行中タスク数は workers * 2 までに制限（結果が溜まり続けないように）
+    - タスク内の例外は送出せず、3番目の要素として返す
+      （ワーカープロセスの異常終了でプールが使えなくなった場合は BrokenProcessPool を送出）
+    """
+    if executor is not None:
+        yield from _imap_executor(executor, func, tasks, max(workers, 1))
+        return
+
+    if workers <= 1:
+        for task in tasks:
+            try:
+                yield task, func(*task), None
+            except Exception as e:
+                yield task, None, e
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from _imap_executor(executor, func, tasks, workers)
+
+
+def _imap_executor(
+    executor: Executor,
+    func: Callable[..., Any],
+    tasks: Iterable[Tuple],
+    workers: int,
+) -> Iterator[Tuple[Tuple, Any, Optional[BaseException]]]:
+    task_iter = iter(tasks)
+    pending = deque()
+
+    def submit_next() -> bool:
+        for task in task_iter:
+            pending.append((task, executor.submit(func, *task)))
+            return True
+        return False
+
+    try:
+        for _ in range(workers * 2):
+            if not submit_next():
+                break
+
+        while pending:
+            task, future = pending.popleft()
+            try:
+                result, error = future.result(), None
+            except BrokenProcessPool:
+                raise
+            except Exception as e:
+                result, error = None, e
+            submit_next()
+            yield task, result, error
+    finally:
+        # 途中で中断された場合、未開始のタスクを取り消す（使い回すプールに残さない）
+        for _, future in pending:
+            future.cancel()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+統合処理のプロファイル（--profile）
+
+ファイルごと・様式（SHEET_CONFIG のシート）ごと・処理段階ごとの経過時間と
+メモリ割り当て量（tracemalloc）を記録し、JSON のレポートとして書き出す。
+本番の実行で時間のかかっているテンプレート・ワークブックを特定するため。
+
+- ファイル・様式ごとの計測は抽出を実行したプロセス（並列時はワーカー）内で行う
+- 段階（phase）: hash / extract / extract_basic_info / read_sheets / dataframe_build / output_write
+- メモリは tracemalloc で計測するため、プロファイル時は処理が遅くなる
+  （並列実行時、段階ごとのメモリは親プロセスの割り当てのみ）
+
+レポートの構成:
+    run             実行条件・全体の経過時間・ピーク割り当て量
+    phases          段階ごとの合計（seconds / alloc_bytes / peak_bytes / calls）
+    sheets          様式ごとの集計（合計・平均・最大時間、行数）
+    slowest_files   時間のかかったファイル（上位 top_n 件）
+    slowest_sheets  時間のかかったファイル × 様式（上位 top_n 件）
+    files           ファイルごとの詳細（基本情報・各様式の計測値）
+"""
+
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+# 計測中の区間（入れ子の区間でも外側のピーク割り当て量を保つため）
+_active_measures: List['_Measure'] = []
+
+# 区間の開始時に reset_peak() で捨てたピーク割り当て量の最大（実行全体のピークのため）
+_reset_peak_max = 0
+
+
+def _reset_peak(peak: int):
+    """tracemalloc のピークをリセット（リセット前のピーク peak は実行全体のピークとして保つ）"""
+    global _reset_peak_max
+    _reset_peak_max = max(_reset_peak_max, peak)
+    tracemalloc.reset_peak()
+
+
+def traced_peak() -> int:
+    """tracemalloc の開始以降のピーク割り当て量（区間の開始時のリセットをまたいだ最大）"""
+    return max(_reset_peak_max, tracemalloc.get_traced_memory()[1])
+
+
+class _Measure:
+    """1区間の経過時間・割り当て量（tracemalloc が有効な場合）"""
+
+    __slots__ = ('trace', 'start', 'mem_start', 'child_peak', 'seconds', 'alloc_bytes', 'peak_bytes')
+
+    def __init__(self):
+        self.trace = tracemalloc.is_tracing()
+        self.seconds = 0.0
+        self.alloc_bytes = None
+        self.peak_bytes = None
+
+    def __enter__(self) -> '_Measure':
+        if self.trace:
+            current, peak = tracemalloc.get_traced_memory()
+            if _active_measures:
+                parent = _active_measures[-1]
+                parent.child_peak = max(parent.child_peak, peak)
+            _reset_peak(peak)
+            self.mem_start = self.child_peak = current
+        _active_measures.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.seconds = time.perf_counter() - self.start
+        _active_measures.pop()
+        if self.trace:
+            current, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, self.child_peak)
+            self.alloc_bytes = current - self.mem_start
+            self.peak_bytes = peak - self.mem_start
+            if _active_measures:
+                parent = _active_measures[-1]
+                parent.child_peak = max(parent.child_peak, peak)
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'seconds': self.seconds, 'alloc_bytes': self.alloc_bytes, 'peak_bytes': self.peak_bytes}
+
+
+def _start_tracing(trace_memory: bool) -> bool:
+    """tracemalloc を開始（このモジュールで開始した場合 True）"""
+    global _reset_peak_max
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _reset_peak_max = 0
+        return True
+    return False
+
+
+# ============================================
+# ファイル単位
+# ============================================
+
+class FileProfiler:
+    """
+    1ファイルの抽出の計測（extract_file の profile 引数に渡す）
+
+    stage() の区間を名前ごとに記録し、to_dict() で辞書（pickle 可能）にする。
+    """
+
+    def __init__(self, trace_memory: bool = True):
+        self._started_tracing = _start_tracing(trace_memory)
+        self._total = _Measure()
+        self.stages: Dict[str, Dict[str, Any]] = {}
+
+    @contextmanager
+    def total(self) -> Iterator[None]:
+        """ファイル全体の区間"""
+        try:
+            with self._total:
+                yield
+        finally:
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+    @contextmanager
+    def stage(self, key: str, **labels: Any) -> Iterator[Dict[str, Any]]:
+        """
+        区間 key の計測（yield した辞書に rows などを追加できる）
+        """
+        info = dict(labels)
+        measure = _Measure()
+        with measure:
+            yield info
+        info.update(measure.to_dict())
+        self.stages[key] = info
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = self._total.to_dict()
+        result['stages'] = self.stages
+        return result
+
+
+class _NullFileProfiler:
+    """プロファイルしない場合の FileProfiler（何も記録しない）"""
+
+    @contextmanager
+    def stage(self, key: str, **labels: Any) -> Iterator[Dict[str, Any]]:
+        yield {}
+
+
+NULL_FILE_PROFILER = _NullFileProfiler()
+
+
+# ============================================
+# 実行全体
+# ============================================
+
+class RunProfiler:
+    """統合処理全体の計測とレポート作成"""
+
+    def __init__(self, trace_memory: bool = True, top_n: int = 10):
+        self.top_n = top_n
+        self.started_at = datetime.now().astimezone().isoformat(timespec='seconds')
+        self._start = time.perf_counter()
+        self._started_tracing = _start_tracing(trace_memory)
+        self.trace_memory = tracemalloc.is_tracing()
+        self.phases: Dict[str, Dict[str, Any]] = {}
+        self.files: List[Dict[str, Any]] = []
+
+    def _add_phase(self, name: str, measure: Dict[str, Any]):
+        phase = self.phases.setdefault(name, {'seconds': 0.0, 'alloc_bytes': None, 'peak_bytes': None, 'calls': 0})
+        phase['seconds'] += measure['seconds']
+        phase['calls'] += 1
+        if measure['alloc_bytes'] is not None:
+            phase['alloc_bytes'] = (phase['alloc_bytes'] or 0) + measure['alloc_bytes']
+            phase['peak_bytes'] = max(phase['peak_bytes'] or 0, measure['peak_bytes'])
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """段階 name の区間（同じ段階の複数回の区間は合計する）"""
+        measure = _Measure()
+        try:
+            with measure:
+                yield
+        finally:
+            self._add_phase(name, measure.to_dict())
+
+    def iter_phase(self, name: str, iterable: Iterable) -> Iterator:
+        """iterable の各要素の取り出しを段階 name として計測しながら返す"""
+        iterator = iter(iterable)
+        while True:
+            with self.phase(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def add_file(
+        self,
+        file_name: str,
+        file_profile: Optional[Dict[str, Any]] = None,
+        cached: bool = False,
+        error: Optional[BaseException] = None
+    ):
+        """ファイルの計測結果（FileProfiler.to_dict()）を追加"""
+        entry = {'file': file_name, 'cached': cached}
+        if error is not None:
+            entry['error'] = str(error)
+        if file_profile is not None:
+            entry.update(file_profile)
+            stages = entry.pop('stages', {})
+            if 'basic_info' in stages:
+                entry['basic_info'] = stages.pop('basic_info')
+                self._add_phase('extract_basic_info', entry['basic_info'])
+            entry['sheets'] = stages
+            for sheet in stages.values():
+                self._add_phase('read_sheets', sheet)
+        self.files.append(entry)
+
+    def _sheet_summary(self) -> Dict[str, Dict[str, Any]]:
+        summary: Dict[str, Dict[str, Any]] = {}
+        for entry in self.files:
+            for key, sheet in entry.get('sheets', {}).items():
+                item = summary.setdefault(key, {
+                    'sheet_name': sheet.get('sheet_name'), 'files': 0, 'rows': 0,
+                    'seconds': 0.0, 'max_seconds': 0.0, 'alloc_bytes': None,
+                })
+                item['files'] += 1
+                item['rows'] += sheet.get('rows', 0)
+                item['seconds'] += sheet['seconds']
+                item['max_seconds'] = max(item['max_seconds'], sheet['seconds'])
+                if sheet['alloc_bytes'] is not None:
+                    item['alloc_bytes'] = (item['alloc_bytes'] or 0) + sheet['alloc_bytes']
+        for item in summary.values():
+            item['mean_seconds'] = item['seconds'] / item['files']
+        return dict(sorted(summary.items(), key=lambda kv: kv[1]['seconds'], reverse=True))
+
+    def report(self, **run_info: Any) -> Dict[str, Any]:
+        """レポート（JSON にできる辞書）"""
+        run = dict(run_info)
+        run.update({
+            'started_at': self.started_at,
+            'wall_seconds': time.perf_counter() - self._start,
+            'files': len(self.files),
+            'trace_memory': self.trace_memory,
+            'peak_traced_bytes': traced_peak() if self.trace_memory else None,
+            'pid': os.getpid(),
+        })
+        measured = [entry for entry in self.files if 'seconds' in entry]
+        slowest_files = sorted(measured, key=lambda entry: entry['seconds'], reverse=True)[:self.top_n]
+        sheet_runs = [
+            {'file': entry['file'], 'entity_type': key, **sheet}
+            for entry in measured for key, sheet in entry.get('sheets', {}).items()
+        ]
+        slowest_sheets = sorted(sheet_runs, key=lambda sheet: sheet['seconds'], reverse=True)[:self.top_n]
+        return {
+            'run': run,
+            'phases': self.phases,
+            'sheets': self._sheet_summary(),
+            'slowest_files': [
+                {key: entry.get(key) for key in ('file', 'seconds', 'alloc_bytes', 'peak_bytes', 'cached')}
+                for entry in slowest_files
+            ],
+            'slowest_sheets': slowest_sheets,
+            'files': self.files,
+        }
+
+    def write(self, report_path: str, **run_info: Any) -> Path:
+        """レポートを JSON で書き出し、tracemalloc を停止（このプロファイラで開始した場合）"""
+        report = self.report(**run_info)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        report_path = Path(report_path)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = report_path.with_name(report_path.name + '.tmp')
+        tmp_path.write_text(json.dumps(report, ensure_ascii=False, indent=2, default=str), encoding='utf-8')
+        os.replace(tmp_path, report_path)
+        return report_path
+
+
+def profile_phase(profiler: Optional[RunProfiler], name: str):
+    """profiler.phase(name)（profiler が None の場合は何もしない）"""
+    return nullcontext() if profiler is None else profiler.phase(name)
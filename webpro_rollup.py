@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+建物ごとの集計テーブル（building_summary）
+
+建物ごとの延床面積・室数・照明電力密度などは、出力を使う側が毎回 entity_type ごとの
+シートを file_id で groupby して求めていた。ここでは統合時に、型変換済みの正規化テーブル
+（build_normalized_tables の戻り値）がメモリ上にある間に集計し、1建物1行の小さなテーブルとして
+出力する。file_id → 建物位置の照合はテーブルごとに1回だけ行い、合計は np.bincount で求める。
+
+集計列（SUMMARY_COLUMNS）:
+    total_floor_area           室面積の合計（㎡、room）
+    ac_floor_area              空調計算対象室の室面積の合計（㎡、room_is_ac_target が AC_TARGET_VALUES）
+    room_count                 室数（room の行数）
+    lighting_power             照明器具の消費電力の合計（W、lt_fixture_power × lt_fixture_count）
+    lighting_power_density     照明電力密度（W/㎡、lighting_power / total_floor_area）
+    hs_cooling_capacity_total  熱源の定格冷却能力の合計（kW、hs_cooling_capacity × hs_cooling_count）
+    hs_heating_capacity_total  熱源の定格加熱能力の合計（kW、hs_heating_capacity × hs_heating_count）
+    ahu_count                  空調機の台数の合計（ahu_count）
+    fan_count                  換気送風機の台数（vent_fan の行数、台数の列がないため1行1台）
+    elevator_count             昇降機の台数の合計（ev_count）
+    pv_capacity_total          太陽光発電のシステム容量の合計（kW、pv_capacity）
+
+- 台数の列が空欄の行は、能力・消費電力・台数のいずれも1台として数える
+- 照明電力密度の分母は室仕様の室面積の合計（列定義書の LPD の計算例と同じ）。照明の
+  lt_room_area は器具の行ごとに室面積が繰り返し記入されるため、合計すると1室に複数の器具
+  がある室の面積を重複して数える
+- 該当する行がない建物は合計・台数を 0、照明電力密度（室面積の合計が 0）を欠損とする
+- 建物ごとに独立した集計のため、追記・逐次出力では追加した建物の行だけを書き出せばよい
+
+使用例:
+    tables = build_normalized_tables(extracted)
+    summary = building_summary(tables)
+"""
+
+from typing import Callable, Dict
+
+import numpy as np
+import pandas as pd
+
+from webpro_schema import COLUMN_DTYPES, coerce_frame
+
+SUMMARY_TABLE = 'building_summary'
+
+SUMMARY_COLUMNS = [
+    'file_id',
+    'building_name',
+    'total_floor_area',
+    'ac_floor_area',
+    'room_count',
+    'lighting_power',
+    'lighting_power_density',
+    'hs_cooling_capacity_total',
+    'hs_heating_capacity_total',
+    'ahu_count',
+    'fan_count',
+    'elevator_count',
+    'pv_capacity_total',
+]
+
+# 空調計算対象室とみなす値（WEBPRO の選択肢「■」、有/無 形式の入力など）
+AC_TARGET_VALUES = ('■', '有', '○', '〇', '対象')
+
+
+def _numeric(table: pd.DataFrame, col: str) -> pd.Series:
+    """数値列を float64 で取り出す（float32 / Int 型の欠損は NaN）"""
+    return pd.to_numeric(table[col], errors='coerce').astype('float64')
+
+
+def _units(table: pd.DataFrame, col: str) -> pd.Series:
+    """台数の列（空欄は1台）"""
+    return _numeric(table, col).fillna(1.0)
+
+
+def _sum_by_building(positions: np.ndarray, values: pd.Series, n_buildings: int) -> np.ndarray:
+    """建物位置ごとの合計（欠損・buildings にない file_id の行は除く、行がない建物は 0）"""
+    values = values.to_numpy(dtype='float64', na_value=np.nan)
+    keep = (positions >= 0) & ~np.isnan(values)
+    return np.bincount(positions[keep], weights=values[keep], minlength=n_buildings)
+
+
+def _rows(table: pd.DataFrame) -> pd.Series:
+    return pd.Series(1.0, index=table.index)
+
+
+def _ac_floor_area(room: pd.DataFrame) -> pd.Series:
+    is_target = room['room_is_ac_target'].astype('string').str.strip().isin(AC_TARGET_VALUES)
+    return _numeric(room, 'room_area').where(is_target.to_numpy(dtype=bool), 0.0)
+
+
+def building_summary(
+    tables: Dict[str, pd.DataFrame],
+    downcast: bool = False
+) -> pd.DataFrame:
+    """
+    正規化テーブル（buildings + entity_type ごと）から建物ごとの集計テーブルを作成
+
+    行は buildings の順で1建物1行。列の型は COLUMN_DTYPES['building_summary']
+    （downcast=True の場合は float32 / Int32）。
+    """
+    buildings = tables['buildings']
+    file_ids = pd.Index(buildings['file_id'])
+    # テーブルごとの行 → 建物位置（file_id の照合はテーブルごとに1回だけ）
+    positions: Dict[str, np.ndarray] = {}
+
+    def total(entity_type: str, values: Callable[[pd.DataFrame], pd.Series]) -> np.ndarray:
+        table = tables[entity_type]
+        if table.empty:
+            return np.zeros(len(file_ids))
+        if entity_type not in positions:
+            positions[entity_type] = file_ids.get_indexer(table['file_id'])
+        return _sum_by_building(positions[entity_type], values(table), len(file_ids))
+
+    floor_area = total('room', lambda t: _numeric(t, 'room_area'))
+    lighting_power = total('lighting', lambda t: _numeric(t, 'lt_fixture_power') * _units(t, 'lt_fixture_count'))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lighting_density = np.where(floor_area > 0, lighting_power / floor_area, np.nan)
+
+    summary = pd.DataFrame({
+        'file_id': buildings['file_id'].to_numpy(),
+        'building_name': buildings['building_name'].to_numpy(),
+        'total_floor_area': floor_area,
+        'ac_floor_area': total('room', _ac_floor_area),
+        'room_count': total('room', _rows),
+        'lighting_power': lighting_power,
+        'lighting_power_density': lighting_density,
+        'hs_cooling_capacity_total': total(
+            'heatsource', lambda t: _numeric(t, 'hs_cooling_capacity') * _units(t, 'hs_cooling_count')
+        ),
+        'hs_heating_capacity_total': total(
+            'heatsource', lambda t: _numeric(t, 'hs_heating_capacity') * _units(t, 'hs_heating_count')
+        ),
+        'ahu_count': total('ahu', lambda t: _units(t, 'ahu_count')),
+        'fan_count': total('vent_fan', _rows),
+        'elevator_count': total('elevator', lambda t: _units(t, 'ev_count')),
+        'pv_capacity_total': total('pv', lambda t: _numeric(t, 'pv_capacity')),
+    }, columns=SUMMARY_COLUMNS)
+    return coerce_frame(summary, COLUMN_DTYPES[SUMMARY_TABLE], downcast)
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+様式ごとの列の型（スキーマ）と値の一括変換
+
+抽出した値はセルの値のまま（object: 文字列・数値の混在）で、数値列を使う側が
+毎回 pd.to_numeric を繰り返すことになる。ここでは様式（列グループ）ごとに列の型を
+宣言し、統合テーブルの作成時に列単位で1回だけベクトル化して変換する。
+
+- 型は列定義書（webpro_complete_column_definition.md）の float / int に合わせる
+  （宣言のない列は str として値をそのまま保持する）
+- float → float64、int → Int64（欠損を保持できる整数型）。downcast=True の場合は float32 / Int32
+- 全角数字・桁区切りのカンマ・前後の空白は変換前に取り除く
+- 空白のセルは欠損とし、変換できない値（'-' や 'なし' など）は欠損にしたうえで
+  CoercionReport に (テーブル, 列, file_id) ごとの件数と値の例としてまとめて記録する
+
+使用例:
+    report = CoercionReport()
+    room = coerce_frame(room, COLUMN_DTYPES['room'], downcast=True, report=report, table='room')
+    report.print_summary()
+    report.write('coercion_report.csv')
+"""
+
+import csv
+import json
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from webpro_columns import get_column_spec
+from webpro_layout import normalize_label
+
+NUMERIC_DTYPES = ('float', 'int')
+
+# 値の例として記録する件数（テーブル・列・file_id ごと）
+MAX_EXAMPLES = 5
+
+
+def _group(float: Iterable[str] = (), int: Iterable[str] = ()) -> Dict[str, str]:
+    """列グループの型宣言（列名 → 'float' / 'int'）"""
+    return {**{col: 'float' for col in float}, **{col: 'int' for col in int}}
+
+
+# =============================================================================
+# 型宣言（様式・テーブルごと、列定義書の型）
+# =============================================================================
+
+COLUMN_DTYPES: Dict[str, Dict[str, str]] = {
+    'buildings': _group(int=['region', 'floors_above', 'floors_below']),
+    'room': _group(float=['room_area', 'room_floor_height', 'room_ceiling_height']),
+    'zone': _group(float=['zone_room_area', 'zone_floor_height', 'zone_ceiling_height']),
+    'wall': _group(
+        float=['wall_u_value', 'wall_conductivity', 'wall_thickness', 'wall_solar_absorption'],
+        int=['wall_material_no'],
+    ),
+    'window': _group(
+        float=['window_u_value', 'window_eta_value', 'window_glass_u_value', 'window_glass_eta_value'],
+    ),
+    'envelope': _group(
+        float=['env_shade_coef_cooling', 'env_shade_coef_heating', 'env_wall_area', 'env_window_area'],
+    ),
+    'heatsource': _group(
+        float=[
+            'hs_storage_capacity', 'hs_cooling_supply_temp', 'hs_cooling_capacity', 'hs_cooling_main_power',
+            'hs_cooling_sub_power', 'hs_cooling_pump_power', 'hs_ct_capacity', 'hs_ct_fan_power',
+            'hs_ct_pump_power', 'hs_heating_supply_temp', 'hs_heating_capacity', 'hs_heating_main_power',
+            'hs_heating_sub_power', 'hs_heating_pump_power',
+        ],
+        int=['hs_cooling_order', 'hs_cooling_count', 'hs_heating_order', 'hs_heating_count'],
+    ),
+    'pump': _group(
+        float=[
+            'pump_cooling_temp_diff', 'pump_heating_temp_diff', 'pump_rated_flow', 'pump_rated_power',
+            'pump_min_flow_ratio',
+        ],
+        int=['pump_order', 'pump_count'],
+    ),
+    'ahu': _group(
+        float=[
+            'ahu_cooling_capacity', 'ahu_heating_capacity', 'ahu_oa_flow', 'ahu_sa_fan_power',
+            'ahu_ra_fan_power', 'ahu_oa_fan_power', 'ahu_ea_fan_power', 'ahu_min_air_ratio', 'ahu_hex_flow',
+            'ahu_hex_eff_cooling', 'ahu_hex_eff_heating', 'ahu_rotor_power',
+        ],
+        int=['ahu_count'],
+    ),
+    'hs_water_temp': _group(
+        float=[
+            'hswt_temp_jan', 'hswt_temp_feb', 'hswt_temp_mar', 'hswt_temp_apr', 'hswt_temp_may',
+            'hswt_temp_jun', 'hswt_temp_jul', 'hswt_temp_aug', 'hswt_temp_sep', 'hswt_temp_oct',
+            'hswt_temp_nov', 'hswt_temp_dec',
+        ],
+    ),
+    'heat_exchanger': _group(
+        float=[
+            'hex_oa_flow', 'hex_ea_flow', 'hex_eff_cooling_1', 'hex_eff_heating_1', 'hex_test_sa_flow_1',
+            'hex_test_ra_flow_1', 'hex_vent_eff_1', 'hex_eff_cooling_2', 'hex_eff_heating_2',
+            'hex_test_sa_flow_2', 'hex_test_ra_flow_2', 'hex_vent_eff_2', 'hex_eff_cooling_3',
+            'hex_eff_heating_3', 'hex_test_sa_flow_3', 'hex_test_ra_flow_3', 'hex_vent_eff_3',
+        ],
+        int=['hex_count'],
+    ),
+    'vwv_pump': _group(
+        float=[
+            'vwv_cooling_temp_diff', 'vwv_heating_temp_diff', 'vwv_rated_flow', 'vwv_rated_power',
+            'vwv_min_flow_ratio', 'vwv_coef_3rd', 'vwv_coef_2nd', 'vwv_coef_1st', 'vwv_coef_const',
+        ],
+    ),
+    'pac_partial': _group(
+        float=[
+            'pac_cooling_coef_2nd', 'pac_cooling_coef_1st', 'pac_cooling_const', 'pac_cooling_min_output',
+            'pac_heating_coef_2nd', 'pac_heating_coef_1st', 'pac_heating_const', 'pac_heating_min_output',
+        ],
+    ),
+    'vent_room': _group(float=['vr_room_area']),
+    'vent_fan': _group(float=['vf_design_flow', 'vf_motor_power']),
+    'vent_ahu': _group(
+        float=[
+            'va_cooling_capacity', 'va_hs_efficiency', 'va_pump_power', 'va_design_flow', 'va_motor_power',
+        ],
+    ),
+    'vent_load_rate': _group(float=['vlr_annual_load_rate']),
+    'lighting': _group(
+        float=[
+            'lt_room_area', 'lt_floor_height', 'lt_ceiling_height', 'lt_room_width', 'lt_room_depth',
+            'lt_room_index', 'lt_fixture_power',
+        ],
+        int=['lt_fixture_count'],
+    ),
+    'hotwater_room': _group(float=['hwr_room_area']),
+    'hotwater_equip': _group(
+        float=[
+            'hwe_heating_capacity', 'hwe_efficiency', 'hwe_pipe_diameter', 'hwe_solar_area',
+            'hwe_solar_azimuth', 'hwe_solar_tilt',
+        ],
+    ),
+    'elevator': _group(float=['ev_capacity', 'ev_speed', 'ev_transport_coef'], int=['ev_count']),
+    'pv': _group(float=['pv_pcs_efficiency', 'pv_capacity', 'pv_azimuth', 'pv_tilt']),
+    'cgs': _group(
+        float=[
+            'cgs_rated_output', 'cgs_gen_eff_100', 'cgs_gen_eff_75', 'cgs_gen_eff_50', 'cgs_heat_eff_100',
+            'cgs_heat_eff_75', 'cgs_heat_eff_50',
+        ],
+        int=['cgs_count', 'cgs_priority_ac_cool', 'cgs_priority_ac_heat', 'cgs_priority_hotwater'],
+    ),
+    'envelope_non_ac': _group(
+        float=[
+            'nac_room_area', 'nac_floor_height', 'nac_shade_coef_cooling', 'nac_shade_coef_heating',
+            'nac_wall_area', 'nac_window_area',
+        ],
+    ),
+    # 建物ごとの集計テーブル（webpro_rollup.py、抽出値ではなく統合時に計算する列）
+    'building_summary': _group(
+        float=[
+            'total_floor_area', 'ac_floor_area', 'lighting_power', 'lighting_power_density',
+            'hs_cooling_capacity_total', 'hs_heating_capacity_total', 'pv_capacity_total',
+        ],
+        int=['room_count', 'ahu_count', 'fan_count', 'elevator_count'],
+    ),
+}
+
+
+# 列名 → 宣言した型（全テーブル共通。同じ列名は同じ型で宣言する）
+DECLARED_DTYPES: Dict[str, str] = {
+    col: dtype for dtypes in COLUMN_DTYPES.values() for col, dtype in dtypes.items()
+}
+
+
+def pandas_dtype(dtype: str, downcast: bool = False) -> str:
+    """宣言した型（'float' / 'int'）に対応する pandas の型"""
+    if dtype == 'int':
+        return 'Int32' if downcast else 'Int64'
+    return 'float32' if downcast else 'float64'
+
+
+def column_dtypes(dtypes: Dict[str, str], downcast: bool = False) -> Dict[str, str]:
+    """列名 → pandas の型"""
+    return {col: pandas_dtype(dtype, downcast) for col, dtype in dtypes.items()}
+
+
+def declared_column_dtypes(columns: Iterable[str], downcast: bool = False) -> Dict[str, str]:
+    """columns のうち型宣言のある列 → pandas の型（parquet のスキーマ用）"""
+    return {col: pandas_dtype(DECLARED_DTYPES[col], downcast) for col in columns if col in DECLARED_DTYPES}
+
+
+# =============================================================================
+# 変換
+# =============================================================================
+
+def _clean_number_text(value: Any) -> Any:
+    """数値の文字列表記の正規化（全角 → 半角、桁区切りのカンマ・空白を除去）"""
+    if not isinstance(value, str):
+        return value
+    return ''.join(unicodedata.normalize('NFKC', value).replace(',', '').split())
+
+
+def coerce_series(
+    series: pd.Series,
+    dtype: str,
+    downcast: bool = False
+) -> Tuple[pd.Series, pd.Series]:
+    """
+    列を宣言した型に変換し、(変換後の列, 変換できなかったセルのマスク) を返す
+
+    変換は列全体に1回の pd.to_numeric で行い、失敗したセルだけ文字列を正規化して再変換する。
+    空白・欠損のセルは失敗に含めない。int 列で小数部のある値・型の範囲外の値は失敗とする。
+    """
+    target = pandas_dtype(dtype, downcast)
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(object)
+    present = series.notna().to_numpy(copy=True)
+
+    values = pd.to_numeric(series, errors='coerce').to_numpy(dtype='float64', na_value=np.nan, copy=True)
+
+    retry = present & np.isnan(values)
+    if retry.any():
+        cleaned = series[retry].map(_clean_number_text)
+        values[retry] = pd.to_numeric(cleaned, errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+        # 空白だけの文字列は欠損（失敗ではない）
+        present[retry] = cleaned.map(lambda v: not (isinstance(v, str) and v == '')).to_numpy(dtype=bool)
+
+    if target.startswith('Int'):
+        info = np.iinfo(target.lower())
+        invalid = ~np.isnan(values) & ((values != np.round(values)) | (values < info.min) | (values > info.max))
+        values[invalid] = np.nan
+        failed = present & np.isnan(values)
+        converted = pd.array(values, dtype='Float64').astype(target)
+    else:
+        failed = present & np.isnan(values)
+        converted = values.astype(target)
+
+    return pd.Series(converted, index=series.index, name=series.name), pd.Series(failed, index=series.index)
+
+
+def coerce_frame(
+    df: pd.DataFrame,
+    dtypes: Dict[str, str],
+    downcast: bool = False,
+    report: Optional['CoercionReport'] = None,
+    table: str = ''
+) -> pd.DataFrame:
+    """
+    DataFrame の型宣言のある列を変換（列ごとに1回）
+
+    report を渡すと、変換できなかった値を table・列・file_id ごとに記録する。
+    """
+    if df.empty:
+        return df.astype({col: pandas_dtype(dtype, downcast) for col, dtype in dtypes.items() if col in df.columns})
+    df = df.copy()
+    for col, dtype in dtypes.items():
+        if col not in df.columns:
+            continue
+        raw = df[col]
+        df[col], failed = coerce_series(raw, dtype, downcast)
+        if report is not None and failed.any():
+            file_ids = df['file_id'][failed] if 'file_id' in df.columns else pd.Series('', index=raw.index)[failed]
+            report.add(table, col, dtype, file_ids, raw[failed])
+    return df
+
+
+def dtypes_for_headers(headers: Iterable[str], group: str) -> Dict[str, str]:
+    """
+    見出し（'項目名' または '項目名_単位'）の列 → 宣言した型
+
+    見出しの項目名を列グループ group の列名・列定義書の説明と照合する
+    （consolidate_webpro.py のシートの見出しから列を対応づける）。
+    """
+    labels = {}
+    for col, dtype in COLUMN_DTYPES.get(group, {}).items():
+        labels[normalize_label(col)] = dtype
+        labels.setdefault(normalize_label(get_column_spec(col).label), dtype)
+    labels.pop('', None)
+
+    dtypes = {}
+    for header in headers:
+        text = normalize_label(header)
+        dtype = labels.get(text)
+        if dtype is None and '_' in text:
+            dtype = labels.get(text.rsplit('_', 1)[0])
+        if dtype is not None:
+            dtypes[header] = dtype
+    return dtypes
+
+
+# =============================================================================
+# 変換失敗のレポート
+# =============================================================================
+
+class CoercionReport:
+    """
+    変換できなかった値の一括レポート
+
+    (テーブル, 列, file_id) ごとに件数と値の例（MAX_EXAMPLES 件まで）を集計する。
+    """
+
+    FIELDS = ('table', 'column', 'dtype', 'file_id', 'count', 'examples')
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return sum(entry['count'] for entry in self._entries.values())
+
+    def add(self, table: str, column: str, dtype: str, file_ids: pd.Series, values: pd.Series):
+        """変換できなかったセル（file_ids と values は同じ行）を記録"""
+        frame = pd.DataFrame({'file_id': file_ids.astype(object).to_numpy(), 'value': values.to_numpy(dtype=object)})
+        for file_id, group in frame.groupby('file_id', sort=False, dropna=False):
+            key = (table, column, str(file_id))
+            entry = self._entries.setdefault(key, {
+                'table': table, 'column': column, 'dtype': dtype, 'file_id': str(file_id),
+                'count': 0, 'examples': [],
+            })
+            entry['count'] += len(group)
+            for value in group['value']:
+                if len(entry['examples']) >= MAX_EXAMPLES:
+                    break
+                if str(value) not in entry['examples']:
+                    entry['examples'].append(str(value))
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """集計結果（テーブル・列・file_id の順）"""
+        return [self._entries[key] for key in sorted(self._entries)]
+
+    def by_column(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """(テーブル, 列) ごとの件数・建物数・値の例"""
+        summary: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for entry in self.entries():
+            item = summary.setdefault((entry['table'], entry['column']), {'count': 0, 'files': 0, 'examples': []})
+            item['count'] += entry['count']
+            item['files'] += 1
+            for value in entry['examples']:
+                if len(item['examples']) < MAX_EXAMPLES and value not in item['examples']:
+                    item['examples'].append(value)
+        return summary
+
+    def print_summary(self, top_n: int = 20):
+        """列ごとの件数を表示（多い順に top_n 列まで）"""
+        if not self._entries:
+            return
+        summary = sorted(self.by_column().items(), key=lambda kv: kv[1]['count'], reverse=True)
+        print(f"\nWarning: 数値に変換できない値が {len(self)} 件あります（欠損として出力）:")
+        for (table, column), item in summary[:top_n]:
+            examples = ', '.join(repr(value) for value in item['examples'])
+            print(f"  {table}.{column}: {item['count']} cells in {item['files']} buildings (e.g. {examples})")
+        if len(summary) > top_n:
+            print(f"  ... and {len(summary) - top_n} more columns")
+
+    def write(self, report_path: Union[str, Path]) -> Path:
+        """レポートを書き出す（拡張子 .json は JSON、それ以外は CSV）"""
+        report_path = Path(report_path)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        entries = self.entries()
+        if report_path.suffix.lower() == '.json':
+            report_path.write_text(json.dumps(entries, ensure_ascii=False, indent=1), encoding='utf-8')
+            return report_path
+        with open(report_path, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=self.FIELDS)
+            writer.writeheader()
+            for entry in entries:
+                writer.writerow({**entry, 'examples': ' | '.join(entry['examples'])})
+        return report_path
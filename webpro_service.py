@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WEBPRO統合データの HTTP クエリサービス
+
+ツールごとに WebproData で統合ファイルを開くと、プロセスごとに読み込みに数秒かかる。
+このサービスは統合ファイル（xlsx / SQLite）を起動時に1回だけ読み込み、file_id・entity_type・
+室用途の索引を作ってメモリ上で検索し、結果を JSON で返す。
+標準ライブラリの http.server だけで動作する（接続ごとにスレッドで処理）。
+
+対応する統合ファイル:
+    consolidate_webpro.py の出力        00_基本情報・01_室仕様 などのシート
+    consolidate_webpro_full.py の出力   all_data（wide）または buildings + entity_type 別（normalized）
+                                        （xlsx・sqlite。parquet は非対応）
+
+エンドポイント（GET、応答は JSON）:
+    /health                                 状態（統合ファイル・読み込み時刻・シート数・建物数）
+    /sheets                                 シート名と行数
+    /buildings                              全建物の基本情報（WebproData.get_all_buildings 相当）
+    /buildings/<file_id>                    建物の全シートの行（シート名 → 行）
+    /buildings/<file_id>/<sheet>            建物の1シートの行（WebproData.get_building 相当）
+    /rooms?room_type=&min_area=&max_area=   室の検索（WebproData.search_rooms 相当）
+
+    行の一覧は {"count": 条件に合う行数, "rows": [{列名: 値, ...}, ...]}（欠損は null）。
+    /buildings/<file_id>[/<sheet>] は entity_type=（entity_type 列のあるシートの絞り込み）、
+    /buildings・/rooms は limit=（返す行数の上限）を指定できる。
+    room_type は文字列としての部分一致（正規表現としては解釈しない）。
+    誤った要求は 400 / 404、想定外の失敗は 500 で、いずれも {"error": 内容} を返す。
+
+- 統合ファイルが置き換えられたら（--watch での再出力など）バックグラウンドで読み込み直し、
+  読み込みが終わった時点で索引を切り替える（読み込み中は前のデータで応答する）
+- 同じ要求の応答（JSON）はバイト予算付きの LRU キャッシュに保持する
+
+使用方法:
+    python webpro_service.py ./output/webpro_combined_data.xlsx --port 8765
+    curl 'http://127.0.0.1:8765/rooms?room_type=事務室&min_area=100&limit=20'
+
+同時接続でのレイテンシ（p50 / p99）は benchmarks/bench_service_load.py で計測できる。
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from read_webpro_data import (
+    ROOM_AREA_COLUMN, ROOM_SHEET, ROOM_TYPE_COLUMN, RoomSearchIndex, SheetLRUCache, WebproData,
+    build_file_id_index, list_sheet_names,
+)
+
+# 全建物の基本情報のシート（consolidate_webpro.py / consolidate_webpro_full.py の normalized）
+BASIC_INFO_SHEETS = ('00_基本情報', 'buildings')
+
+# search_rooms の対象（シート, entity_type, 室用途の列, 室面積の列）。先頭から最初に見つかったものを使う
+ROOM_SOURCES = [
+    (ROOM_SHEET, None, ROOM_TYPE_COLUMN, ROOM_AREA_COLUMN),
+    ('room', None, 'room_type_minor', 'room_area'),
+    ('all_data', 'room', 'room_type_minor', 'room_area'),
+]
+
+DEFAULT_PORT = 8765
+DEFAULT_CACHE_MB = 64
+
+
+class QueryError(Exception):
+    """要求の誤り（status は HTTP ステータス）"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# =============================================================================
+# 索引
+# =============================================================================
+
+def build_entity_index(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """entity_type → 行位置（昇順）の索引（entity_type 列がないシートは空）"""
+    if 'entity_type' not in df.columns:
+        return {}
+    return {str(key): positions for key, positions in df.groupby('entity_type', sort=False).indices.items()}
+
+
+def file_id_key(file_id: Any) -> str:
+    """URL で指定する file_id の文字列（consolidate_webpro.py の連番は数値として読み込まれる）"""
+    if isinstance(file_id, (float, np.floating)) and float(file_id).is_integer():
+        file_id = int(file_id)
+    return str(file_id)
+
+
+def _positions(rows: Any) -> np.ndarray:
+    """file_id 索引の値（slice または行位置の配列）を行位置の配列に"""
+    if isinstance(rows, slice):
+        return np.arange(rows.start, rows.stop)
+    return rows
+
+
+class IndexedSheet(NamedTuple):
+    """シートと、読み込み時に作った索引"""
+    df: pd.DataFrame
+    file_id_index: dict
+    entity_index: Dict[str, np.ndarray]
+
+
+class WebproQueryIndex:
+    """
+    統合ファイル全体のメモリ上の索引
+
+    作成後は変更しないため、複数のスレッドから同時に参照できる。
+    唯一変更される RoomSearchIndex の室用途の一致結果のキャッシュ（OrderedDict の LRU）は、
+    参照・追加・破棄をそのインデックスのロック（_matched_lock）の中で行う。
+    """
+
+    def __init__(self, sheets: Dict[str, pd.DataFrame], source: str = ''):
+        self.source = source
+        self.loaded_at = time.time()
+        self.sheets = {
+            name: IndexedSheet(
+                df,
+                {file_id_key(key): rows for key, rows in build_file_id_index(df).items()},
+                build_entity_index(df),
+            )
+            for name, df in sheets.items()
+        }
+        self.file_ids = set()
+        for sheet in self.sheets.values():
+            self.file_ids.update(sheet.file_id_index)
+        self.buildings = self._building_table()
+        self.rooms, self.room_index = self._room_table()
+
+    @classmethod
+    def load(cls, file_path: str) -> 'WebproQueryIndex':
+        """統合ファイルの全シートを読み込んで索引を作る（xlsx はシートキャッシュがあればそこから）"""
+        names = list_sheet_names(file_path)
+        with WebproData(file_path) as data:
+            sheets = {name: data.get_sheet(name) for name in names}
+        return cls(sheets, str(file_path))
+
+    def _building_table(self) -> pd.DataFrame:
+        """全建物の基本情報（wide の出力は各建物の最初の行の entity_type より前の列）"""
+        for name in BASIC_INFO_SHEETS:
+            if name in self.sheets:
+                return self.sheets[name].df
+        for sheet in self.sheets.values():
+            columns = list(sheet.df.columns)
+            if 'file_id' in columns and 'entity_type' in columns and sheet.file_id_index:
+                first_rows = np.sort([_positions(rows)[0] for rows in sheet.file_id_index.values()])
+                return sheet.df.iloc[first_rows, :columns.index('entity_type')].reset_index(drop=True)
+        return pd.DataFrame()
+
+    def _room_table(self) -> Tuple[Optional[pd.DataFrame], Optional[RoomSearchIndex]]:
+        """search_rooms の対象の行と索引（ROOM_SOURCES のうち最初に見つかったもの）"""
+        for sheet_name, entity_type, type_column, area_column in ROOM_SOURCES:
+            sheet = self.sheets.get(sheet_name)
+            if sheet is None:
+                continue
+            df = sheet.df
+            if entity_type is not None:
+                rows = sheet.entity_index.get(entity_type)
+                if rows is None:
+                    continue
+                df = df.iloc[rows]
+            return df, RoomSearchIndex(df, type_column, area_column)
+        return None, None
+
+    # ------------------------------------------------------------------
+    # 検索
+    # ------------------------------------------------------------------
+
+    def _sheet(self, sheet_name: str) -> IndexedSheet:
+        sheet = self.sheets.get(sheet_name)
+        if sheet is None:
+            raise QueryError(404, f"unknown sheet: {sheet_name}")
+        return sheet
+
+    def get_building(self, file_id: str, sheet_name: str, entity_type: Optional[str] = None) -> pd.DataFrame:
+        """
+        特定建物の特定シートの行（entity_type を指定するとその種別の行だけ）
+
+        どのシートにもない file_id は 404（/buildings/<file_id> と同じ）、
+        建物はあるがそのシートに行がない場合は空の DataFrame。
+        """
+        sheet = self._sheet(sheet_name)
+        file_id = file_id_key(file_id)
+        if file_id not in self.file_ids:
+            raise QueryError(404, f"unknown file_id: {file_id}")
+        rows = sheet.file_id_index.get(file_id)
+        if rows is None:
+            return sheet.df.iloc[0:0]
+        if entity_type:
+            rows = np.intersect1d(_positions(rows), sheet.entity_index.get(entity_type, []), assume_unique=True)
+        return sheet.df.iloc[rows]
+
+    def get_building_sheets(self, file_id: str, entity_type: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+        """特定建物の全シートの行（行のないシートは含めない）"""
+        file_id = file_id_key(file_id)
+        if file_id not in self.file_ids:
+            raise QueryError(404, f"unknown file_id: {file_id}")
+        result = {}
+        for name, sheet in self.sheets.items():
+            if file_id in sheet.file_id_index:
+                df = self.get_building(file_id, name, entity_type)
+                if len(df):
+                    result[name] = df
+        return result
+
+    def get_all_buildings(self) -> pd.DataFrame:
+        return self.buildings
+
+    def search_room_rows(self, room_type: str = None, min_area: float = None, max_area: float = None) -> np.ndarray:
+        """条件に合う室の行位置（self.rooms 上、行順）"""
+        if self.room_index is None:
+            raise QueryError(404, "no room sheet in the consolidated data")
+        # min_area=0 は WebproData と同じく条件なし
+        return self.room_index.search(room_type, min_area or None, max_area)
+
+    def search_rooms(self, room_type: str = None, min_area: float = None, max_area: float = None) -> pd.DataFrame:
+        """室を検索（WebproData.search_rooms と同じ条件: 室用途の部分一致、室面積の範囲）"""
+        return self.rooms.iloc[self.search_room_rows(room_type, min_area, max_area)]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'source': self.source,
+            'loaded_at': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.loaded_at)),
+            'sheets': len(self.sheets),
+            'buildings': len(self.file_ids),
+        }
+
+
+# =============================================================================
+# 応答（JSON）
+# =============================================================================
+
+def frame_json(df: pd.DataFrame, limit: Optional[int] = None, rows: Optional[np.ndarray] = None) -> str:
+    """
+    {"count": 行数, "rows": [...]}（limit 指定時も count は全行数）
+
+    rows を指定すると df のその行位置だけを対象にする（行の取り出しは limit 件分だけ行う）。
+    """
+    if rows is None:
+        count, subset = len(df), (df if limit is None else df.iloc[:limit])
+    else:
+        count, subset = len(rows), df.iloc[rows if limit is None else rows[:limit]]
+    return '{"count": %d, "rows": %s}' % (count, subset.to_json(orient='records', force_ascii=False, date_format='iso'))
+
+
+def _error_json(message: str) -> bytes:
+    return json.dumps({'error': message}, ensure_ascii=False).encode('utf-8')
+
+
+def _param(params: Dict[str, list], name: str) -> Optional[str]:
+    values = params.get(name)
+    return values[-1] if values else None
+
+
+def _number_param(params: Dict[str, list], name: str, cast=float) -> Optional[float]:
+    value = _param(params, name)
+    if value in (None, ''):
+        return None
+    try:
+        return cast(value)
+    except ValueError:
+        raise QueryError(400, f"invalid {name}: {value}")
+
+
+class WebproQueryService:
+    """
+    索引の保持・再読み込みと、要求（パス・クエリ文字列）→ JSON 応答
+
+    reload_interval 秒ごとに統合ファイルのサイズ・mtime を確認し、変わっていれば
+    読み込み直す（0 は確認しない）。応答は cache_bytes までキャッシュする（0 は無効）。
+    """
+
+    def __init__(self, file_path: str, reload_interval: float = 5.0, cache_bytes: int = DEFAULT_CACHE_MB << 20):
+        self.file_path = str(file_path)
+        self.reload_interval = reload_interval
+        self._signature = self._file_signature()
+        self.index = self._load()
+        self._responses = SheetLRUCache(cache_bytes) if cache_bytes > 0 else None
+        self._lock = threading.Lock()
+        self._reloader: Optional[threading.Thread] = None
+
+    def _file_signature(self) -> Tuple[int, int]:
+        stat = os.stat(self.file_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def _load(self) -> WebproQueryIndex:
+        started = time.perf_counter()
+        index = WebproQueryIndex.load(self.file_path)
+        print(f"Loaded {self.file_path} in {time.perf_counter() - started:.1f}s: "
+              f"{len(index.sheets)} sheets, {len(index.file_ids)} buildings", flush=True)
+        return index
+
+    # ------------------------------------------------------------------
+    # 再読み込み
+    # ------------------------------------------------------------------
+
+    def reload_if_changed(self) -> bool:
+        """統合ファイルが変わっていれば読み込み直して索引を切り替える（失敗時は前の索引のまま）"""
+        try:
+            signature = self._file_signature()
+        except OSError:
+            # 置き換えの途中
+            return False
+        if signature == self._signature:
+            return False
+        try:
+            index = self._load()
+        except Exception as e:
+            print(f"Warning: 統合ファイルの再読み込みに失敗しました（前のデータで応答します）: {e}", flush=True)
+            return False
+        with self._lock:
+            self.index = index
+            self._signature = signature
+            if self._responses is not None:
+                self._responses.clear()
+        return True
+
+    def start_reloader(self):
+        """reload_if_changed() をバックグラウンドで定期的に実行"""
+        if self.reload_interval <= 0 or self._reloader is not None:
+            return
+
+        def run():
+            while True:
+                time.sleep(self.reload_interval)
+                self.reload_if_changed()
+
+        self._reloader = threading.Thread(target=run, name='webpro-reloader', daemon=True)
+        self._reloader.start()
+
+    # ------------------------------------------------------------------
+    # 要求の処理
+    # ------------------------------------------------------------------
+
+    def handle(self, target: str) -> Tuple[int, bytes]:
+        """要求（パスとクエリ文字列）→ (HTTP ステータス, JSON)"""
+        with self._lock:
+            index = self.index
+            body = self._responses.get(target) if self._responses is not None else None
+        if body is not None:
+            return 200, body
+
+        try:
+            body = self._route(index, target).encode('utf-8')
+        except QueryError as e:
+            return e.status, _error_json(str(e))
+        except Exception as e:
+            # 想定外の失敗でも接続を切らずに 500 を返す（応答はキャッシュしない）
+            print(f"Warning: 要求の処理に失敗しました: {target}: {e!r}", flush=True)
+            return 500, _error_json(f"internal error: {type(e).__name__}")
+
+        with self._lock:
+            # 処理中に索引が切り替わった場合は古い応答をキャッシュしない
+            if self._responses is not None and index is self.index:
+                self._responses.put(target, body, len(body))
+        return 200, body
+
+    def _route(self, index: WebproQueryIndex, target: str) -> str:
+        url = urlsplit(target)
+        parts = [unquote(part) for part in url.path.split('/') if part]
+        params = parse_qs(url.query)
+        limit = _number_param(params, 'limit', int)
+        if limit is not None and limit < 0:
+            raise QueryError(400, f"invalid limit: {limit}")
+        entity_type = _param(params, 'entity_type')
+
+        if parts == ['health']:
+            return json.dumps({'status': 'ok', **index.summary()}, ensure_ascii=False)
+        if parts == ['sheets']:
+            return json.dumps(
+                {name: len(sheet.df) for name, sheet in index.sheets.items()}, ensure_ascii=False
+            )
+        if parts == ['buildings']:
+            return frame_json(index.get_all_buildings(), limit)
+        if len(parts) == 2 and parts[0] == 'buildings':
+            sheets = index.get_building_sheets(parts[1], entity_type)
+            return '{"file_id": %s, "sheets": {%s}}' % (
+                json.dumps(parts[1], ensure_ascii=False),
+                ', '.join(f"{json.dumps(name, ensure_ascii=False)}: {frame_json(df)}" for name, df in sheets.items()),
+            )
+        if len(parts) == 3 and parts[0] == 'buildings':
+            return frame_json(index.get_building(parts[1], parts[2], entity_type))
+        if parts == ['rooms']:
+            rows = index.search_room_rows(
+                _param(params, 'room_type'),
+                _number_param(params, 'min_area'),
+                _number_param(params, 'max_area'),
+            )
+            return frame_json(index.rooms, limit, rows)
+        raise QueryError(404, f"unknown endpoint: {url.path}")
+
+    def cache_stats(self) -> dict:
+        return self._responses.stats() if self._responses is not None else {}
+
+
+# =============================================================================
+# HTTP サーバー
+# =============================================================================
+
+class _QueryHandler(BaseHTTPRequestHandler):
+    # keep-alive（Content-Length を付けて応答）。小さな応答が Nagle で遅れないようにする
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    server_version = 'WebproQuery/1.0'
+
+    def do_GET(self):
+        status, body = self.server.service.handle(self.path)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.access_log:
+            super().log_message(format, *args)
+
+
+class WebproQueryServer(ThreadingHTTPServer):
+    """WebproQueryService を HTTP で公開するサーバー（接続ごとにスレッド）"""
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], service: WebproQueryService, access_log: bool = False):
+        super().__init__(address, _QueryHandler)
+        self.service = service
+        self.access_log = access_log
+
+
+def serve(
+    file_path: str,
+    host: str = '127.0.0.1',
+    port: int = DEFAULT_PORT,
+    reload_interval: float = 5.0,
+    cache_mb: int = DEFAULT_CACHE_MB,
+    access_log: bool = False
+):
+    """統合ファイルを読み込んでサービスを起動（Ctrl-C で終了）"""
+    service = WebproQueryService(file_path, reload_interval, cache_mb << 20)
+    server = WebproQueryServer((host, port), service, access_log)
+    service.start_reloader()
+    host, port = server.server_address[:2]
+    print(f"Serving on http://{host}:{port}/ (Ctrl-C to stop)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopped.", flush=True)
+    finally:
+        server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='WEBPRO統合データの HTTP クエリサービス')
+    parser.add_argument('data', help='統合ファイル（xlsx または SQLite）')
+    parser.add_argument('--host', default='127.0.0.1', help='待ち受けるアドレス（デフォルト: 127.0.0.1）')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                        help=f'待ち受けるポート（0: 空いているポート、デフォルト: {DEFAULT_PORT}）')
+    parser.add_argument('--reload_interval', type=float, default=5.0,
+                        help='統合ファイルの更新を確認する間隔（秒、0: 確認しない、デフォルト: 5）')
+    parser.add_argument('--cache_mb', type=int, default=DEFAULT_CACHE_MB,
+                        help=f'応答キャッシュの上限（MB、0: 無効、デフォルト: {DEFAULT_CACHE_MB}）')
+    parser.add_argument('--access_log', action='store_true', help='要求ごとのアクセスログを標準エラーに出力する')
+    args = parser.parse_args()
+
+    serve(args.data, args.host, args.port, args.reload_interval, args.cache_mb, args.access_log)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+合成WEBPRO入力シートの生成
+
+SHEET_CONFIG（consolidate_webpro_full.py）の様式ごとの data_start_row・列配置に
+合わせた WEBPRO 形式の xlsx を生成する（顧客のファイルを使わずに性能計測・動作確認するため）。
+
+- 見出し・単位・型は webpro_complete_column_definition.md の列定義から取る
+- 様式ごとのデータ行数は rows_per_entity で指定（既定は中規模の事務所ビル程度）
+- 実ファイルと同じく、対象列の右側に選択肢リスト・建材リストを埋め込む
+  （webpro_integration_plan.md の使用範囲、例: 2-2) 外壁構成 は1,000行）
+- xlsx は XML を直接書き出す（openpyxl 経由より大幅に速く、1万ファイル規模でも生成できる）
+
+使用例:
+    python webpro_synthetic.py -o ./synthetic_input -n 100
+    python webpro_synthetic.py -o ./synthetic_input -n 10 --rows room=200 lighting=400 --seed 1
+"""
+
+import argparse
+import random
+import re
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from xml.sax.saxutils import escape, quoteattr
+
+from consolidate_webpro_full import SHEET_CONFIG
+from webpro_columns import get_column_spec
+from webpro_parallel import imap_ordered, resolve_workers
+
+# ============================================
+# 設定
+# ============================================
+
+BASIC_INFO_SHEET = '0) 基本情報'
+
+# 1建物あたりの行数（中規模の事務所ビル程度）
+DEFAULT_ROWS_PER_ENTITY = {
+    'room': 40, 'zone': 40, 'wall': 8, 'window': 6, 'envelope': 40,
+    'heatsource': 4, 'pump': 2, 'ahu': 10, 'hs_water_temp': 1,
+    'heat_exchanger': 5, 'vwv_pump': 1, 'pac_partial': 1,
+    'vent_room': 20, 'vent_fan': 15, 'vent_ahu': 3, 'vent_load_rate': 2,
+    'lighting': 80, 'hotwater_room': 10, 'hotwater_equip': 3,
+    'elevator': 4, 'pv': 1, 'cgs': 1, 'envelope_non_ac': 10,
+}
+
+# 埋め込みの選択肢・建材リストの範囲（行数, 列数）（webpro_integration_plan.md の使用範囲）
+CATALOGUE_RANGES = {
+    'zone': (217, 15),
+    'wall': (1000, 14),
+    'window': (166, 11),
+    'heatsource': (101, 26),
+}
+
+# 選択項目の候補（列名 → 候補、ない列は「有/無」）
+CHOICES = {
+    'room_building_type': ['事務所等'],
+    'room_type_major': ['事務所等'],
+    'room_type_minor': ['事務室', '会議室', '廊下', '便所', '湯沸室', '更衣室', '電子計算機室'],
+    'lt_room_type_major': ['事務所等'],
+    'lt_room_type_minor': ['事務室', '会議室', '廊下', '便所', '湯沸室', '更衣室'],
+}
+DEFAULT_CHOICES = ['有', '無']
+
+# 単位 → 数値の範囲
+NUMBER_RANGES = {
+    '㎡': (5.0, 500.0),
+    'm': (2.0, 6.0),
+    'kW': (1.0, 500.0),
+    'W': (10.0, 200.0),
+    '%': (40.0, 90.0),
+    '℃': (5.0, 35.0),
+    '台': (1, 10),
+}
+DEFAULT_NUMBER_RANGE = (0.1, 100.0)
+
+PREFECTURES = ['東京都', '大阪府', '愛知県', '福岡県', '北海道', '宮城県', '広島県', '沖縄県']
+STRUCTURES = ['RC造', 'S造', 'SRC造']
+
+_MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+_CT_PREFIX = 'application/vnd.openxmlformats-officedocument.spreadsheetml'
+
+
+def make_value(col_name: str, row: int, rng: random.Random) -> Any:
+    """列定義の型・単位に応じたセルの値"""
+    spec = get_column_spec(col_name)
+    if spec.dtype in ('float', 'int'):
+        low, high = next(
+            (value_range for unit, value_range in NUMBER_RANGES.items() if spec.unit.startswith(unit)),
+            DEFAULT_NUMBER_RANGE,
+        )
+        if spec.dtype == 'int':
+            return rng.randint(int(low), max(int(high), int(low) + 1))
+        return round(rng.uniform(low, high), 2)
+    if spec.unit == '選択':
+        return rng.choice(CHOICES.get(col_name, DEFAULT_CHOICES))
+    if spec.label == '階':
+        return f'{rng.randint(1, 10)}F'
+    return f'{spec.label}{row + 1}'
+
+
+# ============================================
+# xlsx 書き出し
+# ============================================
+
+def _cell_ref(row: int, col: int) -> str:
+    """行・列番号（0始まり）のセル参照（例: (0, 27) → 'AB1'）"""
+    letters = ''
+    col += 1
+    while col:
+        col, rem = divmod(col - 1, 26)
+        letters = chr(65 + rem) + letters
+    return f'{letters}{row + 1}'
+
+
+class _SharedStrings:
+    """共有文字列テーブル"""
+
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+
+    def get(self, text: str) -> int:
+        idx = self.index.get(text)
+        if idx is None:
+            idx = self.index[text] = len(self.index)
+        return idx
+
+    def to_xml(self) -> str:
+        items = ''.join(f'<si><t xml:space="preserve">{escape(text)}</t></si>' for text in self.index)
+        return (f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                f'<sst xmlns="{_MAIN_NS}" count="{len(self.index)}" uniqueCount="{len(self.index)}">{items}</sst>')
+
+
+def _sheet_xml(cells: Dict[int, Dict[int, Any]], strings: _SharedStrings) -> str:
+    """行番号 → (列番号 → 値) のセルからシートの XML を作る"""
+    rows = []
+    for row in sorted(cells):
+        parts = []
+        for col in sorted(cells[row]):
+            value = cells[row][col]
+            ref = _cell_ref(row, col)
+            if isinstance(value, str):
+                parts.append(f'<c r="{ref}" t="s"><v>{strings.get(value)}</v></c>')
+            else:
+                parts.append(f'<c r="{ref}"><v>{value!r}</v></c>')
+        rows.append(f'<row r="{row + 1}">{"".join(parts)}</row>')
+    return (f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<worksheet xmlns="{_MAIN_NS}"><sheetData>{"".join(rows)}</sheetData></worksheet>')
+
+
+def _write_xlsx(path: Path, sheets: Dict[str, Dict[int, Dict[int, Any]]]):
+    """シート名 → セルの辞書を xlsx として書き出す"""
+    strings = _SharedStrings()
+    sheet_xmls = [_sheet_xml(cells, strings) for cells in sheets.values()]
+    n_sheets = len(sheet_xmls)
+
+    content_types = ''.join(
+        f'<Override PartName="/xl/worksheets/sheet{i}.xml" ContentType="{_CT_PREFIX}.worksheet+xml"/>'
+        for i in range(1, n_sheets + 1)
+    )
+    workbook_sheets = ''.join(
+        f'<sheet name={quoteattr(name)} sheetId="{i}" r:id="rId{i}"/>'
+        for i, name in enumerate(sheets, 1)
+    )
+    workbook_rels = ''.join(
+        f'<Relationship Id="rId{i}" Type="{_REL_NS}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+        for i in range(1, n_sheets + 1)
+    )
+    header = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+    tmp_path = path.with_name(path.name + '.tmp')
+    with zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('[Content_Types].xml', (
+            f'{header}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            f'<Override PartName="/xl/workbook.xml" ContentType="{_CT_PREFIX}.sheet.main+xml"/>'
+            f'<Override PartName="/xl/styles.xml" ContentType="{_CT_PREFIX}.styles+xml"/>'
+            f'<Override PartName="/xl/sharedStrings.xml" ContentType="{_CT_PREFIX}.sharedStrings+xml"/>'
+            f'{content_types}</Types>'
+        ))
+        zf.writestr('_rels/.rels', (
+            f'{header}<Relationships xmlns="{_PKG_REL_NS}">'
+            f'<Relationship Id="rId1" Type="{_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+            '</Relationships>'
+        ))
+        zf.writestr('xl/workbook.xml', (
+            f'{header}<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}">'
+            f'<sheets>{workbook_sheets}</sheets></workbook>'
+        ))
+        zf.writestr('xl/_rels/workbook.xml.rels', (
+            f'{header}<Relationships xmlns="{_PKG_REL_NS}">{workbook_rels}'
+            f'<Relationship Id="rId{n_sheets + 1}" Type="{_REL_NS}/styles" Target="styles.xml"/>'
+            f'<Relationship Id="rId{n_sheets + 2}" Type="{_REL_NS}/sharedStrings" Target="sharedStrings.xml"/>'
+            '</Relationships>'
+        ))
+        zf.writestr('xl/styles.xml', (
+            f'{header}<styleSheet xmlns="{_MAIN_NS}">'
+            '<fonts count="1"><font><sz val="11"/><name val="游ゴシック"/></font></fonts>'
+            '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+            '<fill><patternFill patternType="gray125"/></fill></fills>'
+            '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+            '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+            '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+            '<cellStyles count="1"><cellStyle name="標準" xfId="0" builtinId="0"/></cellStyles>'
+            '</styleSheet>'
+        ))
+        for i, sheet_xml in enumerate(sheet_xmls, 1):
+            zf.writestr(f'xl/worksheets/sheet{i}.xml', sheet_xml)
+        zf.writestr('xl/sharedStrings.xml', strings.to_xml())
+    tmp_path.replace(path)
+
+
+# ============================================
+# シートの内容
+# ============================================
+
+def make_basic_info_cells(building_name: str, rng: random.Random) -> Dict[int, Dict[int, Any]]:
+    """様式0（縦型フォーム、extract_basic_info の行・列配置）"""
+    return {
+        0: {0: '様式 0. 基本情報'},
+        4: {1: '①シート作成月日', 2: f'2024/{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}'},
+        5: {1: '②入力責任者', 2: '設計担当'},
+        7: {1: '③評価対象', 2: rng.choice(['新築', '増築', '改築'])},
+        9: {1: '④建物の名称', 2: building_name},
+        10: {1: '⑤建築物所在地', 2: '都道府県', 3: rng.choice(PREFECTURES), 4: '市区町村', 5: '中央区'},
+        12: {1: '⑥省エネ基準地域区分', 2: rng.randint(1, 8)},
+        13: {1: '⑦構造', 2: rng.choice(STRUCTURES)},
+        14: {1: '⑧階数', 2: '地上', 3: rng.randint(1, 30), 4: '地下', 5: rng.randint(0, 3)},
+    }
+
+
+def make_sheet_cells(
+    entity_type: str,
+    config: Dict[str, Any],
+    n_rows: int,
+    rng: random.Random,
+    fill_ratio: float = 0.9,
+    catalogue: bool = True,
+) -> Dict[int, Dict[int, Any]]:
+    """
+    様式シート（見出し・単位行、data_start_row 以降のデータ行、右側のリスト）
+
+    見出しは data_start_row の4行前、単位はその2行後（data_start_row=9 なら6行目・8行目）。
+    各データ行の先頭列・名称の列は必ず値を入れ、それ以外は fill_ratio の確率で値を入れる。
+    """
+    col_mapping = config['col_mapping']
+    data_start_row = config['data_start_row']
+    unit_row = max(data_start_row - 2, 1)
+    header_row = max(unit_row - 2, 0)
+
+    cells: Dict[int, Dict[int, Any]] = {0: {0: f"様式 {config['sheet_name']}"}}
+    cells.setdefault(header_row, {})
+    cells.setdefault(unit_row, {})
+    for col_idx, col_name in col_mapping.items():
+        spec = get_column_spec(col_name)
+        cells[header_row][col_idx] = spec.label
+        unit = spec.unit if spec.unit and spec.unit not in ('選択', '転記', '-') else '-'
+        cells[unit_row][col_idx] = f'[{unit}]'
+
+    first_col = min(col_mapping)
+    required = {
+        col_idx for col_idx, col_name in col_mapping.items()
+        if col_idx == first_col or '名' in get_column_spec(col_name).label
+    }
+    for row in range(n_rows):
+        values = cells.setdefault(data_start_row + row, {})
+        for col_idx, col_name in col_mapping.items():
+            if col_idx in required or rng.random() < fill_ratio:
+                values[col_idx] = make_value(col_name, row, rng)
+
+    if catalogue and entity_type in CATALOGUE_RANGES:
+        list_rows, list_cols = CATALOGUE_RANGES[entity_type]
+        list_start = max(col_mapping) + 2
+        for row in range(list_rows):
+            values = cells.setdefault(row, {})
+            for col_idx in range(list_start, max(list_cols, list_start + 1)):
+                values[col_idx] = f'リスト{col_idx - list_start + 1}_{row + 1}'
+    return cells
+
+
+def write_webpro_workbook(
+    path: Union[str, Path],
+    rows_per_entity: Optional[Dict[str, int]] = None,
+    seed: int = 0,
+    building_name: Optional[str] = None,
+    fill_ratio: float = 0.9,
+    catalogues: bool = True,
+) -> Path:
+    """
+    合成WEBPRO入力シートを1ファイル書き出す
+
+    rows_per_entity: entity_type → データ行数（省略した様式は DEFAULT_ROWS_PER_ENTITY、
+                     0 の様式はシートだけ作る）
+    """
+    path = Path(path)
+    rng = random.Random(seed)
+    rows = dict(DEFAULT_ROWS_PER_ENTITY)
+    rows.update(rows_per_entity or {})
+
+    sheets = {BASIC_INFO_SHEET: make_basic_info_cells(building_name or f'合成ビル{seed:05d}', rng)}
+    for entity_type, config in SHEET_CONFIG.items():
+        sheets[config['sheet_name']] = make_sheet_cells(
+            entity_type, config, rows.get(entity_type, 0), rng, fill_ratio, catalogues
+        )
+    _write_xlsx(path, sheets)
+    return path
+
+
+def generate_workbooks(
+    output_dir: Union[str, Path],
+    n_files: int,
+    rows_per_entity: Optional[Dict[str, int]] = None,
+    seed: int = 0,
+    catalogues: bool = True,
+    workers: int = 1,
+) -> List[Path]:
+    """
+    output_dir に webpro_00000.xlsx, ... を n_files 個書き出す（workers > 1 でプロセス並列）
+
+    ファイル i は seed + i から生成するため、同じ引数なら常に同じ内容になる。
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    tasks = [
+        (output_dir / f'webpro_{i:05d}.xlsx', rows_per_entity, seed + i, None, 0.9, catalogues)
+        for i in range(n_files)
+    ]
+    paths = []
+    for task, path, error in imap_ordered(write_webpro_workbook, tasks, resolve_workers(workers)):
+        if error is not None:
+            raise error
+        paths.append(path)
+    return paths
+
+
+def parse_rows_option(values: List[str]) -> Dict[str, int]:
+    """--rows room=40 lighting=80 の形式を辞書に変換"""
+    rows = {}
+    for value in values or []:
+        match = re.fullmatch(r'(\w+)=(\d+)', value)
+        if not match or match.group(1) not in SHEET_CONFIG:
+            raise argparse.ArgumentTypeError(f"--rows は <entity_type>=<行数> で指定してください: {value}")
+        rows[match.group(1)] = int(match.group(2))
+    return rows
+
+
+# ============================================
+# メイン処理
+# ============================================
+
+def main():
+    parser = argparse.ArgumentParser(description='合成WEBPRO入力シートの生成')
+    parser.add_argument('--output_dir', '-o', required=True, help='出力ディレクトリ')
+    parser.add_argument('--files', '-n', type=int, default=10, help='生成するファイル数（デフォルト: 10）')
+    parser.add_argument('--rows', nargs='*', default=[], metavar='ENTITY=N',
+                        help='様式ごとのデータ行数（例: room=40 lighting=80）')
+    parser.add_argument('--seed', type=int, default=0, help='乱数シード（デフォルト: 0）')
+    parser.add_argument('--no_catalogues', action='store_true', help='選択肢・建材リストを埋め込まない')
+    parser.add_argument('--workers', '-w', type=int, default=1, help='並列プロセス数（0: CPUコア数）')
+    args = parser.parse_args()
+
+    paths = generate_workbooks(
+        args.output_dir, args.files, parse_rows_option(args.rows),
+        seed=args.seed, catalogues=not args.no_catalogues, workers=args.workers,
+    )
+    print(f"{len(paths)} ファイルを生成しました: {args.output_dir}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+入力ディレクトリの監視（常駐モード、--watch）
+
+入力ディレクトリを一定間隔で走査（ポーリング）し、WEBPROファイルの追加・更新・削除を
+検出したら統合出力を作り直す。外部ライブラリ（watchdog 等）は使わない
+（ネットワーク共有のディレクトリでは変更通知が届かないことがあるため）。
+
+書き込み途中のファイルの扱い（デバウンス）:
+    - サイズ・更新時刻が settle 秒間変わらず、zip として開けるファイルだけを対象にする
+      （コピー途中の xlsx は末尾の中央ディレクトリがないため zip として開けない）
+    - 初めて見つけたファイルでも、更新時刻が settle 秒以上前で zip として開ければ対象にする
+      （起動時に既にあるファイルは待たずに統合する）
+    - 書き込み中のファイルがある間は再出力を待つ（まとめてコピーされたファイルを1回で反映）。
+      ただし最初の変更から max_wait 秒経った場合は、その時点で対象になったファイルで再出力する
+    - Excel のロックファイル（~$*.xlsx）・LibreOffice のロックファイル（.~lock.*）は対象外
+    - settle 秒経っても zip として開けないファイルは壊れたファイルとして警告し、
+      次に更新されるまで対象外にする
+
+出力の置き換え自体は各出力形式の書き出し処理が一時ファイル・一時ディレクトリ経由で行う
+（webpro_output.py 参照）。再出力に失敗した場合は前回の出力を残し、間隔を空けて再試行する。
+
+使用例:
+    watcher = DirectoryWatcher('./webpro_files', '*.xlsx', settle=2.0)
+    watch_loop(watcher, lambda files: consolidate_files(..., files=files), poll_interval=2.0)
+"""
+
+import functools
+import os
+import signal
+import threading
+import time
+import zipfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+# 対象外のファイル名の接頭辞（Office・LibreOffice のロックファイル）
+TEMPORARY_PREFIXES = ('~$', '.~')
+
+
+class FileState(NamedTuple):
+    """ファイルの変更判定に使う値"""
+    size: int
+    mtime_ns: int
+
+
+# パス → FileState
+Snapshot = Dict[Path, FileState]
+
+
+def is_temporary_file(path: Union[str, Path]) -> bool:
+    """ロックファイル等、統合の対象外とするファイルか"""
+    return Path(path).name.startswith(TEMPORARY_PREFIXES)
+
+
+def describe_changes(old: Snapshot, new: Snapshot) -> Tuple[List[Path], List[Path], List[Path]]:
+    """2つのスナップショットの差分（追加, 更新, 削除）"""
+    added = sorted(path for path in new if path not in old)
+    modified = sorted(path for path in new if path in old and new[path] != old[path])
+    removed = sorted(path for path in old if path not in new)
+    return added, modified, removed
+
+
+class DirectoryWatcher:
+    """
+    入力ディレクトリの書き込みが完了したファイルの一覧（スナップショット）を追跡する
+
+    poll() は前回 mark_published() したスナップショットから変わっていて、
+    再出力してよい状態（書き込み中のファイルがない、または max_wait 秒経過）の場合だけ
+    スナップショットを返す。
+    """
+
+    def __init__(
+        self,
+        input_dir: Union[str, Path],
+        file_pattern: str = '*.xlsx',
+        settle: float = 2.0,
+        max_wait: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.input_dir = Path(input_dir)
+        self.file_pattern = file_pattern
+        self.settle = settle
+        self.max_wait = max_wait
+        self._clock = clock
+        # パス → (状態, その状態を最初に見た時刻, zip として開けるか（未確認は None）)
+        self._seen: Dict[Path, Tuple[FileState, float, Optional[bool]]] = {}
+        self._published: Optional[Snapshot] = None
+        # 出力に反映していない変更を最初に見た時刻
+        self._changed_since: Optional[float] = None
+
+    @property
+    def published(self) -> Snapshot:
+        """最後に出力へ反映したスナップショット"""
+        return dict(self._published or {})
+
+    def scan(self) -> Snapshot:
+        """入力ディレクトリの対象ファイルの現在の状態"""
+        snapshot: Snapshot = {}
+        for path in sorted(self.input_dir.glob(self.file_pattern)):
+            if is_temporary_file(path):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # 走査中に削除・移動された
+                continue
+            if path.is_file():
+                snapshot[path] = FileState(stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def _is_settled(self, path: Path, state: FileState, now: float) -> bool:
+        """書き込みが完了したファイルか（settle 秒間変化がなく zip として開ける）"""
+        seen = self._seen.get(path)
+        if seen is None or seen[0] != state:
+            seen = self._seen[path] = (state, now, None)
+        _, since, valid = seen
+        if now - since >= self.settle:
+            if valid is None:
+                valid = zipfile.is_zipfile(path)
+                self._seen[path] = (state, since, valid)
+                if not valid:
+                    print(f"Warning: xlsx（zip）として開けないため対象外にします: {path.name}", flush=True)
+            return valid
+        # 更新時刻が settle 秒以上前のファイル（起動時に既にあるファイル等）は待たない
+        return time.time() - state.mtime_ns / 1e9 >= self.settle and zipfile.is_zipfile(path)
+
+    def poll(self) -> Optional[Snapshot]:
+        """再出力すべきスナップショット（変更がない・書き込み待ちの場合は None）"""
+        now = self._clock()
+        current = self.scan()
+        self._seen = {path: seen for path, seen in self._seen.items() if path in current}
+
+        ready: Snapshot = {}
+        writing = False
+        for path, state in current.items():
+            if self._is_settled(path, state, now):
+                ready[path] = state
+            elif self._seen[path][2] is not False:
+                # 書き込み中（壊れていると判定したファイルは更新されるまで待たない）
+                writing = True
+
+        if ready == self._published:
+            if not writing:
+                self._changed_since = None
+            elif self._changed_since is None:
+                self._changed_since = now
+            return None
+        if self._changed_since is None:
+            self._changed_since = now
+        if writing and now - self._changed_since < self.max_wait:
+            return None
+        return ready
+
+    def mark_published(self, snapshot: Snapshot):
+        """snapshot を出力に反映した"""
+        self._published = dict(snapshot)
+        self._changed_since = None
+
+
+def _stop_watching(watch_pid: int, signum: int, frame: Any):
+    """SIGTERM で監視を終了（fork したワーカープロセスでは既定の動作で終了）"""
+    if os.getpid() == watch_pid:
+        raise KeyboardInterrupt
+    signal.signal(signum, signal.SIG_DFL)
+    os.kill(os.getpid(), signum)
+
+
+def watch_loop(
+    watcher: DirectoryWatcher,
+    rebuild: Callable[[List[Path]], Any],
+    poll_interval: float = 2.0,
+    max_backoff: float = 60.0,
+):
+    """
+    watcher を poll_interval 秒ごとに確認し、変更があれば rebuild(ファイル一覧) を呼ぶ
+
+    rebuild が例外を送出した場合は警告を出して前回の出力を残し、
+    poll_interval の 2, 4, 8... 倍（最大 max_backoff 秒）待ってから再試行する。
+    Ctrl-C（KeyboardInterrupt）または SIGTERM で終了する。
+    """
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, functools.partial(_stop_watching, os.getpid()))
+    failures = 0
+    print(f"Watching {watcher.input_dir} ({watcher.file_pattern}, poll every {poll_interval:g}s, "
+          f"settle {watcher.settle:g}s). Press Ctrl-C to stop.", flush=True)
+    try:
+        while True:
+            snapshot = watcher.poll()
+            if snapshot is not None:
+                added, modified, removed = describe_changes(watcher.published, snapshot)
+                print(f"\n[{time.strftime('%Y-%m-%d %H:%M:%S')}] Change detected: "
+                      f"{len(added)} added, {len(modified)} modified, {len(removed)} removed", flush=True)
+                started = time.perf_counter()
+                try:
+                    rebuild(sorted(snapshot))
+                except Exception as e:
+                    failures += 1
+                    print(f"Warning: 統合出力の更新に失敗しました（前回の出力を保持します）: "
+                          f"{type(e).__name__}: {e}", flush=True)
+                else:
+                    failures = 0
+                    watcher.mark_published(snapshot)
+                    print(f"Published in {time.perf_counter() - started:.1f}s. Waiting for changes...", flush=True)
+            delay = poll_interval if not failures else min(poll_interval * 2 ** failures, max_backoff)
+            time.sleep(delay)
+    except KeyboardInterrupt:
+        print("\nStopped watching.", flush=True)
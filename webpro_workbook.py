@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WEBPROワークブック読み込みセッション
+
+1つのWEBPROファイルを1回だけ開き、必要なシートだけを解析して
+各抽出処理へ共有する。シートごとに pd.read_excel(path, ...) を呼ぶと
+そのたびにzip展開・共有文字列テーブルの解析が走るため、これを避ける。
+解析は軽量 xlsx リーダー（webpro_xlsx.py）で行い、書式・入力規則は読まない。
+
+使用例:
+    with WorkbookSession(xlsx_path) as wb:
+        if wb.has_sheet('1) 室仕様'):
+            values = wb.read_columns('1) 室仕様', first_row=9, columns=[0, 1, 2])
+            df = wb.get_sheet('0) 基本情報')
+"""
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from webpro_xlsx import DEFAULT_MAX_EMPTY_ROWS, XlsxReader
+
+
+class WorkbookSession:
+    """1ファイル分のワークブックハンドルと解析済みシートを保持する"""
+
+    def __init__(self, xlsx_path: Union[str, Path]):
+        self.path = Path(xlsx_path)
+        self._reader = XlsxReader(xlsx_path)
+        self._sheets: Dict[Tuple[str, Optional[int]], pd.DataFrame] = {}
+
+    @property
+    def sheet_names(self) -> List[str]:
+        """ワークブック内のシート名一覧"""
+        return self._reader.sheet_names
+
+    def has_sheet(self, sheet_name: str) -> bool:
+        return self._reader.has_sheet(sheet_name)
+
+    def get_sheet(self, sheet_name: str, max_col: Optional[int] = None) -> pd.DataFrame:
+        """
+        シートを header=None 相当の DataFrame で取得（初回のみ解析し、以降は解析済みを返す）
+
+        max_col を指定すると先頭 max_col 列だけを読む。
+        シートが存在しない場合は KeyError
+        """
+        key = (sheet_name, max_col)
+        if key not in self._sheets:
+            if not self.has_sheet(sheet_name):
+                raise KeyError(f"シートが存在しません: {sheet_name}")
+            df = pd.DataFrame(self._reader.read_sheet(sheet_name, max_col))
+            # 空セルは pd.read_excel と同じく NaN（object 列でも None にしない）
+            self._sheets[key] = df.mask(df.isna(), np.nan)
+        return self._sheets[key]
+
+    def read_rows(
+        self, sheet_name: str, max_col: Optional[int] = None, max_row: Optional[int] = None
+    ) -> List[List[Any]]:
+        """
+        シート（max_col・max_row 指定時は先頭 max_col 列・max_row 行）を行のリストで取得（空セルは None）
+
+        DataFrame を作らず、解析結果も保持しない（小さなフォームのシートを読む場合）。
+        シートが存在しない場合は KeyError
+        """
+        return self._reader.read_sheet(sheet_name, max_col, max_row)
+
+    def read_columns(
+        self,
+        sheet_name: str,
+        first_row: int,
+        columns: Sequence[int],
+        max_empty_rows: Optional[int] = DEFAULT_MAX_EMPTY_ROWS,
+    ) -> np.ndarray:
+        """
+        first_row 以降の指定列だけを (行数, 列数) の object 配列で取得（空セルは None）
+
+        対象列が空の行が max_empty_rows 行続いたところで読み込みを打ち切る。
+        シートが存在しない場合は KeyError
+        """
+        return self._reader.read_columns(sheet_name, first_row, columns, max_empty_rows)
+
+    def read_columns_after_header(
+        self,
+        sheet_name: str,
+        header_rows: int,
+        resolve: Callable[[List[List[Any]]], Tuple[int, Sequence[int]]],
+        max_empty_rows: Optional[int] = DEFAULT_MAX_EMPTY_ROWS,
+    ) -> np.ndarray:
+        """
+        先頭 header_rows 行（見出し部分）を resolve に渡し、返された (first_row, columns) の範囲を
+        read_columns と同じ形で取得（シートの解析は1回、テンプレート改訂の判定用）
+
+        シートが存在しない場合は KeyError
+        """
+        return self._reader.read_columns_after_header(sheet_name, header_rows, resolve, max_empty_rows)
+
+    def close(self):
+        self._sheets.clear()
+        self._reader.close()
+
+    def __enter__(self) -> 'WorkbookSession':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
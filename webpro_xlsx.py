@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WEBPRO入力シート用の軽量 xlsx リーダー
+
+xlsx（zip 内の XML）をシートごとにストリーミング解析し、必要な列・行範囲の
+セルの値だけを取り出す。openpyxl / pd.read_excel と違い、書式（styles.xml）・
+入力規則・セルのオブジェクトは一切作らない。WEBPRO入力シートには選択肢リストや
+建材カタログ（例: 2-2) 外壁構成 の約1,000行）が埋め込まれているため、
+SHEET_CONFIG の対象列・開始行に絞り、空行が続いたところで読み込みを打ち切る。
+
+- 値は共有文字列・インライン文字列・数値（整数値は int）・真偽値のみ解釈する
+- styles.xml からは表示形式（numFmtId）が日付・時刻のセル書式の番号だけを読み、
+  そのセルの数値は pd.read_excel（openpyxl）と同じく datetime（1未満は time）に変換する
+- エラー値（#N/A など）は None
+
+使用例:
+    with XlsxReader(xlsx_path) as reader:
+        values = reader.read_columns('1) 室仕様', first_row=9, columns=[0, 1, 2], max_empty_rows=100)
+"""
+
+import datetime
+import itertools
+import posixpath
+import re
+import zipfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+from xml.etree import ElementTree as ET
+
+import numpy as np
+
+# 既定の打ち切り条件（対象列が空の行がこれだけ続いたら以降は読まない）
+DEFAULT_MAX_EMPTY_ROWS = 100
+
+_PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+# 組み込みの表示形式のうち日付・時刻のもの（14〜22、45〜47 と日本語ロケールの 27〜36、50〜58）
+BUILTIN_DATE_FORMAT_IDS = frozenset([*range(14, 23), *range(27, 37), *range(45, 48), *range(50, 59)])
+
+# ユーザー定義の表示形式から除く部分（"文字列"、[$-411] などの指定。[h] [mm] [ss] は残す）
+# e・g は和暦（例: ggge"年"m"月"d"日"）
+_FORMAT_STRIP_RE = re.compile(r'".*?"|\[(?!hh?\]|mm?\]|ss?\])[^\]]*\]')
+_DATE_TOKEN_RE = re.compile(r'(?<![_\\])[dmhysDMHYSeg]')
+
+_EPOCH_1900 = datetime.datetime(1899, 12, 30)
+_EPOCH_1904 = datetime.datetime(1904, 1, 1)
+
+
+def column_index(ref: str) -> int:
+    """セル参照（例: 'AB12'）の列番号（0始まり）"""
+    index = 0
+    for ch in ref:
+        if 'A' <= ch <= 'Z':
+            index = index * 26 + (ord(ch) - 64)
+        else:
+            break
+    return index - 1
+
+
+def _cast_number(text: str) -> Union[int, float]:
+    """数値セルの値（pd.read_excel と同じく整数値は int）"""
+    if '.' in text or 'E' in text or 'e' in text:
+        value = float(text)
+        return int(value) if value.is_integer() else value
+    return int(text)
+
+
+def is_date_format(format_code: Optional[str]) -> bool:
+    """ユーザー定義の表示形式が日付・時刻か（正の数の部分に年月日・時分秒の指定があるか）"""
+    if not format_code:
+        return False
+    code = _FORMAT_STRIP_RE.sub('', format_code.split(';')[0])
+    if code.lower() in ('general', 'g/標準'):
+        return False
+    return _DATE_TOKEN_RE.search(code) is not None
+
+
+def excel_datetime(serial: float, date1904: bool = False) -> Union[datetime.datetime, datetime.time]:
+    """
+    Excel のシリアル値を datetime に変換（openpyxl と同じ規則）
+
+    1未満は時刻のみ（time）。1900年基準では 1900-03-01 より前の値に 1900-02-29 の
+    欠番の補正をかける。時刻はミリ秒に丸める。
+    """
+    day, fraction = divmod(serial, 1)
+    diff = datetime.timedelta(milliseconds=round(fraction * 86400000))
+    if 0 <= serial < 1 and diff.days == 0:
+        return (datetime.datetime.min + diff).time()
+    if date1904:
+        return _EPOCH_1904 + datetime.timedelta(days=day) + diff
+    if 0 < serial < 60:
+        day += 1
+    return _EPOCH_1900 + datetime.timedelta(days=day) + diff
+
+
+def _namespace(tag: str) -> str:
+    return tag[:tag.index('}') + 1] if tag.startswith('{') else ''
+
+
+def _string_item_text(elem: ET.Element, ns: str) -> str:
+    """文字列要素（si / is）のテキスト（書式付きの run は連結、ふりがな（rPh）は除く）"""
+    parts = [elem.findtext(f'{ns}t') or '']
+    parts.extend(run.findtext(f'{ns}t') or '' for run in elem.iterfind(f'{ns}r'))
+    return ''.join(parts)
+
+
+def _limit_empty_rows(
+    rows: Iterable[Tuple[int, Dict[int, Any]]],
+    first_row: int,
+    max_empty_rows: Optional[int],
+) -> Iterator[Tuple[int, Dict[int, Any]]]:
+    """値のある行だけを返し、空行が max_empty_rows 行続いた時点で打ち切る"""
+    last_row = first_row - 1
+    for row_idx, values in rows:
+        if values:
+            if max_empty_rows is not None and row_idx - last_row - 1 >= max_empty_rows:
+                return
+            last_row = row_idx
+            yield row_idx, values
+        elif max_empty_rows is not None and row_idx - last_row >= max_empty_rows:
+            return
+
+
+def _rows_to_array(rows: List[Tuple[int, Dict[int, Any]]], first_row: int, columns: List[int]) -> np.ndarray:
+    """(行番号, 列番号 → 値) の一覧を first_row からの (行数, len(columns)) の object 配列にする"""
+    positions = {col_idx: pos for pos, col_idx in enumerate(columns)}
+    n_rows = rows[-1][0] - first_row + 1 if rows else 0
+    values = np.full((n_rows, len(columns)), None, dtype=object)
+    for row_idx, cells in rows:
+        out = values[row_idx - first_row]
+        for col_idx, value in cells.items():
+            out[positions[col_idx]] = value
+    return values
+
+
+def _rows_to_lists(rows: List[Tuple[int, Dict[int, Any]]], n_cols: Optional[int] = None) -> List[List[Any]]:
+    """(行番号, 列番号 → 値) の一覧を先頭行からの行のリストにする（空セルは None）"""
+    n_rows = rows[-1][0] + 1 if rows else 0
+    if n_cols is None:
+        n_cols = max((max(cells) + 1 for _, cells in rows), default=0)
+    data = [[None] * n_cols for _ in range(n_rows)]
+    for row_idx, cells in rows:
+        out = data[row_idx]
+        for col_idx, value in cells.items():
+            out[col_idx] = value
+    return data
+
+
+class XlsxReader:
+    """1つの xlsx ファイルを開き、シートの値をストリーミングで読み出す"""
+
+    def __init__(self, xlsx_path: Union[str, Path]):
+        self.path = Path(xlsx_path)
+        self._zip = zipfile.ZipFile(self.path)
+        self._sheet_paths, self._shared_strings_path, self._styles_path, self._date1904 = self._read_workbook()
+        self._shared_strings: Optional[List[str]] = None
+        self._date_styles: Optional[Set[str]] = None
+
+    # ------------------------------------------------------------------
+    # ワークブック構造
+    # ------------------------------------------------------------------
+
+    def _read_rels(self, part: str) -> Dict[str, Tuple[str, str]]:
+        """パーツのリレーション（Id → (Type, 絶対パス)）"""
+        rels_path = posixpath.join(posixpath.dirname(part), '_rels', posixpath.basename(part) + '.rels')
+        try:
+            root = ET.fromstring(self._zip.read(rels_path))
+        except KeyError:
+            return {}
+        base = posixpath.dirname(part)
+        rels = {}
+        for rel in root.iter(f'{{{_PKG_REL_NS}}}Relationship'):
+            target = rel.get('Target', '')
+            if target.startswith('/'):
+                path = target.lstrip('/')
+            else:
+                path = posixpath.normpath(posixpath.join(base, target))
+            rels[rel.get('Id')] = (rel.get('Type', ''), path)
+        return rels
+
+    def _read_workbook(self) -> Tuple[Dict[str, str], Optional[str], Optional[str], bool]:
+        """シート名 → シート XML のパス、共有文字列のパス、スタイルのパス、1904年基準か"""
+        workbook_part = 'xl/workbook.xml'
+        for rel_type, path in self._read_rels('').values():
+            if rel_type.endswith('/officeDocument'):
+                workbook_part = path
+                break
+
+        root = ET.fromstring(self._zip.read(workbook_part))
+        ns = _namespace(root.tag)
+        rels = self._read_rels(workbook_part)
+
+        sheet_paths = {}
+        for sheet in root.iter(f'{ns}sheet'):
+            rel_id = next((value for key, value in sheet.attrib.items() if key.endswith('}id')), None)
+            if rel_id in rels:
+                sheet_paths[sheet.get('name')] = rels[rel_id][1]
+
+        shared_strings = next(
+            (path for rel_type, path in rels.values() if rel_type.endswith('/sharedStrings')), None
+        )
+        styles = next((path for rel_type, path in rels.values() if rel_type.endswith('/styles')), None)
+        workbook_pr = root.find(f'{ns}workbookPr')
+        date1904 = workbook_pr is not None and workbook_pr.get('date1904', '').lower() in ('1', 'true')
+        return sheet_paths, shared_strings, styles, date1904
+
+    @property
+    def sheet_names(self) -> List[str]:
+        """ワークブック内のシート名一覧"""
+        return list(self._sheet_paths)
+
+    def has_sheet(self, sheet_name: str) -> bool:
+        return sheet_name in self._sheet_paths
+
+    def _get_shared_strings(self) -> List[str]:
+        """共有文字列テーブル（初回のみ解析、ふりがな（rPh）は除く）"""
+        if self._shared_strings is None:
+            strings = []
+            if self._shared_strings_path is not None and self._shared_strings_path in self._zip.namelist():
+                with self._zip.open(self._shared_strings_path) as f:
+                    ns = None
+                    for _, elem in ET.iterparse(f):
+                        if ns is None:
+                            ns = _namespace(elem.tag)
+                        if elem.tag == f'{ns}si':
+                            strings.append(_string_item_text(elem, ns))
+                            elem.clear()
+            self._shared_strings = strings
+        return self._shared_strings
+
+    def _get_date_styles(self) -> Set[str]:
+        """表示形式が日付・時刻のセル書式（cellXfs の番号、セルの s 属性の文字列）（初回のみ解析）"""
+        if self._date_styles is None:
+            date_styles: Set[str] = set()
+            if self._styles_path is not None and self._styles_path in self._zip.namelist():
+                root = ET.fromstring(self._zip.read(self._styles_path))
+                ns = _namespace(root.tag)
+                date_formats = set(BUILTIN_DATE_FORMAT_IDS)
+                num_fmts = root.find(f'{ns}numFmts')
+                if num_fmts is not None:
+                    for fmt in num_fmts.iterfind(f'{ns}numFmt'):
+                        fmt_id = int(fmt.get('numFmtId', -1))
+                        if is_date_format(fmt.get('formatCode')):
+                            date_formats.add(fmt_id)
+                        else:
+                            date_formats.discard(fmt_id)
+                cell_xfs = root.find(f'{ns}cellXfs')
+                if cell_xfs is not None:
+                    for index, xf in enumerate(cell_xfs.iterfind(f'{ns}xf')):
+                        if int(xf.get('numFmtId', 0)) in date_formats:
+                            date_styles.add(str(index))
+            self._date_styles = date_styles
+        return self._date_styles
+
+    # ------------------------------------------------------------------
+    # セルの読み出し
+    # ------------------------------------------------------------------
+
+    def _row_elements(self, sheet_name: str) -> Iterator[Tuple[int, ET.Element, Tuple[str, str, str, str]]]:
+        """
+        シートの行要素を (行番号（0始まり）, 行要素, タグ) として行順に返す
+
+        処理済みの行要素は次の行へ進む時点で clear() して子要素（セル）を解放する。
+        """
+        if sheet_name not in self._sheet_paths:
+            raise KeyError(f"シートが存在しません: {sheet_name}")
+
+        with self._zip.open(self._sheet_paths[sheet_name]) as f:
+            row_tag = tags = None
+            next_row = 0
+
+            # 'end' イベントのみ（'start' も受けると解析時間が約1.4倍になる）
+            for _, elem in ET.iterparse(f):
+                if row_tag is None:
+                    if elem.tag.rsplit('}', 1)[-1] != 'row':
+                        continue
+                    ns = _namespace(elem.tag)
+                    row_tag = f'{ns}row'
+                    tags = (ns, f'{ns}c', f'{ns}v', f'{ns}is')
+                if elem.tag != row_tag:
+                    continue
+                r = elem.get('r')
+                row_idx = int(r) - 1 if r is not None else next_row
+                next_row = row_idx + 1
+                yield row_idx, elem, tags
+                elem.clear()
+
+    def _row_values(
+        self,
+        elem: ET.Element,
+        tags: Tuple[str, str, str, str],
+        wanted: Optional[Set[int]],
+        col_cache: Dict[str, int],
+    ) -> Dict[int, Any]:
+        """行要素の 列番号 → 値（値のあるセルのみ、wanted 以外の列は解釈しない）"""
+        ns, cell_tag, value_tag, inline_tag = tags
+        date_styles = self._get_date_styles()
+        values = {}
+        next_col = 0
+        for cell in elem.iterfind(cell_tag):
+            ref = cell.get('r')
+            if ref is not None:
+                letters = ref.rstrip('0123456789')
+                col_idx = col_cache.get(letters)
+                if col_idx is None:
+                    col_idx = col_cache[letters] = column_index(letters)
+            else:
+                col_idx = next_col
+            next_col = col_idx + 1
+            if wanted is not None and col_idx not in wanted:
+                continue
+
+            cell_type = cell.get('t', 'n')
+            if cell_type == 'inlineStr':
+                inline = cell.find(inline_tag)
+                value = None if inline is None else _string_item_text(inline, ns)
+            else:
+                text = cell.findtext(value_tag)
+                if text is None:
+                    continue
+                if cell_type == 's':
+                    value = self._get_shared_strings()[int(text)]
+                elif cell_type == 'n':
+                    if date_styles and cell.get('s') in date_styles:
+                        value = excel_datetime(float(text), self._date1904)
+                    else:
+                        value = _cast_number(text)
+                elif cell_type == 'b':
+                    value = text == '1'
+                elif cell_type == 'e':
+                    value = None
+                else:  # str（数式の文字列結果）・d（ISO 日付文字列）
+                    value = text
+            if value is not None:
+                values[col_idx] = value
+        return values
+
+    def iter_rows(
+        self,
+        sheet_name: str,
+        first_row: int = 0,
+        columns: Optional[Sequence[int]] = None,
+        max_empty_rows: Optional[int] = None,
+        max_row: Optional[int] = None,
+    ) -> Iterator[Tuple[int, Dict[int, Any]]]:
+        """
+        (行番号（0始まり）, 列番号 → 値) を行順に返す（値のあるセルのみ）
+
+        - first_row より前の行・columns に含まれない列のセルは値を解釈しない
+        - max_empty_rows を指定すると、値のある行の後に空行（行要素がない行を含む）が
+          その数だけ続いた時点で打ち切る
+        - max_row を指定すると、行番号 max_row 以降は読まない（先頭の見出し行だけを読む場合）
+        """
+        wanted = None if columns is None else set(columns)
+        col_cache: Dict[str, int] = {}
+
+        def rows():
+            for row_idx, elem, tags in self._row_elements(sheet_name):
+                if max_row is not None and row_idx >= max_row:
+                    return
+                if row_idx >= first_row:
+                    yield row_idx, self._row_values(elem, tags, wanted, col_cache)
+
+        return _limit_empty_rows(rows(), first_row, max_empty_rows)
+
+    def read_columns(
+        self,
+        sheet_name: str,
+        first_row: int,
+        columns: Sequence[int],
+        max_empty_rows: Optional[int] = DEFAULT_MAX_EMPTY_ROWS,
+    ) -> np.ndarray:
+        """
+        first_row 以降の columns の値を (行数, 列数) の object 配列で返す
+
+        空セルは None。配列は値のある最後の行までで、途中の空行も含む
+        （行番号は first_row からの相対位置）。
+        """
+        columns = list(columns)
+        return _rows_to_array(list(self.iter_rows(sheet_name, first_row, columns, max_empty_rows)), first_row, columns)
+
+    def read_columns_after_header(
+        self,
+        sheet_name: str,
+        header_rows: int,
+        resolve: Callable[[List[List[Any]]], Tuple[int, Sequence[int]]],
+        max_empty_rows: Optional[int] = DEFAULT_MAX_EMPTY_ROWS,
+    ) -> np.ndarray:
+        """
+        先頭 header_rows 行（見出し部分）を全列で読み、resolve(見出し行のリスト) が返す
+        (first_row, columns) の範囲を read_columns と同じ形で返す
+
+        見出しからの読み込み範囲の判定とデータの読み込みを、シートの1回の解析で行う。
+        """
+        col_cache: Dict[str, int] = {}
+        elements = self._row_elements(sheet_name)
+        header: List[Tuple[int, Dict[int, Any]]] = []
+        pending = None
+        for row_idx, elem, tags in elements:
+            if row_idx >= header_rows:
+                pending = (row_idx, elem, tags)
+                break
+            values = self._row_values(elem, tags, None, col_cache)
+            if values:
+                header.append((row_idx, values))
+
+        first_row, columns = resolve(_rows_to_lists(header))
+        columns = list(columns)
+        wanted = set(columns)
+
+        def rows():
+            for row_idx, values in header:
+                if row_idx >= first_row:
+                    yield row_idx, {col_idx: value for col_idx, value in values.items() if col_idx in wanted}
+            if pending is not None:
+                for row_idx, elem, tags in itertools.chain([pending], elements):
+                    if row_idx >= first_row:
+                        yield row_idx, self._row_values(elem, tags, wanted, col_cache)
+
+        return _rows_to_array(list(_limit_empty_rows(rows(), first_row, max_empty_rows)), first_row, columns)
+
+    def read_sheet(
+        self, sheet_name: str, max_col: Optional[int] = None, max_row: Optional[int] = None
+    ) -> List[List[Any]]:
+        """
+        シート全体（max_col・max_row 指定時は先頭 max_col 列・max_row 行）を行のリストで返す
+
+        空セルは None。行数は値のある最後の行まで。
+        """
+        columns = None if max_col is None else range(max_col)
+        return _rows_to_lists(list(self.iter_rows(sheet_name, 0, columns, max_row=max_row)), max_col)
+
+    def close(self):
+        self._zip.close()
+
+    def __enter__(self) -> 'XlsxReader':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()